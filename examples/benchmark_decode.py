@@ -0,0 +1,66 @@
+"""Benchmark trusted decoding (``API(token, trusted_decode=True)``) against full pydantic validation.
+
+Runs offline on synthetic Raindrops (no token needed), eg. "python examples/benchmark_decode.py 20000", and reports
+the time taken to build the models both ways, with the garbage collector enabled (the default) and disabled.
+"""
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from raindropiopy import Raindrop
+from raindropiopy.decode import decode
+
+ITEM = {
+    "_id": 2000,
+    "collection": {"$db": "", "$id": -1, "$ref": "collections"},
+    "cover": "",
+    "created": "2020-01-01T00:00:00.000Z",
+    "creatorRef": 3000,
+    "domain": "www.example.com",
+    "excerpt": "excerpt text",
+    "important": False,
+    "lastUpdate": "2020-01-01T01:01:01Z",
+    "link": "https://www.example.com/",
+    "media": [],
+    "pleaseParse": {"weight": 1},
+    "sort": 3333333,
+    "tags": ["abc", "def"],
+    "title": "title",
+    "type": "link",
+    "user": {"$id": 3000, "$user": "users"},
+}
+
+
+def _best_of(repeat, build, items):
+    """Return the shortest time (in seconds) taken to build all the items over a number of runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        built = [build(item) for item in items]
+        best = min(best, time.perf_counter() - started)
+        del built
+        gc.collect()
+    return best
+
+
+def main(count=20_000, repeat=3):
+    """Print the time taken by full validation and trusted decoding of a number of Raindrops."""
+    items = [ITEM | {"_id": index, "link": f"https://www.example.com/{index}"} for index in range(count)]
+    decode(Raindrop, items[0])  # ie. compile the decoder outside of the timings.
+    print(f"{count} Raindrops, best of {repeat}:")
+    for label, enabled in (("gc enabled", True), ("gc disabled", False)):
+        if not enabled:
+            gc.disable()
+        try:
+            full = _best_of(repeat, lambda item: Raindrop(**item), items)
+            trusted = _best_of(repeat, lambda item: decode(Raindrop, item), items)
+        finally:
+            gc.enable()
+        print(f"  {label:11s}  full {full:6.3f}s  trusted {trusted:6.3f}s  speedup {full / trusted:4.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -5,16 +5,37 @@ __all__ = (
     "API",
     "Access",
     "AccessLevel",
+    "AsyncAPI",
     "BrokenLevel",
+    "BulkCreateResult",
+    "BulkFailure",
+    "BulkUploadResult",
+    "ChangeEvent",
     "Collection",
     "CollectionRef",
+    "CollectionTree",
     "FontColor",
     "Group",
+    "LazyRaindrop",
+    "MetricsRegistry",
+    "Mirror",
+    "MultipartUpload",
+    "Query",
     "Raindrop",
+    "RaindropFrame",
     "RaindropSort",
     "RaindropType",
+    "RateLimitBudget",
+    "RateLimiter",
+    "RequestMetric",
+    "ResponseCache",
+    "RetryPolicy",
+    "SearchIndex",
+    "SyncResult",
     "SystemCollection",
     "Tag",
+    "UploadManifest",
+    "UploadProgress",
     "User",
     "UserConfig",
     "UserFiles",
@@ -23,15 +44,27 @@ __all__ = (
     "version",
 )
 
-from .api import API
+from .api import API, AsyncAPI, ChangeEvent, RateLimitBudget, RateLimiter, RetryPolicy
+from .cache import ResponseCache
+from .frame import RaindropFrame
+from .index import SearchIndex
+from .metrics import MetricsRegistry, RequestMetric
+from .mirror import Mirror, SyncResult
+from .query import Query
+from .upload import MultipartUpload, UploadManifest, UploadProgress
 from .models import (
     Access,
     AccessLevel,
     BrokenLevel,
+    BulkCreateResult,
+    BulkFailure,
+    BulkUploadResult,
     Collection,
     CollectionRef,
+    CollectionTree,
     FontColor,
     Group,
+    LazyRaindrop,
     Raindrop,
     RaindropSort,
     RaindropType,
@@ -3,110 +3,448 @@
 Except for instantiating, methods in this class are **not** intended for direct use, they serve as the underlying HTTPS
 abstraction layer for calls available for the Core Classes, ie. Collection, Raindrop etc.
 """
+import asyncio
 import datetime
+import email.utils
 import enum
-import json
+import functools
+import itertools
+import logging
+import random
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Final, TypeVar
+from typing import Any, Final, NamedTuple, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
 
+from .cache import ResponseCache, _key
+from .codec import JSONCodec, get_codec
+from .metrics import RequestMetric, T_RequestHook, _body_size, _content_size, endpoint_template
+from .upload import MultipartUpload
+
+try:  # Only required for AsyncAPI, ie. "pip install raindrop-io-py[async]"
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
 # Support for generic oauth2 authentication *on behalf of another user*
 # (ie. instead of using Raindrop.IO's TEST_TOKEN)
 URL_AUTHORIZE: Final = "https://raindrop.io/oauth/authorize"
 URL_ACCESS_TOKEN: Final = "https://raindrop.io/oauth/access_token"
 URL_REFRESH: Final = "https://raindrop.io/oauth/access_token"
 
+# oAuth tokens are refreshed this many seconds before they expire (ie. such that none expires while being sent).
+REFRESH_MARGIN: Final = 60
+
+logger = logging.getLogger(__name__)
+
 # In py3.11, we'll be able to do 'from typing import Self' instead
 T_API = TypeVar("API")
+T_AsyncAPI = TypeVar("AsyncAPI")
 
 
-class API:
-    """Provides communication to the Raindrop.io API server.
+class ChangeEvent(enum.Enum):
+    """Kinds of change made to Raindrops through the model methods, as passed to listeners (see ``API.subscribe``).
+
+    Attributes:
+        saved: Raindrops were created or updated, the payload is the list of Raindrops returned by Raindrop.
+        deleted: Raindrops were deleted (or moved to the Trash), the payload is the list of their ids.
+        stale: Raindrops were changed in bulk without Raindrop returning them, the payload is the list of their ids
+            or None if unknown (ie. all those in a collection or matching a search may have changed).
+    """
+
+    saved = "saved"
+    deleted = "deleted"
+    stale = "stale"
+
+
+T_Listener = Callable[[ChangeEvent, Any], None]
+
+
+class RateLimitBudget(NamedTuple):
+    """Snapshot of the request budget currently available from Raindrop (see ``RateLimiter.budget``).
+
+    Attributes:
+        limit: Maximum number of requests allowed per window (from X-RateLimit-Limit), if known.
+        remaining: Number of requests remaining in the current window (from X-RateLimit-Remaining), if known.
+        reset: When the current window resets, in UTC epoch seconds (from X-RateLimit-Reset), if known.
+        tokens: Number of requests that could be sent *right now* without pacing.
+        rate: Requests per second we're currently pacing to (None if no rate limit is known yet).
+    """
+
+    limit: int | None
+    remaining: int | None
+    reset: int | None
+    tokens: float
+    rate: float | None
+
+
+class RateLimiter:
+    """Token-bucket scheduler that paces requests based on the X-RateLimit-* headers returned by Raindrop.
+
+    Rather than sending requests as fast as possible until Raindrop's budget is exhausted (and then stalling until
+    the window resets, or worse, failing with a 429), the bucket is refilled at the rate that spreads the requests
+    *remaining* evenly over the time *remaining* in the current window. Only a small burst is allowed on top.
+
+    Until the first response carrying rate-limit headers has been seen, requests are not paced at all.
 
     Parameters:
-        token: Either a string representing a valid RaindropIO Token.
-            This is either a TEST_TOKEN or a CLIENT token for use in OAuth in
-            which case the client_id and client_secret must also be provided.
+        window: Length of Raindrop's rate-limit window in seconds, used when the reset time isn't known (or has passed).
 
-        token_type: Token type to be used on behalf of an oAuth connection.
+        burst: Maximum number of requests that can be sent back-to-back without pacing.
+    """
 
-    Examples:
-        Can either be used directly as a context manager:
+    def __init__(self, window: float = 60.0, burst: int = 5) -> None:
+        """Create a rate limiter with no knowledge of the server's limits yet."""
+        self.window = window
+        self.burst = burst
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset: int | None = None
+        self._rate: float | None = None  # Tokens per second, None -> no pacing.
+        self._tokens: float = float(burst)
+        self._last: float = time.monotonic()
+        self._not_before: float = 0.0  # Monotonic time before which the bucket can't refill (budget exhausted).
+        self._lock = threading.Lock()
 
-        >>> api = API(token="yourTestTokenFromRaindropIO"):
-        >>> collections = Collection.get_collections(api)
-        >>> # ...
+    def _capacity(self) -> float:
+        return float(min(self.burst, self.limit) if self.limit else self.burst)
 
-        or
+    def _refill(self, now: float) -> None:
+        start = max(self._last, self._not_before)
+        if self._rate and now > start:
+            self._tokens = min(self._capacity(), self._tokens + (now - start) * self._rate)
+        self._last = max(now, self._last)
 
-        >>> with API(token="yourTestTokenFromRaindropIO") as api:
-        >>>     user = User.get(api)
-        >>>     # ...
+    def update(self, limit: int | None, remaining: int | None, reset: int | None) -> None:
+        """Update our view of the server's budget from the rate-limit headers of a response."""
+        with self._lock:
+            now, epoch = time.monotonic(), time.time()
+            self._refill(now)
+            if limit is not None:
+                self.limit = limit
+            if remaining is not None:
+                self.remaining = remaining
+            if reset is not None:
+                self.reset = reset
+            if self.remaining is not None and self.remaining > 0:
+                self._not_before = 0.0  # ie. budget left after all, any earlier deadline no longer applies.
+
+            if self.reset is not None and self.remaining is not None and self.reset > epoch:
+                if self.remaining > 0:
+                    # Spread what's left of our budget evenly over what's left of the window.
+                    self._rate = self.remaining / (self.reset - epoch)
+                else:
+                    # Nothing left, nothing can be sent until the window resets (then pace at the nominal rate).
+                    self._not_before = now + (self.reset - epoch)
+                    self._rate = (self.limit or 1) / self.window
+                self._tokens = min(self._tokens, float(self.remaining))
+            elif self.limit:
+                self._rate = self.limit / self.window
+
+    def reserve(self) -> float:
+        """Reserve the right to send one request, returning the number of seconds to wait before sending it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._rate is None:
+                return 0.0
+            start = max(now, self._not_before)
+            wait = start - now
+            if self._tokens < 1.0:
+                wait += (1.0 - self._tokens) / self._rate
+            self._tokens -= 1.0  # Might go negative, ie. subsequent callers queue up behind this one.
+            return wait
+
+    def acquire(self) -> float:
+        """Block until a request may be sent (see ``reserve``), returning the number of seconds waited."""
+        if (wait := self.reserve()) > 0:
+            time.sleep(wait)
+        return wait
+
+    @property
+    def budget(self) -> RateLimitBudget:
+        """Return a snapshot of our current view of Raindrop's rate-limit budget."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return RateLimitBudget(self.limit, self.remaining, self.reset, max(self._tokens, 0.0), self._rate)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Policy for automatically retrying requests that failed for (hopefully) transient reasons.
+
+    - Responses with a 429 (Too Many Requests) are retried for **any** HTTP verb as Raindrop didn't process the
+      request. We wait as long as Raindrop asks us to (from Retry-After or X-RateLimit-Reset) before retrying.
+
+    - Responses with any of the 5xx ``statuses`` below and connection errors are only retried for **idempotent**
+      requests, ie. those that can be safely sent more than once.
+
+    Otherwise, the delay between attempts is a "full-jitter" exponential backoff, ie. a random amount of time between
+    0 and ``backoff_base * 2**attempt`` (capped at ``backoff_max``).
+
+    Attributes:
+        max_attempts: Maximum number of attempts for a single request (including the first one).
+        backoff_base: Base delay (in seconds) of the exponential backoff.
+        backoff_max: Maximum delay (in seconds) between any two attempts.
+        max_elapsed: Maximum total time (in seconds) to spend on a request, we won't retry if a retry would exceed it.
+        statuses: The server error HTTP status codes that are considered transient.
+        idempotent_methods: The HTTP verbs that are safe to retry after a server or connection error.
     """
 
+    max_attempts: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_elapsed: float = 120.0
+    statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset({"GET", "PUT", "DELETE"})
+
+    def backoff(self, attempt: int) -> float:
+        """Return a jittered, exponential backoff delay for the attempt number provided (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def _server_delay(self, headers: Any) -> float | None:
+        """Return how long Raindrop asked us to wait (if at all) based on the headers of a 429 response."""
+        if (value := headers.get("Retry-After")) is not None:
+            try:
+                return max(float(value), 0.0)
+            except ValueError:
+                try:
+                    return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+                except (TypeError, ValueError):
+                    pass
+        if (value := headers.get("X-RateLimit-Reset")) is not None:
+            try:
+                return max(float(value) - time.time(), 0.0)
+            except ValueError:
+                pass
+        return None
+
+    def delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        status: int | None = None,
+        headers: Any = None,
+        idempotent: bool | None = None,
+    ) -> float | None:
+        """Return how long to wait before retrying a failed attempt or None if we shouldn't retry it at all.
+
+        Args:
+            method: The HTTP verb of the request.
+
+            attempt: The (0-based) number of the attempt that just failed.
+
+            elapsed: Seconds spent on the request so far.
+
+            status: HTTP status code of the response (None if we didn't get a response, ie. a connection error).
+
+            headers: Headers of the response (if any).
+
+            idempotent: Override whether the request is safe to repeat (otherwise, determined by the HTTP verb).
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if idempotent is None:
+            idempotent = method.upper() in self.idempotent_methods
+
+        if status == 429:
+            server_delay = self._server_delay(headers or {})
+            if server_delay is None:
+                delay = self.backoff(attempt)
+            else:
+                delay = server_delay + random.uniform(0, self.backoff_base)  # Jitter to avoid a thundering herd.
+        elif idempotent and (status is None or status in self.statuses):
+            delay = self.backoff(attempt)
+        else:
+            return None
+
+        if elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+
+# Retry policy used unless told otherwise (policies are frozen, thus safe to share between API instances).
+DEFAULT_RETRY: Final = RetryPolicy()
+
+
+def _rewind_files(files: dict | None) -> None:
+    """Rewind any file handles about to be sent (again) in a multipart upload, ie. on a retry."""
+    for value in (files or {}).values():
+        fh_ = value[1] if isinstance(value, tuple) else value
+        if hasattr(fh_, "seek"):
+            fh_.seek(0)
+
+
+class _SingleFlight:
+    """Coalesce identical calls made from several threads at the same time into a single one.
+
+    The first caller for a key makes the call, any others arriving while it's in flight wait for (and share) its
+    result, or its exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future] = {}
+
+    def do(self, key: str, call: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            if leader := future is None:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = call()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class _AsyncSingleFlight:
+    """Coalesce identical calls made from several tasks at the same time into a single one (see ``_SingleFlight``)."""
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        if (future := self._calls.get(key)) is not None:
+            return await asyncio.shield(future)  # ie. a waiter being cancelled mustn't cancel the call itself.
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # ie. retrieved, such that there's no warning if nobody else was waiting.
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+class _BaseAPI:
+    """Behaviour shared between our blocking (API) and asyncio-based (AsyncAPI) connections to Raindrop."""
+
     def __init__(
         self,
         token: str,
         client_id: str | None = None,
         client_secret: str | None = None,
         token_type: str = "Bearer",
+        pace_requests: bool = False,
+        retry: RetryPolicy | None = DEFAULT_RETRY,
+        trusted_decode: bool = False,
+        coalesce_requests: bool = False,
+        json_codec: str = "json",
     ) -> None:
-        """Instantiate an API connection to Raindrop using the token (and optional client information) provided."""
+        """Store the token (and optional client information) common to both connection types."""
         self.token = token
         self.client_id = client_id
         self.client_secret = client_secret
         self.token_type = token_type
-        self.session = None
 
-        # If rate limiting is in effect, set here (UNTESTED!)
+        # If rate limiting is in effect, set here (and tracked by our rate limiter). Requests are only
+        # actually paced if requested, otherwise the limiter's budget is merely available for inspection.
         self.ratelimit: int | None = None
         self.ratelimit_remaining: int | None = None
         self.ratelimit_reset: int | None = None
+        self.rate_limiter = RateLimiter()
+        self.pace_requests = pace_requests
+        self.retry = retry
+        self.trusted_decode = trusted_decode
+        self.coalesce_requests = coalesce_requests
+        self.codec = get_codec(json_codec)
+        self._listeners: list[T_Listener] = []
+        self._request_hooks: list[T_RequestHook] = []
+        self._lock = threading.Lock()  # Guards state shared between threads, ie. token and rate-limit parms.
 
-        self.open()
+    @property
+    def rate_limit_budget(self) -> RateLimitBudget:
+        """Return the request budget currently available from Raindrop (see ``RateLimiter.budget``)."""
+        return self.rate_limiter.budget
 
-    def _create_session(self) -> OAuth2Session:
-        """Handle the creation and/or authentication with oAuth handshake."""
-        extra: dict[str, Any] | None
-        if self.client_id and self.client_secret:
-            extra = {
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-            }
-        else:
-            extra = None
+    def subscribe(self, listener: T_Listener) -> None:
+        """Register a callable to be told of each change made to Raindrops through the model methods using this API.
 
-        def update_token(newtoken: str) -> None:
-            self.token = newtoken
+        The listener is called *after* each successful change as ``listener(event, payload)`` (see ``ChangeEvent``),
+        eg. to keep a local index or cache in step with Raindrop without having to query it again.
+        """
+        self._listeners.append(listener)
 
-        token = {"access_token": self.token} if isinstance(self.token, str) else self.token
+    def unsubscribe(self, listener: T_Listener) -> None:
+        """Stop telling a listener previously registered with ``subscribe`` of changes."""
+        self._listeners.remove(listener)
 
-        return OAuth2Session(
-            self.client_id,
-            token=token,
-            auto_refresh_kwargs=extra,
-            auto_refresh_url=URL_REFRESH,
-            token_updater=update_token,
-        )
+    def _notify(self, event: ChangeEvent, payload: Any) -> None:
+        """Tell all listeners of a change just made through the model methods."""
+        for listener in list(self._listeners):
+            try:
+                listener(event, payload)
+            except Exception:  # ie. the change *was* made, a broken listener mustn't make it look like it failed
+                logger.exception("Change listener %r failed", listener)
 
-    def open(self) -> None:
-        """Open a new connection to Raindrop.
+    def add_request_hook(self, hook: T_RequestHook) -> None:
+        """Register a callable to be told of each request made to Raindrop, eg. a ``metrics.MetricsRegistry``.
 
-        If there's an existing connection already, it'll be closed first.
+        The hook is called once each request completes (successfully or not, after any retries) as ``hook(metric)``
+        with a ``metrics.RequestMetric`` describing it: endpoint, status, latency, bytes moved, retries, etc.
         """
-        self.close()
-        self.session = self._create_session()
+        self._request_hooks.append(hook)
 
-    def close(self) -> None:
-        """Close an existing Raindrop connection.
+    def remove_request_hook(self, hook: T_RequestHook) -> None:
+        """Stop telling a hook previously registered with ``add_request_hook`` of requests."""
+        self._request_hooks.remove(hook)
 
-        Safe to call even if a new session hasn't been created yet.
-        """
-        if self.session:
-            self.session.close()
-            self.session = None
+    def _record(
+        self,
+        method: str,
+        url: str,
+        started: float,
+        attempt: int,
+        resp: Any,
+        kwargs: dict[str, Any],
+        error: BaseException | None = None,
+    ) -> None:
+        """Tell all request hooks (if any) of a request just completed."""
+        if not self._request_hooks:
+            return
+        status = getattr(resp, "status_code", None)
+        metric = RequestMetric(
+            method=method,
+            endpoint=endpoint_template(url),
+            status=status if isinstance(status, int) else None,
+            duration=time.monotonic() - started,
+            request_bytes=_body_size(kwargs.get("data", kwargs.get("content"))),
+            response_bytes=_content_size(resp),
+            retries=attempt,
+            error=None if error is None else type(error).__name__,
+            ratelimit_remaining=self.ratelimit_remaining,
+            ratelimit_limit=self.ratelimit,
+        )
+        for hook in list(self._request_hooks):
+            try:
+                hook(metric)
+            except Exception:  # ie. a broken hook mustn't fail (or mask the error of) the request itself
+                logger.exception("Request hook %r failed", hook)
 
     def _json_unknown(self, obj: Any) -> Any:
         if isinstance(obj, enum.Enum):
@@ -117,15 +455,39 @@ class API:
             f"Object of type {obj.__class__.__name__} is not JSON serializable",
         )
 
-    def _to_json(self, obj: Any) -> str | None:
-        """Handle JSON serialisation with a custom serialiser to handle enums and datetimes."""
+    def _to_json(self, obj: Any) -> str | bytes | None:
+        """Handle JSON serialisation (through our codec) with a custom serialiser to handle enums and datetimes."""
         if obj is not None:
-            return json.dumps(obj, default=self._json_unknown)
+            return self.codec.dumps(obj, self._json_unknown)
         else:
             return None
 
+    def _with_codec(self, resp: Any) -> Any:
+        """Have a response's ``json()`` decode through our codec (unless it's the standard library's anyway)."""
+        if type(self.codec) is not JSONCodec:
+            resp.json = functools.partial(self.codec.loads, resp.content)
+        return resp
+
+    def _retry_delay(self, method: str, attempt: int, started: float, resp: Any = None, **kwargs: Any) -> float | None:
+        """Return how long to wait before retrying an attempt that failed (with a response or not), None to give up."""
+        if self.retry is None:
+            return None
+        if resp is None:
+            return self.retry.delay(method, attempt, time.monotonic() - started, **kwargs)
+        status = resp.status_code
+        if not isinstance(status, int) or status < 400:
+            return None
+        self._update_rate_limit(resp)
+        return self.retry.delay(method, attempt, time.monotonic() - started, status, resp.headers, **kwargs)
+
     def _on_resp(self, resp: Any) -> None:
         """Handle a RaindropIO API response, first pulling rate-limiting parms in effect due to high activity levels."""
+        self._update_rate_limit(resp)
+        resp.raise_for_status()  # Let requests (or httpx) library handle HTTP error codes returned.
+        self._with_codec(resp)
+
+    def _update_rate_limit(self, resp: Any) -> None:
+        """Pull the rate-limiting parms in effect (due to high activity levels) from a response."""
 
         def get_int(name: str) -> int | None:
             value = resp.headers.get(name, None)
@@ -133,25 +495,242 @@ class API:
                 return int(value)
             return None
 
-        v = get_int("X-RateLimit-Limit")
-        if v is not None:
-            self.ratelimit = v
-
-        v = get_int("X-RateLimit-Remaining")
-        if v is not None:
-            self.ratelimit_remaining = v
-
-        v = get_int("X-RateLimit-Reset")
-        if v is not None:
-            self.ratelimit_reset = v
+        limit = get_int("X-RateLimit-Limit")
+        remaining = get_int("X-RateLimit-Remaining")
+        reset = get_int("X-RateLimit-Reset")
+        with self._lock:
+            if limit is not None:
+                self.ratelimit = limit
+            if remaining is not None:
+                self.ratelimit_remaining = remaining
+            if reset is not None:
+                self.ratelimit_reset = reset
 
-        resp.raise_for_status()  # Let requests library handle HTTP error codes returned.
+        self.rate_limiter.update(limit, remaining, reset)
 
     def _request_headers_json(self) -> dict[str, str]:
         return {
             "Content-Type": "application/json",
         }
 
+
+class API(_BaseAPI):
+    """Provides communication to the Raindrop.io API server.
+
+    Parameters:
+        token: Either a string representing a valid RaindropIO Token.
+            This is either a TEST_TOKEN or a CLIENT token for use in OAuth in
+            which case the client_id and client_secret must also be provided.
+
+        token_type: Token type to be used on behalf of an oAuth connection.
+
+        pace_requests: If set, requests are paced by our ``RateLimiter`` (based on the rate limit headers returned by
+            Raindrop) such that they're spread evenly over Raindrop's rate-limit window instead of running into 429's.
+
+        retry: Policy for retrying requests that fail for transient reasons, ie. 429's, 5xx's and connection errors
+            (see ``RetryPolicy``). Set to None to disable retries altogether.
+
+        trusted_decode: If set, models are built from Raindrop's responses without full pydantic validation (see
+            ``raindropiopy.decode``), several times faster when pulling large accounts.
+
+        cache: Optional, a ``ResponseCache`` for GET responses (eg. such that repeated runs of a script start warm).
+            Responses made stale by changes through this API are invalidated automatically.
+
+        coalesce_requests: If set, identical GET requests (ie. same url and parameters) made from several threads at
+            the same time are sent only once, all callers sharing the response (eg. in a threaded web application).
+
+        json_codec: JSON codec for serialising requests and decoding responses, ie. "json" (the standard library,
+            the default), "orjson", "msgspec" or "auto" for the fastest installed (see ``raindropiopy.codec``).
+
+        pool_connections: Number of hosts for which connections are pooled (see ``requests.adapters.HTTPAdapter``).
+
+        pool_maxsize: Maximum number of connections kept alive (per host) for reuse, set it to at least the number of
+            threads sharing the API.
+
+        pool_block: If set, requests wait for a pooled connection when all ``pool_maxsize`` are in use, instead of
+            opening (and then discarding) additional ones.
+
+    Note:
+        An API can be shared between threads (eg. the workers of a ``ThreadPoolExecutor``): each thread uses its own
+        session (created on first use), all sessions sharing a single pool of kept-alive connections along with the
+        API's token, rate-limit state, cache and hooks. An expiring oAuth token is refreshed once on behalf of all
+        threads (ie. rather than by each session, which would invalidate each other's refresh tokens).
+
+    Examples:
+        Can either be used directly as a context manager:
+
+        >>> api = API(token="yourTestTokenFromRaindropIO"):
+        >>> collections = Collection.get_collections(api)
+        >>> # ...
+
+        or
+
+        >>> with API(token="yourTestTokenFromRaindropIO") as api:
+        >>>     user = User.get(api)
+        >>>     # ...
+    """
+
+    def __init__(
+        self,
+        token: str,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        token_type: str = "Bearer",
+        pace_requests: bool = False,
+        retry: RetryPolicy | None = DEFAULT_RETRY,
+        trusted_decode: bool = False,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        json_codec: str = "json",
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+    ) -> None:
+        """Instantiate an API connection to Raindrop using the token (and optional client information) provided."""
+        super().__init__(
+            token,
+            client_id,
+            client_secret,
+            token_type,
+            pace_requests,
+            retry,
+            trusted_decode,
+            coalesce_requests,
+            json_codec,
+        )
+        self.cache = cache
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._in_flight = _SingleFlight()
+        self._adapter: HTTPAdapter | None = None
+        self._local = threading.local()
+        self._sessions: weakref.WeakSet[OAuth2Session] = weakref.WeakSet()
+        self._refresh_lock = threading.Lock()
+        if isinstance(token, dict) and "expires_in" in token and "expires_at" not in token:
+            self.token = token | {"expires_at": time.time() + int(token["expires_in"])}  # ie. as oauthlib would.
+        self.open()
+
+    @property
+    def session(self) -> OAuth2Session | None:
+        """Return the calling thread's session with Raindrop (created on first use), None if the API isn't open."""
+        if (adapter := self._adapter) is None:
+            return None
+        if (session := getattr(self._local, "session", None)) is None:
+            session = self._local.session = self._create_session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    def _create_session(self) -> OAuth2Session:
+        """Handle the creation and/or authentication with oAuth handshake.
+
+        Sessions don't refresh their token themselves, see ``_sync_token``.
+        """
+        extra: dict[str, Any] | None
+        if self.client_id and self.client_secret:
+            extra = {
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+            }
+        else:
+            extra = None
+
+        with self._lock:
+            token = {"access_token": self.token} if isinstance(self.token, str) else self.token
+
+        return OAuth2Session(
+            self.client_id,
+            token=token,
+            auto_refresh_kwargs=extra,
+        )
+
+    def _sync_token(self, session: OAuth2Session) -> None:
+        """Give a thread's session our current oAuth token, first refreshing it if it's about to expire.
+
+        The refresh is made once, on behalf of all threads: any other thread finding the token expiring waits for it
+        and uses the refreshed token (as the refresh token it was sent with may not be valid anymore).
+        """
+        with self._lock:
+            token = self.token
+        if not isinstance(token, dict):
+            return  # ie. a test token, sessions are given it on creation and it never expires.
+        if "refresh_token" in token and float(token.get("expires_at", "inf")) - REFRESH_MARGIN <= time.time():
+            with self._refresh_lock:
+                with self._lock:
+                    current = self.token
+                if current is token:  # ie. not refreshed by another thread while we waited.
+                    current = session.refresh_token(URL_REFRESH, refresh_token=token["refresh_token"])
+                    with self._lock:
+                        self.token = current
+                token = current
+        if session.token is not token:
+            session.token = token
+
+    def open(self) -> None:
+        """Open a new connection to Raindrop (ie. a new connection pool, sessions being created on first use).
+
+        If there's an existing connection already, it'll be closed first.
+        """
+        self.close()
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+
+    def close(self) -> None:
+        """Close an existing Raindrop connection, ie. the sessions of all threads and their connection pool.
+
+        Safe to call even if a new session hasn't been created yet.
+        """
+        with self._lock:
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+            adapter, self._adapter = self._adapter, None
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+        if adapter is not None:
+            adapter.close()
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        idempotent: bool | None = None,
+        **kwargs: Any,
+    ) -> requests.models.Response:
+        """Send a request through our session (pacing and retrying it as configured) and handle the response."""
+        session = self.session
+        assert session
+        started, attempt, ret = time.monotonic(), 0, None
+        try:
+            for attempt in itertools.count():
+                if self.pace_requests:
+                    self.rate_limiter.acquire()
+                ret = None
+                try:
+                    self._sync_token(session)
+                    ret = getattr(session, method.lower())(url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    if (delay := self._retry_delay(method, attempt, started, idempotent=idempotent)) is None:
+                        raise
+                else:
+                    if (delay := self._retry_delay(method, attempt, started, ret, idempotent=idempotent)) is None:
+                        self._on_resp(ret)
+                        if self.cache is not None and method != "GET":
+                            self.cache.invalidate(url)
+                        break
+                time.sleep(delay)
+                _rewind_files(kwargs.get("files"))
+        except Exception as exc:
+            self._record(method, url, started, attempt, ret, kwargs, exc)
+            raise
+        self._record(method, url, started, attempt, ret, kwargs)
+        return ret
+
     def get(
         self,
         url: str,
@@ -165,14 +744,19 @@ class API:
             params: Optional dictionary of payload to be sent for the :class:`Request`.
 
         Returns:
-            :class:`requests.Response` object.
+            :class:`requests.Response` object (from our cache if one is set and it holds a usable response).
         """
-        assert self.session
-        ret = self.session.get(url, headers=self._request_headers_json(), params=params)
-        self._on_resp(ret)
-        return ret
+        headers = self._request_headers_json()
+
+        def send(validators: dict[str, str]) -> requests.models.Response:
+            return self._request("GET", url, headers=headers | validators, params=params)
+
+        def get() -> requests.models.Response:
+            return send({}) if self.cache is None else self._with_codec(self.cache.get(url, params, send))
 
-    def put(self, url: str, json: Any = None) -> requests.models.Response:
+        return self._in_flight.do(_key(url, params), get) if self.coalesce_requests else get()
+
+    def put(self, url: str, json: Any = None, params: dict[Any, Any] | None = None) -> requests.models.Response:
         """Low-level call to perform a PUT method against our present connection.
 
         Parameters:
@@ -180,15 +764,18 @@ class API:
 
             json: JSON object to be sent.
 
+            params: Optional dictionary of query parameters to be sent for the :class:`Request`.
+
         Returns:
             :class:`requests.Response` object.
         """
-        json = self._to_json(json)
-
-        assert self.session
-        ret = self.session.put(url, headers=self._request_headers_json(), data=json)
-        self._on_resp(ret)
-        return ret
+        return self._request(
+            "PUT",
+            url,
+            headers=self._request_headers_json(),
+            data=self._to_json(json),
+            params=params,
+        )
 
     def put_file(
         self,
@@ -212,10 +799,23 @@ class API:
         Returns:
             :class:`requests.Response` object.
         """
-        assert self.session
-        ret = self.session.put(url, data=data, files=files)
-        self._on_resp(ret)
-        return ret
+        # Each upload creates a new Raindrop, thus, only retry if Raindrop didn't accept it at all (ie. a 429).
+        return self._request("PUT", url, idempotent=False, data=data, files=files)
+
+    def put_upload(self, url: str, upload: MultipartUpload) -> requests.models.Response:
+        """Upload a file by a PUT request, streaming its multipart body from disk (see ``raindropiopy.upload``).
+
+        Parameters:
+            url: The url to send the PUT request to.
+
+            upload: The multipart body to be sent, ie. the file along with any form fields.
+
+        Returns:
+            :class:`requests.Response` object.
+        """
+        # As for put_file, only retried on a 429 (the body being re-read from the start of the file).
+        headers = {"Content-Type": upload.content_type}
+        return self._request("PUT", url, idempotent=False, headers=headers, data=upload)
 
     def post(self, url: str, json: Any = None) -> requests.models.Response:
         """Low-level call to perform a POST method against our present connection.
@@ -228,13 +828,9 @@ class API:
         Returns:
             :class:`requests.Response` object.
         """
-        json = self._to_json(json)
-        assert self.session
-        ret = self.session.post(url, headers=self._request_headers_json(), data=json)
-        self._on_resp(ret)
-        return ret
+        return self._request("POST", url, headers=self._request_headers_json(), data=self._to_json(json))
 
-    def delete(self, url: str, json: Any = None) -> requests.models.Response:
+    def delete(self, url: str, json: Any = None, params: dict[Any, Any] | None = None) -> requests.models.Response:
         """Low-level call to perform a DELETE method against our present connection.
 
         Parameters:
@@ -242,23 +838,261 @@ class API:
 
             json: JSON object to be sent.
 
+            params: Optional dictionary of query parameters to be sent for the :class:`Request`.
+
         Returns:
             :class:`requests.Response` object.
         """
-        json = self._to_json(json)
-
-        assert self.session
-        ret = self.session.delete(url, headers=self._request_headers_json(), data=json)
-        self._on_resp(ret)
-        return ret
+        return self._request(
+            "DELETE",
+            url,
+            headers=self._request_headers_json(),
+            data=self._to_json(json),
+            params=params,
+        )
 
     def __enter__(self) -> T_API:  # Note: Py3.11 upgrade to "self"
         """Context manager use: if we don't have an active session open yet, open one!."""
-        if not self.session:
+        if self._adapter is None:
             self.open()
         return self
 
     def __exit__(self, _type, _value, _traceback) -> None:  # type: ignore
         """Context manager use: once we're done with this API's scope, close connection off."""
+        self.close()
+
+
+class AsyncAPI(_BaseAPI):
+    """Provides non-blocking, asyncio-based communication to the Raindrop.io API server.
+
+    Mirrors the low-level surface of :class:`API` (get/put/post/delete/put_file) but each method is a coroutine,
+    allowing a single event loop to drive many concurrent requests against a single token. Use with the ``*_async``
+    variants of the Core Classes' methods, e.g. ``Raindrop.search_async``.
+
+    Parameters:
+        token: Either a string representing a valid RaindropIO Token or an oAuth token dictionary
+            (from which only the "access_token" is used, tokens are *not* automatically refreshed).
+
+        token_type: Token type to be used on behalf of an oAuth connection.
+
+        max_connections: Maximum number of simultaneous connections to open to Raindrop.
+
+        pace_requests: If set, requests are paced by our ``RateLimiter`` (see ``API``).
+
+        retry: Policy for retrying requests that fail for transient reasons (see ``API``).
+
+        trusted_decode: If set, models are built from Raindrop's responses without full validation (see ``API``).
+
+        coalesce_requests: If set, identical GET requests made from several tasks at the same time are sent only once
+            (see ``API``).
+
+        json_codec: JSON codec for serialising requests and decoding responses (see ``API``).
+
+    Note:
+        Requires the optional `httpx <https://www.python-httpx.org>`_ package, ie.
+        ``pip install raindrop-io-py[async]``.
+
+    Examples:
+        >>> async with AsyncAPI(token="yourTestTokenFromRaindropIO") as api:
+        >>>     user = await User.get_async(api)
+        >>>     # ...
+    """
+
+    def __init__(
+        self,
+        token: str | dict,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        token_type: str = "Bearer",
+        max_connections: int = 100,
+        pace_requests: bool = False,
+        retry: RetryPolicy | None = DEFAULT_RETRY,
+        trusted_decode: bool = False,
+        coalesce_requests: bool = False,
+        json_codec: str = "json",
+    ) -> None:
+        """Instantiate an asyncio-based API connection to Raindrop (the underlying session is opened lazily)."""
+        if httpx is None:
+            raise ImportError("AsyncAPI requires the 'httpx' package, ie. 'pip install raindrop-io-py[async]'")
+        super().__init__(
+            token,
+            client_id,
+            client_secret,
+            token_type,
+            pace_requests,
+            retry,
+            trusted_decode,
+            coalesce_requests,
+            json_codec,
+        )
+        self.session: httpx.AsyncClient | None = None
+        self.max_connections = max_connections
+        self._in_flight = _AsyncSingleFlight()
+
+    def _create_session(self) -> httpx.AsyncClient:
+        """Create the underlying httpx client, authenticating every request with our token."""
+        token = self.token["access_token"] if isinstance(self.token, dict) else self.token
+        return httpx.AsyncClient(
+            headers={"Authorization": f"{self.token_type} {token}"},
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+
+    def open(self) -> None:
+        """Open a new connection to Raindrop (not a coroutine as no I/O is performed until the first request).
+
+        Raises:
+            RuntimeError: If there's an open connection already (as closing it requires awaiting ``close`` first).
+        """
+        if self.session is not None and not self.session.is_closed:
+            raise RuntimeError("AsyncAPI connection is already open, await close() before opening another")
+        self.session = self._create_session()
+
+    async def close(self) -> None:
+        """Close an existing Raindrop connection.
+
+        Safe to call even if a new session hasn't been created yet.
+        """
         if self.session:
-            self.close()
+            await self.session.aclose()
+            self.session = None
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        idempotent: bool | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        if not self.session:
+            self.open()
+        started, attempt, ret = time.monotonic(), 0, None
+        try:
+            for attempt in itertools.count():
+                if self.pace_requests and (wait := self.rate_limiter.reserve()) > 0:
+                    await asyncio.sleep(wait)
+                ret = None
+                try:
+                    ret = await self.session.request(method, url, **kwargs)
+                except httpx.TransportError:
+                    if (delay := self._retry_delay(method, attempt, started, idempotent=idempotent)) is None:
+                        raise
+                else:
+                    if (delay := self._retry_delay(method, attempt, started, ret, idempotent=idempotent)) is None:
+                        self._on_resp(ret)
+                        break
+                await asyncio.sleep(delay)
+                _rewind_files(kwargs.get("files"))
+        except Exception as exc:
+            self._record(method, url, started, attempt, ret, kwargs, exc)
+            raise
+        self._record(method, url, started, attempt, ret, kwargs)
+        return ret
+
+    async def get(self, url: str, params: dict[Any, Any] | None = None) -> httpx.Response:
+        """Send a GET request.
+
+        Parameters:
+            url: The url to send the request to.
+
+            params: Optional dictionary of payload to be sent for the request.
+
+        Returns:
+            :class:`httpx.Response` object.
+        """
+
+        def get() -> Awaitable[httpx.Response]:
+            return self._request("GET", url, headers=self._request_headers_json(), params=params)
+
+        return await (self._in_flight.do(_key(url, params), get) if self.coalesce_requests else get())
+
+    async def put(self, url: str, json: Any = None, params: dict[Any, Any] | None = None) -> httpx.Response:
+        """Low-level call to perform a PUT method against our present connection.
+
+        Parameters:
+            url: The url to send the PUT request to.
+
+            json: JSON object to be sent.
+
+            params: Optional dictionary of query parameters to be sent for the request.
+
+        Returns:
+            :class:`httpx.Response` object.
+        """
+        return await self._request(
+            "PUT",
+            url,
+            headers=self._request_headers_json(),
+            content=self._to_json(json),
+            params=params,
+        )
+
+    async def put_file(
+        self,
+        url: str,
+        path: Path,
+        data: dict,
+        files: dict,
+    ) -> httpx.Response:
+        """Upload a file by a PUT request.
+
+        Parameters:
+            url: The url to send the PUT request to.
+
+            path: Path to file to be uploaded.
+
+            data: Dictionary, payload to be sent for the request, e.g. {"collectionId" : aCollection.id}
+
+            files: Dictionary, "files" object to be sent for the request,
+                e.g. {'file': (aFileName, aFileLikeObj, aContentType)}
+
+        Returns:
+            :class:`httpx.Response` object.
+        """
+        return await self._request("PUT", url, idempotent=False, data=data, files=files)
+
+    async def post(self, url: str, json: Any = None) -> httpx.Response:
+        """Low-level call to perform a POST method against our present connection.
+
+        Parameters:
+            url: The url to send the POST request to.
+
+            json: JSON object to be sent.
+
+        Returns:
+            :class:`httpx.Response` object.
+        """
+        return await self._request("POST", url, headers=self._request_headers_json(), content=self._to_json(json))
+
+    async def delete(self, url: str, json: Any = None, params: dict[Any, Any] | None = None) -> httpx.Response:
+        """Low-level call to perform a DELETE method against our present connection.
+
+        Parameters:
+            url: The url to send the DELETE request to.
+
+            json: JSON object to be sent.
+
+            params: Optional dictionary of query parameters to be sent for the request.
+
+        Returns:
+            :class:`httpx.Response` object.
+        """
+        return await self._request(
+            "DELETE",
+            url,
+            headers=self._request_headers_json(),
+            content=self._to_json(json),
+            params=params,
+        )
+
+    async def __aenter__(self) -> T_AsyncAPI:
+        """Async context manager use: if we don't have an active session open yet, open one!."""
+        if not self.session:
+            self.open()
+        return self
+
+    async def __aexit__(self, _type, _value, _traceback) -> None:  # type: ignore
+        """Async context manager use: once we're done with this API's scope, close connection off."""
+        await self.close()
@@ -0,0 +1,252 @@
+"""Persistent, on-disk cache of Raindrop's GET responses.
+
+Short-lived processes (eg. CLI invocations or cron jobs) typically request the same Collections, User and Tags on
+every run. With a ``ResponseCache`` attached to an API, responses are kept in a local SQLite database such that
+repeated runs start warm:
+
+>>> with API(token, cache=ResponseCache("~/.cache/raindrop.sqlite")) as api:
+>>>     collections = Collection.get_collections(api)  # ie. from the cache if requested within the last 5 minutes.
+
+- Fresh responses (ie. within the TTL configured for their endpoint, see ``DEFAULT_TTLS``) are returned without any
+  request to Raindrop.
+- Stale responses are *revalidated*: the request is sent with the response's ``ETag``/``Last-Modified`` validators and
+  if Raindrop answers "304 Not Modified", the cached body is used (and its TTL restarted).
+- Changes made through the same API (ie. any PUT, POST or DELETE) invalidate the cached responses of the resources
+  they affect, eg. updating a Raindrop invalidates cached searches, Tags and Collections (whose counts may change).
+- The cache is bounded in size, least-recently used responses being evicted first.
+
+Note:
+    Responses are keyed by url only, use a separate cache for each Raindrop account.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+__all__ = [
+    "DEFAULT_TTLS",
+    "ResponseCache",
+]
+
+# Seconds for which responses are used without revalidation, by endpoint (ie. path prefix, the longest match wins).
+# Anything else (eg. searches) is always revalidated. "user/stats" is what tells us (and Mirror) that anything changed.
+DEFAULT_TTLS: dict[str, float] = {
+    "collections": 300.0,
+    "tags": 300.0,
+    "user": 300.0,
+    "user/stats": 0.0,
+}
+
+# Resources (ie. first path segment) whose cached responses are made stale by a change to a resource.
+_AFFECTS: dict[str, tuple[str, ...]] = {
+    "raindrop": ("raindrop", "raindrops", "tags", "collections", "user"),
+    "raindrops": ("raindrop", "raindrops", "tags", "collections", "user"),
+    "collection": ("collection", "collections", "raindrop", "raindrops", "user"),
+    "collections": ("collection", "collections", "raindrop", "raindrops", "user"),
+    "tags": ("tags", "raindrop", "raindrops"),
+    "user": ("user",),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    resource TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_resource ON responses (resource);
+"""
+
+T_Send = Callable[[dict[str, str]], requests.models.Response]
+
+
+def _path(url: str) -> str:
+    """Return the API path of a url, eg. "collections/childrens" for .../rest/v1/collections/childrens."""
+    path = urlsplit(url).path.strip("/")
+    return path.split("/", 2)[2] if path.startswith("rest/v1/") else path
+
+
+def _key(url: str, params: dict[Any, Any] | None) -> str:
+    return f"{url}?{urlencode(sorted(params.items()), doseq=True)}" if params else url
+
+
+def _response(url: str, status: int, headers: dict[str, str], body: bytes) -> requests.models.Response:
+    """Return a response rebuilt from the cache (flagged as such by its ``from_cache`` attribute)."""
+    resp = requests.models.Response()
+    resp.url = url
+    resp.status_code = status
+    resp.reason = "OK"
+    resp.headers = CaseInsensitiveDict(headers)
+    resp._content = body
+    resp.from_cache = True
+    return resp
+
+
+class ResponseCache:
+    """Persistent cache of Raindrop's GET responses, see module documentation (use through ``API(cache=...)``).
+
+    Parameters:
+        path: SQLite database to use (created if it doesn't exist), defaults to an in-memory one.
+
+        ttls: Seconds for which responses of each endpoint are used without revalidation (see ``DEFAULT_TTLS``).
+
+        ttl: Seconds for responses of any other endpoint, defaults to 0 (ie. always revalidated).
+
+        max_size: Maximum total size of the cached response bodies (in bytes), defaults to 64MB.
+
+    Attributes:
+        hits: Number of responses returned from the cache without any request.
+        revalidated: Number of responses returned from the cache after a "304 Not Modified" from Raindrop.
+        misses: Number of responses received in full from Raindrop.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = ":memory:",
+        ttls: dict[str, float] | None = None,
+        ttl: float = 0.0,
+        max_size: int = 64 * 1024 * 1024,
+    ) -> None:
+        """Open (or create) the cache database."""
+        path = str(Path(path).expanduser()) if str(path) != ":memory:" else str(path)
+        self._db = sqlite3.connect(path, check_same_thread=False)  # ie. searches may run on several threads.
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = self.revalidated = self.misses = 0
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._db.close()
+
+    def __enter__(self) -> ResponseCache:
+        """Context manager use, close the database on exit."""
+        return self
+
+    def __exit__(self, _type, _value, _traceback) -> None:  # type: ignore
+        """Context manager use, close the database on exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of responses currently cached."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def ttl_of(self, path: str) -> float:
+        """Return the TTL of an API path, ie. of the longest endpoint in ``ttls`` it's in."""
+        best, ttl = -1, self.ttl
+        for endpoint, seconds in self.ttls.items():
+            if (path == endpoint or path.startswith(endpoint + "/")) and len(endpoint) > best:
+                best, ttl = len(endpoint), seconds
+        return ttl
+
+    def get(self, url: str, params: dict[Any, Any] | None, send: T_Send) -> requests.models.Response:
+        """Return the response for a GET request, from the cache if possible.
+
+        Args:
+            url: The url requested.
+
+            params: Query parameters of the request.
+
+            send: Callable sending the request (given any additional headers, ie. validators) if needed.
+
+        Returns:
+            The response, either from the cache (with ``from_cache`` set) or as received from Raindrop.
+        """
+        key, now = _key(url, params), time.time()
+        with self._lock:
+            row = self._db.execute("SELECT status, headers, body, expires FROM responses WHERE key = ?", (key,))
+            row = row.fetchone()
+            if row is not None and row[3] > now:
+                self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                self._db.commit()
+                self.hits += 1
+                return _response(url, row[0], json.loads(row[1]), row[2])
+
+        validators = {}
+        if row is not None:
+            headers = CaseInsensitiveDict(json.loads(row[1]))
+            if etag := headers.get("ETag"):
+                validators["If-None-Match"] = etag
+            if last_modified := headers.get("Last-Modified"):
+                validators["If-Modified-Since"] = last_modified
+
+        resp = send(validators)
+        path = _path(url)
+        if resp.status_code == 304 and row is not None:
+            with self._lock:
+                expires = time.time() + self.ttl_of(path)
+                self._db.execute("UPDATE responses SET expires = ?, accessed = ? WHERE key = ?", (expires, now, key))
+                self._db.commit()
+                self.revalidated += 1
+            return _response(url, row[0], json.loads(row[1]), row[2])
+
+        with self._lock:
+            self.misses += 1
+        self._store(key, path, resp)
+        return resp
+
+    def _store(self, key: str, path: str, resp: requests.models.Response) -> None:
+        """Cache a response received, if it's cacheable (and worth caching, ie. it can be used or revalidated)."""
+        headers = dict(resp.headers)
+        ttl = self.ttl_of(path)
+        body = resp.content
+        if resp.status_code != 200 or not isinstance(body, bytes) or len(body) > self.max_size:
+            return
+        if "no-store" in resp.headers.get("Cache-Control", ""):
+            return
+        if ttl <= 0 and not ("ETag" in resp.headers or "Last-Modified" in resp.headers):
+            return  # ie. it could neither be used nor revalidated.
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, resource, status, headers, body, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, path.split("/", 1)[0], resp.status_code, json.dumps(headers), body, now + ttl, now),
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        """Remove the least-recently used responses until the cache is within its maximum size."""
+        excess = self._db.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()[0] - self.max_size
+        if excess <= 0:
+            return
+        evicted = []
+        for key, size in self._db.execute("SELECT key, LENGTH(body) FROM responses ORDER BY accessed"):
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def invalidate(self, url: str) -> None:
+        """Remove the cached responses made stale by a change to the resource of the url provided (eg. a PUT to it)."""
+        resource = _path(url).split("/", 1)[0]
+        resources = _AFFECTS.get(resource, (resource,))
+        with self._lock:
+            self._db.execute(
+                f"DELETE FROM responses WHERE resource IN ({', '.join('?' * len(resources))})",
+                resources,
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
@@ -0,0 +1,121 @@
+"""JSON codecs used to serialise requests to (and decode responses from) Raindrop's API.
+
+The standard library's ``json`` module is used by default. When pulling or pushing large numbers of Raindrops, a
+faster backend can be used instead if one is installed, ie. `orjson <https://github.com/ijl/orjson>`_ or
+`msgspec <https://jcristharif.com/msgspec>`_ (``pip install raindrop-io-py[orjson]`` or ``[msgspec]``):
+
+>>> api = API(token, json_codec="auto")  # ie. the fastest installed, falling back to the standard library.
+
+Whichever codec is used, requests are serialised exactly as they would be otherwise: values that JSON doesn't
+support directly (ie. enums and datetimes) are always converted by the API's ``_json_unknown`` hook.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:  # Optional, ie. "pip install raindrop-io-py[orjson]"
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # Optional, ie. "pip install raindrop-io-py[msgspec]"
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+__all__ = [
+    "CODECS",
+    "JSONCodec",
+    "get_codec",
+]
+
+T_Default = Callable[[Any], Any]
+
+
+class JSONCodec:
+    """Serialise and decode JSON using the standard library (the interface every codec implements).
+
+    Attributes:
+        name: Name of the codec, as used with ``get_codec``.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any, default: T_Default) -> str | bytes:
+        """Return the JSON for an object, calling ``default`` for any value JSON doesn't support directly."""
+        return json.dumps(obj, default=default)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Return the object for a JSON document."""
+        return json.loads(data)
+
+
+class _OrjsonCodec(JSONCodec):
+    """Serialise and decode JSON using orjson."""
+
+    name = "orjson"
+
+    # Datetimes (and dataclasses) are passed to ``default`` like the standard library does, instead of orjson's own
+    # formatting, and non-string keys are converted just the same too.
+    def __init__(self) -> None:
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, default: T_Default) -> bytes:
+        """Return the JSON for an object, calling ``default`` for any value JSON doesn't support directly."""
+        return orjson.dumps(obj, default=default, option=self._options)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Return the object for a JSON document."""
+        return orjson.loads(data)
+
+
+class _MsgspecCodec(JSONCodec):
+    """Decode JSON using msgspec.
+
+    Requests are still serialised by the standard library as msgspec always formats datetimes itself (ie. they
+    wouldn't go through ``default`` and would be serialised differently), it's decoding large responses that counts.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        """Return the object for a JSON document."""
+        return self._decoder.decode(data)
+
+
+# Codecs by name, in order of preference for "auto" (the standard library's being always available).
+CODECS: dict[str, type[JSONCodec]] = {
+    "orjson": _OrjsonCodec,
+    "msgspec": _MsgspecCodec,
+    "json": JSONCodec,
+}
+
+_MODULES = {"orjson": orjson, "msgspec": msgspec, "json": json}
+
+
+def get_codec(name: str = "auto") -> JSONCodec:
+    """Return a JSON codec by name.
+
+    Args:
+        name: One of "json" (the standard library), "orjson", "msgspec" or "auto", ie. the first of these installed
+            (in order: orjson, msgspec and finally, the standard library).
+
+    Raises:
+        ValueError: If the name isn't one of a known codec.
+
+        ImportError: If the codec named requires a package that isn't installed.
+    """
+    if name == "auto":
+        name = next(name for name in CODECS if _MODULES[name] is not None)
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}', expected one of auto, {', '.join(CODECS)}")
+    if _MODULES[name] is None:
+        raise ImportError(
+            f"The '{name}' JSON codec requires the '{name}' package, ie. 'pip install raindrop-io-py[{name}]'",
+        )
+    return CODECS[name]()
@@ -0,0 +1,378 @@
+"""Fast, trusted decoding of Raindrop's API responses into our models (ie. without full pydantic validation).
+
+Creating a model through ``Model(**item)`` validates and coerces every attribute of every item, which dominates CPU
+time when pulling large accounts. Data received straight from Raindrop's API is already of the right shape though, so
+``decode`` builds the same models using a decoder compiled once per model class from its fields:
+
+- Attributes already of exactly their field's type (str, int, bool, lists of these etc.) are taken as-is.
+- ISO-8601 datetimes, enums, plain http(s) urls and nested models are converted directly, without pydantic's
+  general-purpose machinery.
+- Root validators (eg. gathering unofficial attributes into ``other``) and field validators (eg. resolving parent
+  references) are still run.
+
+Anything else is left to pydantic: values it would coerce (eg. an int title, "true" for a bool or a date without a
+time) or constrain (eg. non-negative counts, email addresses) are validated, while anything unexpected (a missing
+required attribute, a url with whitespace etc.) falls back to full validation of the item. The models are thus the
+same as those from a full validation, with errors reported exactly as they would be otherwise.
+
+Trusted decoding is enabled for all requests made through an API with ``API(token, trusted_decode=True)``.
+"""
+from __future__ import annotations
+
+import datetime
+import enum
+import functools
+import re
+from collections.abc import Callable
+from typing import Any, ClassVar, TypeVar
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, HttpUrl, ValidationError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+__all__ = [
+    "LazyModel",
+    "decode",
+]
+
+T_Model = TypeVar("T_Model", bound=BaseModel)
+
+# Datetimes parsed the same by datetime.fromisoformat as by pydantic (others, eg. dates alone, are left to pydantic).
+_DATETIME = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{1,6})?)?(?:Z|[+-][0-9]{2}(?::?[0-9]{2})?)?",
+)
+
+# Domain names we can build an HttpUrl for directly (anything else, eg. IP addresses or IDNs, is left to pydantic).
+_HOST = re.compile(r"(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+(?P<tld>[A-Za-z]{2,63})")
+_MAX_URL_LENGTH = 2083  # ie. per pydantic's HttpUrl
+_MAX_PORT = 65535
+
+# Types whose values are used as-is when of exactly that type (pydantic coerces any other, eg. "1" or True to 1).
+_SCALARS = (str, int, float, bool)
+
+# Marker returned by _converter for fields left to pydantic (ie. including any validators of the field itself).
+_VALIDATED: Any = object()
+
+# Default values that can be shared between instances (rather than copied for each).
+_IMMUTABLE = (str, int, float, bool, enum.Enum, type(None))
+
+
+class _UntrustedError(Exception):
+    """Raised while decoding an item that needs full validation after all."""
+
+
+def _datetime(value: Any) -> datetime.datetime:
+    if value.__class__ is not str or not _DATETIME.fullmatch(value):
+        raise _UntrustedError
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise _UntrustedError from None
+
+
+def _url(value: Any) -> HttpUrl:
+    """Return an HttpUrl for a plain http(s) url to a domain, with the same parts as pydantic would have parsed."""
+    if value.__class__ is not str or len(value) > _MAX_URL_LENGTH or not value.startswith(("http://", "https://")):
+        raise _UntrustedError
+    if " " in value or not value.isprintable() or value.count("#") > 1:  # ie. whitespace, urlsplit would drop some.
+        raise _UntrustedError
+    scheme, netloc, path, query, fragment = urlsplit(value)
+    if "@" in netloc:
+        raise _UntrustedError
+    host, colon, port = netloc.partition(":")
+    if not (match := _HOST.fullmatch(host)):
+        raise _UntrustedError
+    if colon and not (port.isascii() and port.isdigit() and int(port) <= _MAX_PORT):
+        raise _UntrustedError
+    before_fragment, hash_, _ = value.partition("#")
+
+    # ie. HttpUrl(value, scheme=..., host=...) but setting its (slot) attributes directly is several times faster.
+    url = str.__new__(HttpUrl, value)
+    url.scheme = scheme
+    url.user = url.password = None
+    url.host = host
+    url.tld = match["tld"]
+    url.host_type = "domain"
+    url.port = port or ("443" if scheme == "https" else "80")
+    url.path = path or None
+    url.query = query if query or "?" in before_fragment else None
+    url.fragment = fragment if fragment or hash_ else None
+    return url
+
+
+def _enum(type_: type[enum.Enum]) -> Callable[[Any], enum.Enum]:
+    def _convert(value: Any) -> enum.Enum:
+        try:
+            return type_(value)
+        except ValueError:
+            raise _UntrustedError from None
+
+    return _convert
+
+
+def _model(type_: type[BaseModel]) -> Callable[[Any], BaseModel]:
+    def _convert(value: Any) -> BaseModel:
+        if value.__class__ is not dict:
+            raise _UntrustedError
+        return _decoder(type_)(value)
+
+    return _convert
+
+
+def _list(item_type: Any = None) -> Callable[[Any], list[Any]]:
+    """Return a converter for a list of values, each of exactly the type provided, converted by a callable or any."""
+
+    def _convert(value: Any) -> list[Any]:
+        if value.__class__ is not list:
+            raise _UntrustedError
+        if item_type is None:
+            return value
+        if isinstance(item_type, type):
+            for item in value:
+                if item.__class__ is not item_type:
+                    raise _UntrustedError
+            return value
+        return [item_type(item) for item in value]
+
+    return _convert
+
+
+def _union(types: list[type[BaseModel]]) -> Callable[[Any], BaseModel]:
+    """Return a converter choosing the first model of a union whose required attributes are all present.
+
+    This mirrors pydantic trying each type of the union in turn, without the cost of the failed validations.
+    """
+    required = [(type_, {field.alias for field in type_.__fields__.values() if field.required}) for type_ in types]
+
+    def _convert(value: Any) -> BaseModel:
+        if value.__class__ is not dict:
+            raise _UntrustedError
+        for type_, aliases in required:
+            if aliases <= value.keys():
+                return _decoder(type_)(value)
+        raise _UntrustedError
+
+    return _convert
+
+
+def _converter(field: ModelField) -> Any:
+    """Return how a field's (non-None) value is converted.
+
+    Returns:
+        None if the value is used as-is, one of ``_SCALARS`` if it's used as-is only when of exactly that type,
+        ``_VALIDATED`` if it's left to pydantic or otherwise, a callable converting it (raising ``_UntrustedError``
+        for anything unexpected).
+    """
+    type_ = field.type_
+    if field.class_validators:
+        return _VALIDATED
+    if field.shape == SHAPE_LIST:
+        if type_ in _SCALARS:
+            return _list(type_)
+        if isinstance(type_, type) and issubclass(type_, BaseModel):
+            return _list(_model(type_))
+        if getattr(type_, "__origin__", None) is dict:
+            return _list(dict)  # ie. dicts of Any, taken as-is.
+        return _list() if type_ is Any else _VALIDATED
+    if field.shape != SHAPE_SINGLETON:
+        return None  # ie. dicts of Any (set by our root validators), taken as-is.
+    if field.sub_fields:
+        types = [sub_field.type_ for sub_field in field.sub_fields]
+        if all(isinstance(sub, type) and issubclass(sub, BaseModel) for sub in types):
+            return _union(types)
+        return _VALIDATED
+    if type_ is datetime.datetime:
+        return _datetime
+    if type_ in _SCALARS:
+        return type_
+    if not isinstance(type_, type):
+        return None  # ie. Any
+    if issubclass(type_, HttpUrl):
+        return _url
+    if issubclass(type_, enum.Enum):
+        return _enum(type_)
+    if issubclass(type_, BaseModel):
+        return _model(type_)
+    return _VALIDATED  # ie. constrained variants of str, int etc. (eg. NonNegativeInt, EmailStr).
+
+
+def _validator(model: type[BaseModel], field: ModelField) -> Callable[[Any, dict[str, Any]], Any]:
+    """Return a callable validating a field's value through pydantic (given the values decoded so far)."""
+
+    def _validate(value: Any, values: dict[str, Any]) -> Any:
+        value, errors = field.validate(value, values, loc=field.alias, cls=model)
+        if errors:
+            raise _UntrustedError
+        return value
+
+    return _validate
+
+
+@functools.cache
+def _decoder(model: type[T_Model]) -> Callable[[dict[str, Any]], T_Model]:
+    """Compile (once) and return the trusted decoder for a model class.
+
+    The decoder is generated as straight-line Python source specific to the model's fields, ie. without any
+    per-field loop, wrapper or lookup at decode time. For example, for a datetime field "last_update" (alias
+    "lastUpdate") it reads:
+
+        if "lastUpdate" in data:
+            value = data["lastUpdate"]
+            values["last_update"] = None if value is None else convert_last_update(value)
+            fields_set.add("last_update")
+        else:
+            values["last_update"] = default_last_update
+    """
+    namespace: dict[str, Any] = {"model": model, "new": model.__new__, "setattr": object.__setattr__}
+    namespace["Untrusted"] = _UntrustedError
+    namespace["unaliased"] = {name for name, field in model.__fields__.items() if field.alias == name}
+    # Root validators may change the item (eg. to gather unofficial attributes), leave the caller's untouched:
+    lines = ["def _decode(item):", "    data = dict(item)" if model.__pre_root_validators__ else "    data = item"]
+    for index, validator in enumerate(model.__pre_root_validators__):
+        namespace[f"pre_{index}"] = validator
+        lines.append(f"    data = pre_{index}(model, data)")
+    lines += ["    values = {}", "    fields_set = data.keys() & unaliased"]
+    for name, field in model.__fields__.items():
+        alias = repr(field.alias)
+        lines.append(f"    if {alias} in data:")
+        convert = _converter(field)
+        if convert is _VALIDATED:
+            namespace[f"validate_{name}"] = _validator(model, field)
+            lines.append(f"        values[{name!r}] = validate_{name}(data[{alias}], values)")
+        elif convert in _SCALARS:  # ie. anything but exactly this type (or None, if allowed) is left to pydantic.
+            namespace[f"type_{name}"] = convert
+            namespace[f"validate_{name}"] = _validator(model, field)
+            accept = f"value.__class__ is type_{name}" + (" or value is None" if field.allow_none else "")
+            lines.append(f"        value = data[{alias}]")
+            lines.append(f"        values[{name!r}] = value if {accept} else validate_{name}(value, values)")
+        elif convert is not None:
+            namespace[f"convert_{name}"] = convert
+            lines.append(f"        value = data[{alias}]")
+            if field.allow_none:
+                lines.append(f"        values[{name!r}] = None if value is None else convert_{name}(value)")
+            else:  # ie. None is rejected by the converter, as it would be by pydantic.
+                lines.append(f"        values[{name!r}] = convert_{name}(value)")
+        else:
+            lines.append(f"        values[{name!r}] = data[{alias}]")
+        if field.alias != name:
+            lines.append(f"        fields_set.add({name!r})")
+        lines.append("    else:")
+        if field.required:
+            lines.append("        raise Untrusted")
+        elif field.default_factory is None and isinstance(field.default, _IMMUTABLE):
+            namespace[f"default_{name}"] = field.default
+            lines.append(f"        values[{name!r}] = default_{name}")
+        else:  # ie. a copy of a mutable default, as pydantic would.
+            namespace[f"default_{name}"] = field.get_default
+            lines.append(f"        values[{name!r}] = default_{name}()")
+    for index, (_, validator) in enumerate(model.__post_root_validators__):
+        namespace[f"post_{index}"] = validator
+        lines.append(f"    values = post_{index}(model, values)")
+    lines += [
+        "    instance = new(model)",
+        '    setattr(instance, "__dict__", values)',
+        '    setattr(instance, "__fields_set__", fields_set)',
+    ]
+    if model.__private_attributes__:
+        lines.append("    instance._init_private_attributes()")
+    lines.append("    return instance")
+    exec(compile("\n".join(lines), f"<decoder of {model.__name__}>", "exec"), namespace)
+    return namespace["_decode"]
+
+
+def decode(model: type[T_Model], item: dict[str, Any]) -> T_Model:
+    """Return an instance of a model from an item received from Raindrop's API, skipping full validation.
+
+    Args:
+        model: The model class, eg. ``Raindrop`` or ``Collection``.
+
+        item: The item as received from Raindrop (ie. a JSON object, using Raindrop's attribute names).
+
+    Returns:
+        The model instance, equal to ``model(**item)`` (any value pydantic would coerce or constrain is validated).
+
+    Raises:
+        pydantic.ValidationError: If the item is not valid for the model after all (see ``model(**item)``).
+    """
+    try:
+        return _decoder(model)(item)
+    except _UntrustedError:
+        return model(**item)
+
+
+def _attribute(model: type[BaseModel], field: ModelField) -> Callable[[dict[str, Any]], Any]:
+    """Return a callable converting a single field of a model from an item (for ``LazyModel``)."""
+    convert = _converter(field)
+    alias = field.alias
+
+    def _validate(value: Any) -> Any:
+        value, errors = field.validate(value, {}, loc=alias, cls=model)
+        if errors:
+            raise ValidationError([errors], model)
+        return value
+
+    def _get(item: dict[str, Any]) -> Any:
+        if alias not in item:
+            if pre := model.__pre_root_validators__:  # ie. for attributes added by root validators, eg. "other".
+                item = functools.reduce(lambda data, validator: validator(model, data), pre, dict(item))
+            if alias not in item:
+                return _validate(None) if field.required else field.get_default()
+        value = item[alias]
+        if convert is None or (value is None and field.allow_none):
+            return value
+        if convert is _VALIDATED:
+            return _validate(value)
+        if convert in _SCALARS:
+            return value if value.__class__ is convert else _validate(value)
+        try:
+            return convert(value)
+        except _UntrustedError:
+            return _validate(value)
+
+    return _get
+
+
+@functools.cache
+def _attributes(model: type[BaseModel]) -> dict[str, Callable[[dict[str, Any]], Any]]:
+    return {name: _attribute(model, field) for name, field in model.__fields__.items()}
+
+
+class LazyModel:
+    """Read-only view of an item received from Raindrop's API, converting each attribute only on first access.
+
+    Compared to building the model itself, items that are only partially read (eg. just the ``id`` and ``link`` of
+    each Raindrop in a large scan) avoid the cost (in both time and memory) of converting everything else. Attributes
+    are converted as with ``decode`` and cached, such that each is converted at most once.
+
+    Subclasses set ``model`` to the pydantic model they're a view of (which must not have post root validators).
+
+    Parameters:
+        item: The item as received from Raindrop (ie. a JSON object, using Raindrop's attribute names).
+    """
+
+    model: ClassVar[type[BaseModel]]
+    __slots__ = ("__dict__", "_item")
+
+    def __init__(self, item: dict[str, Any]) -> None:
+        """Wrap the item provided, no conversion takes place until an attribute is accessed."""
+        object.__setattr__(self, "_item", item)
+
+    def __getattr__(self, name: str) -> Any:
+        """Convert (and cache) an attribute on first access, subsequent accesses find it in the instance directly."""
+        if (attribute := _attributes(self.model).get(name)) is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = self.__dict__[name] = attribute(self._item)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Views are read-only, see ``materialize`` for a model instance that can be changed."""
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __repr__(self) -> str:
+        """Return a short representation, without converting anything beyond the id."""
+        return f"{type(self).__name__}(id={self.id!r})"
+
+    def materialize(self) -> BaseModel:
+        """Return the full model instance for this item (see ``decode``)."""
+        return decode(self.model, self._item)
+
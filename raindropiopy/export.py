@@ -0,0 +1,326 @@
+"""Streaming export (and import) of Raindrops, Collections and Tags to NDJSON and Arrow/Parquet files.
+
+Exports are written page by page as results arrive from Raindrop (ie. straight from the search paginator for
+Raindrops), such that memory use stays flat regardless of the size of the account. Readers likewise rebuild models
+one at a time, batch by batch:
+
+>>> with API(token) as api:
+>>>     export_ndjson(api, "raindrops.ndjson")
+>>>     export_parquet(api, "collections.parquet", model=Collection)
+>>> for raindrop in read_ndjson("raindrops.ndjson"):
+>>>     ...
+
+NDJSON files hold one item per line, exactly as received from Raindrop. Arrow (IPC file format) and Parquet files
+share a stable schema per model (see ``schema``): typed columns of the main attributes for querying in place (eg.
+from a data-warehouse), along with a ``data`` column of each item as received (ie. from which models are rebuilt,
+unofficial attributes included).
+
+Arrow and Parquet support requires the optional `pyarrow <https://arrow.apache.org/docs/python>`_ package, ie.
+``pip install raindrop-io-py[arrow]``.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic.datetime_parse import parse_datetime
+
+from .api import T_API
+from .decode import decode
+from .models import URL, Collection, CollectionRef, Raindrop, Tag
+
+try:  # Only required for Arrow/Parquet, ie. "pip install raindrop-io-py[arrow]"
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+__all__ = [
+    "export_arrow",
+    "export_ndjson",
+    "export_parquet",
+    "read_arrow",
+    "read_ndjson",
+    "read_parquet",
+    "record_batches",
+    "schema",
+]
+
+T_Exported = TypeVar("T_Exported", Raindrop, Collection, Tag)
+
+# Bumped on any incompatible change to the schemas below (and recorded in each file's schema metadata).
+SCHEMA_VERSION = "1"
+
+
+def _datetime(value: str | int | None) -> datetime | None:
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parse_datetime(value)  # ie. anything else pydantic would accept.
+
+
+def _ref(value: dict[str, Any] | int | None) -> int | None:
+    """Return the id of a reference received from Raindrop, ie. from it's {"$id": ...} form."""
+    return value.get("$id") if isinstance(value, dict) else value
+
+
+def _raindrop_row(item: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": item["_id"],
+        "collection_id": _ref(item.get("collection", CollectionRef.Unsorted.id)),
+        "created": _datetime(item.get("created")),
+        "last_update": _datetime(item.get("lastUpdate")),
+        "type": item.get("type"),
+        "title": item.get("title"),
+        "excerpt": item.get("excerpt"),
+        "link": item.get("link"),
+        "domain": item.get("domain"),
+        "tags": item.get("tags"),
+        "important": item.get("important"),
+        "broken": item.get("broken"),
+    }
+
+
+def _collection_row(item: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": item["_id"],
+        "title": item.get("title"),
+        "parent": _ref(item.get("parent")),
+        "count": item.get("count"),
+        "created": _datetime(item.get("created")),
+        "last_update": _datetime(item.get("lastUpdate")),
+        "public": item.get("public"),
+    }
+
+
+def _tag_row(item: dict[str, Any]) -> dict[str, Any]:
+    return {"tag": item["_id"], "count": item.get("count")}
+
+
+_ROWS: dict[type, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    Raindrop: _raindrop_row,
+    Collection: _collection_row,
+    Tag: _tag_row,
+}
+
+
+def _check(model: type) -> None:
+    if model not in _ROWS:
+        raise ValueError(f"Can't export {model.__name__}, expected one of Raindrop, Collection or Tag")
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Arrow/Parquet support requires the 'pyarrow' package, ie. 'pip install raindrop-io-py[arrow]'",
+        )
+
+
+def _pages(
+    api: T_API,
+    model: type,
+    collection: Collection | CollectionRef,
+    search: str | None,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield the items of a model received from Raindrop, a page (ie. a response) at a time."""
+    _check(model)
+    if model is Raindrop:
+        for results in Raindrop._iter_search_pages(api, collection, search):
+            yield results["items"]
+    elif model is Collection:
+        for path in ("collections", "collections/childrens"):
+            yield api.get(URL.format(path=path)).json()["items"]
+    else:
+        yield api.get(Tag._url()).json()["items"]
+
+
+################################################################################
+# NDJSON
+################################################################################
+def export_ndjson(
+    api: T_API,
+    path: Path | str,
+    model: type[T_Exported] = Raindrop,
+    collection: Collection | CollectionRef = CollectionRef.All,
+    search: str | None = None,
+) -> int:
+    """Export a model's items to an NDJSON file, one item (as received from Raindrop) per line.
+
+    Args:
+        api: API Handle to use for the requests.
+
+        path: File to write (replaced if it exists).
+
+        model: Optional, what to export, ie. ``Raindrop`` (the default), ``Collection`` or ``Tag``.
+
+        collection: Optional, for Raindrops, the collection to export (defaults to ``CollectionRef.All``).
+
+        search: Optional, for Raindrops, search string limiting those exported (see ``Raindrop.search``).
+
+    Returns:
+        The number of items written.
+    """
+    _check(model)
+    written = 0
+    with open(path, "w", encoding="utf-8") as fh:
+        for items in _pages(api, model, collection, search):
+            fh.writelines(json.dumps(item, separators=(",", ":")) + "\n" for item in items)
+            written += len(items)
+    return written
+
+
+def read_ndjson(path: Path | str, model: type[T_Exported] = Raindrop) -> Iterator[T_Exported]:
+    """Yield the models of an NDJSON file (see ``export_ndjson``), one line at a time."""
+    _check(model)
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield decode(model, json.loads(line))
+
+
+################################################################################
+# Arrow & Parquet
+################################################################################
+def schema(model: type[T_Exported] = Raindrop) -> pa.Schema:
+    """Return the Arrow schema of a model's exports (the same for both Arrow and Parquet files).
+
+    Raises:
+        ImportError: If pyarrow isn't installed.
+    """
+    _require_pyarrow()
+    _check(model)
+    timestamp = pa.timestamp("ms", tz="UTC")
+    fields = {
+        Raindrop: [
+            ("id", pa.int64()),
+            ("collection_id", pa.int64()),
+            ("created", timestamp),
+            ("last_update", timestamp),
+            ("type", pa.string()),
+            ("title", pa.string()),
+            ("excerpt", pa.string()),
+            ("link", pa.string()),
+            ("domain", pa.string()),
+            ("tags", pa.list_(pa.string())),
+            ("important", pa.bool_()),
+            ("broken", pa.bool_()),
+        ],
+        Collection: [
+            ("id", pa.int64()),
+            ("title", pa.string()),
+            ("parent", pa.int64()),
+            ("count", pa.int64()),
+            ("created", timestamp),
+            ("last_update", timestamp),
+            ("public", pa.bool_()),
+        ],
+        Tag: [
+            ("tag", pa.string()),
+            ("count", pa.int64()),
+        ],
+    }[model]
+    metadata = {"raindropiopy.model": model.__name__, "raindropiopy.schema": SCHEMA_VERSION}
+    return pa.schema([*fields, ("data", pa.string())], metadata=metadata)
+
+
+def record_batches(
+    api: T_API,
+    model: type[T_Exported] = Raindrop,
+    collection: Collection | CollectionRef = CollectionRef.All,
+    search: str | None = None,
+) -> Iterator[pa.RecordBatch]:
+    """Yield an Arrow record batch (of the model's ``schema``) for each page of items received from Raindrop.
+
+    See ``export_ndjson`` for arguments.
+    """
+    batch_schema, row = schema(model), _ROWS[model]
+    for items in _pages(api, model, collection, search):
+        if items:
+            rows = [row(item) | {"data": json.dumps(item, separators=(",", ":"))} for item in items]
+            yield pa.RecordBatch.from_pylist(rows, schema=batch_schema)
+
+
+def _export_batches(batches: Iterator[pa.RecordBatch], writer: Any) -> int:
+    written = 0
+    with writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            written += batch.num_rows
+    return written
+
+
+def export_parquet(
+    api: T_API,
+    path: Path | str,
+    model: type[T_Exported] = Raindrop,
+    collection: Collection | CollectionRef = CollectionRef.All,
+    search: str | None = None,
+) -> int:
+    """Export a model's items to a Parquet file, a row group per page received (see ``export_ndjson`` for arguments).
+
+    Raises:
+        ImportError: If pyarrow isn't installed.
+    """
+    file_schema = schema(model)
+    return _export_batches(record_batches(api, model, collection, search), pq.ParquetWriter(str(path), file_schema))
+
+
+def export_arrow(
+    api: T_API,
+    path: Path | str,
+    model: type[T_Exported] = Raindrop,
+    collection: Collection | CollectionRef = CollectionRef.All,
+    search: str | None = None,
+) -> int:
+    """Export a model's items to an Arrow IPC file, a record batch per page (see ``export_ndjson`` for arguments).
+
+    Raises:
+        ImportError: If pyarrow isn't installed.
+    """
+    file_schema = schema(model)
+    return _export_batches(record_batches(api, model, collection, search), pa.ipc.new_file(str(path), file_schema))
+
+
+def _models(batches: Iterator[pa.RecordBatch], file_schema: pa.Schema, model: type[T_Exported]) -> Iterator[T_Exported]:
+    """Yield the models rebuilt from the ``data`` column of the record batches provided."""
+    exported = (file_schema.metadata or {}).get(b"raindropiopy.model", b"").decode()
+    if exported != model.__name__:
+        raise ValueError(f"File holds {exported or 'unknown'} items, not {model.__name__}")
+    for batch in batches:
+        for data in batch.column("data").to_pylist():
+            yield decode(model, json.loads(data))
+
+
+def read_parquet(path: Path | str, model: type[T_Exported] = Raindrop) -> Iterator[T_Exported]:
+    """Yield the models of a Parquet file (see ``export_parquet``), reading a batch at a time.
+
+    Raises:
+        ImportError: If pyarrow isn't installed.
+
+        ValueError: If the file wasn't exported for the model provided.
+    """
+    _require_pyarrow()
+    _check(model)
+    parquet = pq.ParquetFile(str(path))
+    yield from _models(parquet.iter_batches(columns=["data"]), parquet.schema_arrow, model)
+
+
+def read_arrow(path: Path | str, model: type[T_Exported] = Raindrop) -> Iterator[T_Exported]:
+    """Yield the models of an Arrow IPC file (see ``export_arrow``), memory-mapping it and reading a batch at a time.
+
+    Raises:
+        ImportError: If pyarrow isn't installed.
+
+        ValueError: If the file wasn't exported for the model provided.
+    """
+    _require_pyarrow()
+    _check(model)
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        batches = (reader.get_batch(index) for index in range(reader.num_record_batches))
+        yield from _models(batches, reader.schema, model)
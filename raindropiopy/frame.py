@@ -0,0 +1,352 @@
+"""Column-oriented container for analytics over large numbers of Raindrops.
+
+A list of pydantic ``Raindrop`` models costs several KB per bookmark (each attribute a Python object, most of them in
+a per-instance dict), ie. gigabytes for a few hundred thousand bookmarks. A ``RaindropFrame`` instead holds each
+attribute in a single typed ``array`` (ids, collection ids, timestamps, type codes, broken flags) with domains and
+tags dictionary-encoded, ie. each distinct value stored once and every row holding just its integer code:
+
+>>> with API(token) as api:
+>>>     frame = RaindropFrame.from_search(api)
+>>>     frame.count_by("domain").most_common(10)
+>>>     stale = frame.filter(tag="to-read", updated_before=datetime(2023, 1, 1, tzinfo=UTC))
+>>>     for raindrop in stale:
+>>>         ...
+
+Frames are built straight from the JSON items of search pages (ie. without creating any model), filtering looks rows
+up in per-column indexes (built once, on first use) and rows are only turned back into ``Raindrop`` models on request.
+"""
+from __future__ import annotations
+
+import bisect
+import itertools
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic.datetime_parse import parse_datetime
+
+from .api import T_API
+from .decode import decode
+from .models import Collection, CollectionRef, Raindrop, RaindropSort, RaindropType, _collection_id
+
+__all__ = [
+    "RaindropFrame",
+]
+
+_TYPES = tuple(RaindropType)
+_TYPE_CODES = {type_.value: code for code, type_ in enumerate(_TYPES)}
+
+_NAN = float("nan")
+
+# Column names count_by supports.
+_GROUPS = ("collection", "domain", "tag", "type")
+
+
+def _timestamp(value: str | int | None) -> float:
+    """Return a datetime attribute received from Raindrop as a POSIX timestamp (NaN if there's none)."""
+    if value is None:
+        return _NAN
+    try:
+        when = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        when = parse_datetime(value)  # ie. anything else pydantic would accept.
+    return when.timestamp()
+
+
+def _datetime(timestamp: float) -> datetime | None:
+    return None if timestamp != timestamp else datetime.fromtimestamp(timestamp, UTC)  # ie. NaN for None.
+
+
+class _Dictionary:
+    """Dictionary encoding of a string column, ie. each distinct value stored once and referred to by its code."""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self.values = list(values)
+        self.codes = {value: code for code, value in enumerate(self.values)}
+
+    def encode(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        if (code := self.codes.get(value)) is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, code: int) -> str | None:
+        return None if code < 0 else self.values[code]
+
+
+class RaindropFrame:
+    """Column-oriented container of Raindrops for analytics over large result sets.
+
+    Columns held (one entry per row, ie. Raindrop):
+
+    - ``id``, ``collection_id``: arrays of ints.
+    - ``created``, ``last_update``: arrays of POSIX timestamps (floats, NaN if unknown).
+    - ``type``: array of codes into ``RaindropType`` (-1 if unknown), ``broken``: array of 0/1 flags.
+    - ``domain``: dictionary-encoded (see ``domains``), tags: dictionary-encoded lists (see ``tags``).
+    - ``link``, ``title``: lists of strings, such that rows can be turned back into (partial) Raindrops.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty frame, see ``from_items``, ``from_pages`` and ``from_search`` to build one."""
+        self.id = array("q")
+        self.collection_id = array("q")
+        self.created = array("d")
+        self.last_update = array("d")
+        self.type = array("b")
+        self.broken = array("b")
+        self.link: list[str | None] = []
+        self.title: list[str | None] = []
+        self._domains = _Dictionary()
+        self.domain = array("l")
+        self._tags = _Dictionary()
+        self.tag_codes = array("l")
+        self.tag_offsets = array("q", [0])  # ie. tags of row i are tag_codes[tag_offsets[i]:tag_offsets[i + 1]]
+        self._indexes: dict[str, Any] = {}  # Column name -> index of its rows (see _rows_by and _rows_ordered).
+
+    ################################################################################
+    # Building
+    ################################################################################
+    @classmethod
+    def from_items(cls, items: Iterable[dict[str, Any]]) -> RaindropFrame:
+        """Return a frame of the items provided, ie. Raindrops as received from Raindrop's API."""
+        frame = cls()
+        frame.extend(items)
+        return frame
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[dict[str, Any]]) -> RaindropFrame:
+        """Return a frame of the items in the pages of search results provided (ie. with an "items" key each)."""
+        frame = cls()
+        for page in pages:
+            frame.extend(page["items"])
+        return frame
+
+    @classmethod
+    def from_search(
+        cls,
+        api: T_API,
+        collection: Collection | CollectionRef = CollectionRef.All,
+        search: str | None = None,
+        sort: RaindropSort | None = None,
+    ) -> RaindropFrame:
+        """Return a frame of the Raindrops matching a search (see ``Raindrop.search``), without creating any model.
+
+        Only one page of results is held (beyond the frame itself) at any time.
+        """
+        return cls.from_pages(Raindrop._iter_search_pages(api, collection, search, sort=sort))
+
+    def extend(self, items: Iterable[dict[str, Any]]) -> None:
+        """Append the items provided (ie. Raindrops as received from Raindrop's API) as rows of the frame.
+
+        Raises:
+            ValueError: If an item has a type that isn't a ``RaindropType``.
+        """
+        self._indexes.clear()  # ie. rebuilt to include the new rows when next filtered on.
+        for item in items:
+            type_ = item.get("type")
+            if type_ is not None and type_ not in _TYPE_CODES:
+                raise ValueError(f"Invalid type '{type_}' for Raindrop {item.get('_id')}")
+            collection = item.get("collection")
+            self.id.append(item["_id"])
+            if isinstance(collection, dict):
+                collection = collection["$id"]
+            self.collection_id.append(CollectionRef.Unsorted.id if collection is None else collection)
+            self.created.append(_timestamp(item.get("created")))
+            self.last_update.append(_timestamp(item.get("lastUpdate")))
+            self.type.append(-1 if type_ is None else _TYPE_CODES[type_])
+            self.broken.append(1 if item.get("broken") else 0)
+            self.link.append(item.get("link"))
+            self.title.append(item.get("title"))
+            self.domain.append(self._domains.encode(item.get("domain")))
+            self.tag_codes.extend(self._tags.encode(tag) for tag in item.get("tags") or ())
+            self.tag_offsets.append(len(self.tag_codes))
+
+    ################################################################################
+    # Access
+    ################################################################################
+    def __len__(self) -> int:
+        """Return the number of rows (ie. Raindrops) in the frame."""
+        return len(self.id)
+
+    def __repr__(self) -> str:
+        """Return a short summary of the frame."""
+        return f"RaindropFrame({len(self)} rows, {len(self.domains)} domains, {len(self.tags)} tags)"
+
+    @property
+    def domains(self) -> list[str]:
+        """Return the distinct domains of the frame, indexed by the codes in the ``domain`` column."""
+        return self._domains.values
+
+    @property
+    def tags(self) -> list[str]:
+        """Return the distinct tags of the frame, indexed by the codes in the ``tag_codes`` column."""
+        return self._tags.values
+
+    def row_tags(self, row: int) -> list[str]:
+        """Return the tags of a single row."""
+        codes = self.tag_codes[self.tag_offsets[row] : self.tag_offsets[row + 1]]
+        return [self._tags.values[code] for code in codes]
+
+    def raindrop(self, row: int) -> Raindrop:
+        """Return a single row as a ``Raindrop``, with only the attributes held by the frame (see class doc)."""
+        type_ = self.type[row]
+        created, last_update = _datetime(self.created[row]), _datetime(self.last_update[row])
+        item = {
+            "_id": self.id[row],
+            "collection": {"$id": self.collection_id[row]},
+            "created": created and created.isoformat(),
+            "lastUpdate": last_update and last_update.isoformat(),
+            "type": None if type_ < 0 else _TYPES[type_].value,
+            "broken": bool(self.broken[row]),
+            "link": self.link[row],
+            "title": self.title[row],
+            "domain": self._domains.decode(self.domain[row]),
+            "tags": self.row_tags(row),
+        }
+        return decode(Raindrop, item)
+
+    def __getitem__(self, row: int) -> Raindrop:
+        """Return a single row as a ``Raindrop`` (see ``raindrop``)."""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("RaindropFrame row out of range")
+        return self.raindrop(row)
+
+    def __iter__(self) -> Iterator[Raindrop]:
+        """Iterate over the rows of the frame as ``Raindrop`` models, one at a time."""
+        return (self.raindrop(row) for row in range(len(self)))
+
+    ################################################################################
+    # Filtering & grouping
+    ################################################################################
+    def _rows_by(self, name: str) -> dict[int, array]:
+        """Return (building it once) the index of a column of codes, ie. each code -> the rows holding it, ascending."""
+        if (index := self._indexes.get(name)) is None:
+            rows: dict[int, list[int]] = {}
+            if name == "tag":
+                offsets = self.tag_offsets
+                for row in range(len(self)):
+                    for code in self.tag_codes[offsets[row] : offsets[row + 1]]:
+                        found = rows.setdefault(code, [])
+                        if not found or found[-1] != row:  # ie. a tag repeated on a row counts once.
+                            found.append(row)
+            else:
+                for row, code in enumerate(getattr(self, name)):
+                    rows.setdefault(code, []).append(row)
+            index = self._indexes[name] = {code: array("q", found) for code, found in rows.items()}
+        return index
+
+    def _rows_ordered(self, name: str) -> tuple[array, array]:
+        """Return (building it once) the rows of a timestamp column having one, ordered by it, and their timestamps."""
+        if (index := self._indexes.get(name)) is None:
+            column = getattr(self, name)
+            known = itertools.compress(range(len(self)), (value == value for value in column))  # ie. not NaN.
+            rows = sorted(known, key=column.__getitem__)
+            index = self._indexes[name] = (array("q", rows), array("d", (column[row] for row in rows)))
+        return index
+
+    def where(
+        self,
+        *,
+        collection: Collection | CollectionRef | int | None = None,
+        domain: str | None = None,
+        tag: str | None = None,
+        type: RaindropType | None = None,
+        broken: bool | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        updated_after: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> array:
+        """Return the (ascending) indices of the rows matching all the conditions provided.
+
+        Each condition looks its rows up in an index of its column (built on first use and kept until the frame is
+        extended, ie. on the column's codes, without decoding any value) and the rows of all conditions are then
+        intersected, smallest first. Domains and tags must match exactly; datetimes are exclusive bounds (rows without
+        one never match).
+
+        Returns:
+            An array of row indices, eg. for ``take``.
+        """
+        empty = array("q")
+        matches: list[array] = []
+        if collection is not None:
+            matches.append(self._rows_by("collection_id").get(_collection_id(collection), empty))
+        if domain is not None:
+            code = self._domains.codes.get(domain, -2)  # ie. no row matches a domain that's never been seen.
+            matches.append(self._rows_by("domain").get(code, empty))
+        if tag is not None:
+            matches.append(self._rows_by("tag").get(self._tags.codes.get(tag, -1), empty))
+        if type is not None:
+            matches.append(self._rows_by("type").get(_TYPES.index(type), empty))
+        if broken is not None:
+            matches.append(self._rows_by("broken").get(int(broken), empty))
+        for name, after, before in (
+            ("created", created_after, created_before),
+            ("last_update", updated_after, updated_before),
+        ):
+            if after is not None or before is not None:
+                rows, timestamps = self._rows_ordered(name)
+                first = 0 if after is None else bisect.bisect_right(timestamps, after.timestamp())
+                last = len(rows) if before is None else bisect.bisect_left(timestamps, before.timestamp())
+                matches.append(rows[first:last] if first < last else empty)
+
+        if not matches:
+            return array("q", range(len(self)))
+        if len(matches) == 1:
+            return array("q", sorted(matches[0]))  # ie. those of a timestamp range aren't in row order.
+        matches.sort(key=len)
+        return array("q", sorted(set(matches[0]).intersection(*matches[1:])))
+
+    def take(self, rows: Iterable[int]) -> RaindropFrame:
+        """Return a new frame of the rows provided (by index), in the order provided."""
+        rows = list(rows)
+        frame = type(self)()
+        for name in ("id", "collection_id", "created", "last_update", "type", "broken", "domain"):
+            column = getattr(self, name)
+            getattr(frame, name).extend(column[row] for row in rows)
+        frame.link = [self.link[row] for row in rows]
+        frame.title = [self.title[row] for row in rows]
+        frame._domains = _Dictionary(self._domains.values)
+        frame._tags = _Dictionary(self._tags.values)
+        for row in rows:
+            frame.tag_codes.extend(self.tag_codes[self.tag_offsets[row] : self.tag_offsets[row + 1]])
+            frame.tag_offsets.append(len(frame.tag_codes))
+        return frame
+
+    def filter(self, **conditions: Any) -> RaindropFrame:
+        """Return a new frame of the rows matching all the conditions provided (see ``where``)."""
+        return self.take(self.where(**conditions))
+
+    def count_by(self, column: str) -> Counter:
+        """Return the number of rows for each distinct value of a column.
+
+        Args:
+            column: One of "collection" (ie. collection ids), "domain", "tag" (ie. a row counts once for each of its
+                tags) or "type" (ie. ``RaindropType``'s).
+
+        Returns:
+            A ``Counter`` of the values (None for rows without one), eg. use ``most_common``.
+
+        Raises:
+            ValueError: If the column can't be grouped by.
+        """
+        if column == "collection":
+            return Counter(self.collection_id)
+        if column == "domain":
+            counts = Counter(self.domain)
+            return Counter({self._domains.decode(code): count for code, count in counts.items()})
+        if column == "tag":
+            counts = Counter(self.tag_codes)
+            return Counter({self._tags.values[code]: count for code, count in counts.items()})
+        if column == "type":
+            counts = Counter(self.type)
+            return Counter({None if code < 0 else _TYPES[code]: count for code, count in counts.items()})
+        raise ValueError(f"Can't count by '{column}', expected one of {', '.join(_GROUPS)}")
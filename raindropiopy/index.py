@@ -0,0 +1,215 @@
+"""Offline, ranked full-text search over Raindrops (ie. without any request to Raindrop per query).
+
+Raindrop's own search costs a (paged) sequence of requests for every query, all counting against the rate-limit.
+For type-ahead and similar uses, build a ``SearchIndex`` once and query it locally instead:
+
+>>> with API(token) as api:
+>>>     index = SearchIndex.build(api)
+>>>     index.attach(api)  # ie. keep it current with changes made through Raindrop.create_link, update, delete etc.
+>>>     for raindrop in index.search("pyth"):
+>>>         ...
+
+The index uses SQLite's FTS5 extension over each Raindrop's title, excerpt, tags, domain and link. Queries match
+word prefixes (ie. "pyth" finds "Python") and results are ranked by BM25, matches in titles and tags weighing more
+than those in excerpts or links.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .api import T_API, ChangeEvent
+from .decode import decode
+from .models import Collection, CollectionRef, Raindrop
+
+__all__ = [
+    "SearchIndex",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS raindrops (id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE VIRTUAL TABLE IF NOT EXISTS raindrops_fts USING fts5(
+    title, excerpt, tags, domain, link, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# BM25 weights of each column of raindrops_fts above, in order.
+_WEIGHTS = "10.0, 2.0, 5.0, 3.0, 1.0"
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def _fts_query(query: str) -> str | None:
+    """Convert free text to an FTS5 query matching all its words as prefixes, None if there are no words at all.
+
+    Each word is quoted, such that FTS5 operators and punctuation in the user's text are never interpreted.
+    """
+    words = _TOKEN.findall(query)
+    return " ".join(f'"{word}"*' for word in words) if words else None
+
+
+def _serialise(raindrop: Raindrop) -> dict[str, Any]:
+    """Return a Raindrop as Raindrop's API would, including any unofficial attributes (ie. such that it round-trips)."""
+    return json.loads(raindrop.json(by_alias=True, exclude={"other"})) | raindrop.other
+
+
+def _document(raindrop: Raindrop) -> tuple[Any, ...]:
+    """Return the values of the full-text columns for a Raindrop."""
+    return (
+        raindrop.title or "",
+        raindrop.excerpt or "",
+        " ".join(raindrop.tags or []),
+        raindrop.domain or "",
+        str(raindrop.link or ""),
+    )
+
+
+class SearchIndex:
+    """Local full-text index of Raindrops returning ranked ``Raindrop`` instances.
+
+    The index can be used from several threads, eg. when attached to an API shared by a ``ThreadPoolExecutor``
+    (changes are then indexed on whichever thread makes them).
+
+    Parameters:
+        path: Optional, SQLite database file to keep the index in (created if necessary), default is in-memory.
+
+    Attributes:
+        stale: True if Raindrops were changed in bulk (eg. by ``Raindrop.update_many``) since the index was last
+            built, such that some of those indexed may be out of date (see ``refresh``).
+    """
+
+    def __init__(self, path: Path | str = ":memory:") -> None:
+        """Open (or create) the index at the path provided."""
+        self.path = path
+        self.stale = False
+        self._db = sqlite3.connect(str(path), check_same_thread=False)  # ie. changes are indexed on any thread.
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(
+        cls,
+        api: T_API,
+        collection: Collection | CollectionRef = CollectionRef.All,
+        path: Path | str = ":memory:",
+    ) -> SearchIndex:
+        """Return a new index of all the Raindrops in a collection (by default, all except those in the Trash)."""
+        index = cls(path)
+        index.refresh(api, collection)
+        return index
+
+    def refresh(self, api: T_API, collection: Collection | CollectionRef = CollectionRef.All) -> None:
+        """Re-index all the Raindrops in a collection from Raindrop, replacing those currently indexed."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM raindrops")
+            self._db.execute("DELETE FROM raindrops_fts")
+            batch: list[Raindrop] = []
+            for raindrop in Raindrop.iter_search(api, collection):
+                batch.append(raindrop)
+                if len(batch) == 500:
+                    self._add(batch)
+                    batch = []
+            self._add(batch)
+        self.stale = False
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> SearchIndex:
+        """Context manager use: nothing to do, the database is opened on creation."""
+        return self
+
+    def __exit__(self, _type, _value, _traceback) -> None:  # type: ignore
+        """Context manager use: close the database."""
+        self.close()
+
+    ################################################################################
+    # Maintenance
+    ################################################################################
+    def attach(self, api: T_API) -> None:
+        """Keep the index current with every change made to Raindrops through the model methods using this API."""
+        api.subscribe(self._on_change)
+
+    def detach(self, api: T_API) -> None:
+        """Stop following the changes made through an API previously attached."""
+        api.unsubscribe(self._on_change)
+
+    def _on_change(self, event: ChangeEvent, payload: Any) -> None:
+        if event == ChangeEvent.saved:
+            self.add(payload)
+        elif event == ChangeEvent.deleted:
+            self.discard(payload)
+        elif event == ChangeEvent.stale:
+            self.stale = True
+
+    def add(self, raindrops: Iterable[Raindrop]) -> None:
+        """Add (or replace) Raindrops in the index, those in the Trash are removed instead."""
+        with self._lock, self._db:
+            self._add(raindrops)
+
+    def _add(self, raindrops: Iterable[Raindrop]) -> None:
+        raindrops = list(raindrops)
+        trashed = [raindrop.id for raindrop in raindrops if raindrop.collection.id == CollectionRef.Trash.id]
+        live = [raindrop for raindrop in raindrops if raindrop.collection.id != CollectionRef.Trash.id]
+        self._discard([raindrop.id for raindrop in live] + trashed)
+        self._db.executemany(
+            "INSERT INTO raindrops (id, data) VALUES (?, ?)",
+            [(raindrop.id, json.dumps(_serialise(raindrop))) for raindrop in live],
+        )
+        self._db.executemany(
+            "INSERT INTO raindrops_fts (rowid, title, excerpt, tags, domain, link) VALUES (?, ?, ?, ?, ?, ?)",
+            [(raindrop.id, *_document(raindrop)) for raindrop in live],
+        )
+
+    def discard(self, ids: Iterable[int]) -> None:
+        """Remove Raindrops (by id) from the index, ignoring any not indexed."""
+        with self._lock, self._db:
+            self._discard(list(ids))
+
+    def _discard(self, ids: list[int]) -> None:
+        self._db.executemany("DELETE FROM raindrops WHERE id = ?", [(id_,) for id_ in ids])
+        self._db.executemany("DELETE FROM raindrops_fts WHERE rowid = ?", [(id_,) for id_ in ids])
+
+    ################################################################################
+    # Queries
+    ################################################################################
+    def __len__(self) -> int:
+        """Return the number of Raindrops indexed."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM raindrops").fetchone()[0]
+
+    def __contains__(self, id: int) -> bool:
+        """Return True if the Raindrop with the id provided is indexed."""
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM raindrops WHERE id = ?", (id,)).fetchone() is not None
+
+    def search(self, query: str, limit: int | None = 20) -> list[Raindrop]:
+        """Return the Raindrops matching all the words of a query (as prefixes), best match first.
+
+        Args:
+            query: Free text to search for, eg. "pyth tut" matches a Raindrop titled "Python Tutorial".
+
+            limit: Optional, maximum number of Raindrops to return (None for all matches).
+
+        Returns:
+            The matching Raindrops, ranked by relevance (empty if the query has no words).
+        """
+        match = _fts_query(query)
+        if match is None:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                f"""
+                SELECT raindrops.data FROM raindrops_fts JOIN raindrops ON raindrops.id = raindrops_fts.rowid
+                WHERE raindrops_fts MATCH ? ORDER BY bm25(raindrops_fts, {_WEIGHTS}) LIMIT ?
+                """,
+                (match, -1 if limit is None else limit),
+            ).fetchall()
+        return [decode(Raindrop, json.loads(data)) for (data,) in rows]
@@ -0,0 +1,237 @@
+"""Instrumentation of requests made to Raindrop's API: latency, bytes moved, errors, retries and rate-limit headroom.
+
+Every request made through an API (blocking or asyncio-based) is described by a ``RequestMetric`` once it completes
+(successfully or not) and passed to each hook registered with ``api.add_request_hook``. ``MetricsRegistry`` is a
+ready-made hook aggregating them in memory, eg. for export to Prometheus:
+
+>>> registry = MetricsRegistry()
+>>> api = API(token)
+>>> api.add_request_hook(registry)
+>>> ...
+>>> registry.snapshot()["GET raindrops/{id}"]["duration"]["count"]
+>>> print(registry.to_prometheus())
+
+Requests are aggregated by HTTP verb and *endpoint template*, ie. the API path with ids replaced (eg. a GET of
+``.../rest/v1/raindrops/-1`` is recorded under ``raindrops/{id}``).
+"""
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from collections import Counter
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from .cache import _path
+from .upload import MultipartUpload
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "MetricsRegistry",
+    "RequestMetric",
+    "endpoint_template",
+]
+
+# Upper bounds (in seconds) of the latency histogram buckets, as Prometheus' client libraries default to.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_ID = re.compile(r"^-?\d+$")
+
+
+def endpoint_template(url: str) -> str:
+    """Return the endpoint template of a url, ie. its API path with ids replaced, eg. "raindrop/{id}"."""
+    return "/".join("{id}" if _ID.match(part) else part for part in _path(url).split("/"))
+
+
+class RequestMetric(NamedTuple):
+    """Description of a single request made to Raindrop's API (including any retries of it).
+
+    Attributes:
+        method: HTTP verb, eg. "GET".
+        endpoint: Endpoint template requested, eg. "raindrops/{id}" (see ``endpoint_template``).
+        status: Status code of the final response, None if no response was received (eg. a connection error).
+        duration: Seconds from the first attempt until the final response (or error), ie. including retries.
+        request_bytes: Size of the request body sent (file uploads excluded, unless streamed).
+        response_bytes: Size of the final response body received.
+        retries: Number of times the request was retried.
+        error: Name of the exception raised, if the request failed (eg. "HTTPError", "ConnectionError").
+        ratelimit_remaining: Requests remaining in Raindrop's rate-limit window (if known) after the request.
+        ratelimit_limit: Requests allowed per rate-limit window (if known).
+    """
+
+    method: str
+    endpoint: str
+    status: int | None
+    duration: float
+    request_bytes: int
+    response_bytes: int
+    retries: int
+    error: str | None
+    ratelimit_remaining: int | None
+    ratelimit_limit: int | None
+
+
+T_RequestHook = Callable[[RequestMetric], None]
+
+
+def _body_size(body: Any) -> int:
+    if isinstance(body, str):
+        return len(body.encode())
+    if isinstance(body, bytes | bytearray | MultipartUpload):
+        return len(body)
+    return 0
+
+
+def _content_size(resp: Any) -> int:
+    return len(content) if isinstance(content := getattr(resp, "content", None), bytes) else 0
+
+
+class _Series:
+    """Aggregates of the requests made with one verb to one endpoint."""
+
+    __slots__ = ("buckets", "count", "duration", "errors", "request_bytes", "response_bytes", "retries", "statuses")
+
+    def __init__(self, num_buckets: int) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.buckets = [0] * (num_buckets + 1)  # ie. the last being +Inf, counts are *not* cumulative.
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.statuses: Counter[int] = Counter()
+        self.errors: Counter[str] = Counter()
+
+
+def _label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{name}="{_label(value)}"' for name, value in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """In-memory registry of request metrics, a hook for ``api.add_request_hook`` (thread-safe).
+
+    Parameters:
+        buckets: Upper bounds (in seconds) of the latency histogram buckets, defaults to ``DEFAULT_BUCKETS``.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Create an empty registry."""
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], _Series] = {}
+        self.ratelimit_remaining: int | None = None
+        self.ratelimit_limit: int | None = None
+
+    def __call__(self, metric: RequestMetric) -> None:
+        """Record a request (ie. as a hook)."""
+        with self._lock:
+            key = (metric.method, metric.endpoint)
+            if (series := self._series.get(key)) is None:
+                series = self._series[key] = _Series(len(self.buckets))
+            series.count += 1
+            series.duration += metric.duration
+            series.buckets[bisect.bisect_left(self.buckets, metric.duration)] += 1
+            series.request_bytes += metric.request_bytes
+            series.response_bytes += metric.response_bytes
+            series.retries += metric.retries
+            if metric.status is not None:
+                series.statuses[metric.status] += 1
+            if metric.error is not None:
+                series.errors[metric.error] += 1
+            if metric.ratelimit_remaining is not None:
+                self.ratelimit_remaining = metric.ratelimit_remaining
+            if metric.ratelimit_limit is not None:
+                self.ratelimit_limit = metric.ratelimit_limit
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._series.clear()
+            self.ratelimit_remaining = self.ratelimit_limit = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of everything recorded so far, as plain (JSON serialisable) data.
+
+        Returns:
+            A dictionary keyed by "VERB endpoint" (eg. "GET raindrops/{id}"), each with "count", "duration" (a
+            histogram, ie. "sum", "count" and cumulative "buckets" keyed by upper bound), "request_bytes",
+            "response_bytes", "retries", "statuses" and "errors", plus a "ratelimit" key with the latest "remaining"
+            and "limit" seen.
+        """
+        with self._lock:
+            snapshot: dict[str, Any] = {}
+            for (method, endpoint), series in sorted(self._series.items()):
+                cumulative, buckets = 0, {}
+                for bound, count in zip([*self.buckets, float("inf")], series.buckets, strict=True):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                snapshot[f"{method} {endpoint}"] = {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": series.count,
+                    "duration": {"sum": series.duration, "count": series.count, "buckets": buckets},
+                    "request_bytes": series.request_bytes,
+                    "response_bytes": series.response_bytes,
+                    "retries": series.retries,
+                    "statuses": dict(series.statuses),
+                    "errors": dict(series.errors),
+                }
+            snapshot["ratelimit"] = {"remaining": self.ratelimit_remaining, "limit": self.ratelimit_limit}
+            return snapshot
+
+    def to_prometheus(self, prefix: str = "raindrop") -> str:
+        """Return everything recorded so far in Prometheus' text exposition format.
+
+        Args:
+            prefix: Prefix of the metric names, eg. "raindrop_request_duration_seconds".
+        """
+        snapshot = self.snapshot()
+        ratelimit = snapshot.pop("ratelimit")
+        lines: list[str] = []
+
+        def _family(name: str, kind: str, help_: str) -> str:
+            lines.extend([f"# HELP {prefix}_{name} {help_}", f"# TYPE {prefix}_{name} {kind}"])
+            return f"{prefix}_{name}"
+
+        name = _family("request_duration_seconds", "histogram", "Latency of requests to Raindrop (including retries).")
+        for series in snapshot.values():
+            method, endpoint, duration = series["method"], series["endpoint"], series["duration"]
+            for bound, count in duration["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{_labels(method=method, endpoint=endpoint, le=le)} {count}")
+            lines.append(f"{name}_sum{_labels(method=method, endpoint=endpoint)} {duration['sum']!r}")
+            lines.append(f"{name}_count{_labels(method=method, endpoint=endpoint)} {duration['count']}")
+
+        for attr, help_ in (
+            ("request_bytes", "Bytes sent in request bodies."),
+            ("response_bytes", "Bytes received in response bodies."),
+            ("retries", "Retries of requests."),
+        ):
+            name = _family(f"{attr}_total", "counter", help_)
+            for series in snapshot.values():
+                lines.append(f"{name}{_labels(method=series['method'], endpoint=series['endpoint'])} {series[attr]}")
+
+        name = _family("responses_total", "counter", "Responses by status code.")
+        for series in snapshot.values():
+            for status, count in sorted(series["statuses"].items()):
+                labels = _labels(method=series["method"], endpoint=series["endpoint"], status=status)
+                lines.append(f"{name}{labels} {count}")
+
+        name = _family("request_errors_total", "counter", "Requests that failed, by exception raised.")
+        for series in snapshot.values():
+            for error, count in sorted(series["errors"].items()):
+                labels = _labels(method=series["method"], endpoint=series["endpoint"], error=error)
+                lines.append(f"{name}{labels} {count}")
+
+        for attr, help_ in (
+            ("remaining", "Requests remaining in Raindrop's current rate-limit window."),
+            ("limit", "Requests allowed per rate-limit window."),
+        ):
+            if ratelimit[attr] is not None:
+                name = _family(f"ratelimit_{attr}", "gauge", help_)
+                lines.append(f"{name} {ratelimit[attr]}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,295 @@
+"""Local SQLite mirror of a Raindrop account, kept current through incremental synchronisation.
+
+Reports, dashboards etc. that repeatedly read an entire Raindrop account don't need to page through it on every run.
+Instead, sync a ``Mirror`` and read from it locally:
+
+>>> with API(token) as api, Mirror("raindrop.db") as mirror:
+>>>     mirror.sync(api)
+>>>     for raindrop in mirror.raindrops():
+>>>         ...
+
+The first sync pulls the entire account. Subsequent ones are incremental:
+
+- If Raindrop's "meta" status (see ``SystemCollection.get_meta``) hasn't changed since the last sync, nothing
+  further is requested at all.
+
+- Otherwise, Collections, Tags and the User are refreshed (a handful of requests) and only the Raindrops changed
+  since the last sync are fetched. These are requested newest-first (ie. ``RaindropSort.last_update_dn``) and paging
+  stops as soon as we reach a Raindrop that was already up-to-date.
+
+- Finally, the number of Raindrops mirrored is checked against Raindrop's own counts. As Raindrops removed from the
+  Trash are never returned by a search, any discrepancy results in a full re-pull of the Raindrops affected.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .api import T_API  # ie. for typing only...
+from .decode import decode
+from .models import (
+    URL,
+    Collection,
+    CollectionRef,
+    Raindrop,
+    RaindropSort,
+    SystemCollection,
+    Tag,
+    User,
+)
+from .query import Query
+
+__all__ = [
+    "Mirror",
+    "SyncResult",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS raindrops (
+    id            INTEGER PRIMARY KEY,
+    collection_id INTEGER NOT NULL,
+    last_update   TEXT,
+    data          TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS raindrops_collection_id ON raindrops (collection_id);
+CREATE TABLE IF NOT EXISTS collections (id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tags (tag TEXT PRIMARY KEY, count INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# The Raindrops we mirror are split into these two "scopes", each synchronised (and counted) separately.
+_SCOPES = (CollectionRef.All, CollectionRef.Trash)
+
+
+class SyncResult(NamedTuple):
+    """Outcome of a ``Mirror.sync``.
+
+    Attributes:
+        skipped: True if nothing changed on Raindrop since the last sync (and thus, nothing else was requested).
+        full: True if all Raindrops were (re-)pulled, rather than only those changed since the last sync.
+        raindrops: The number of Raindrops written to the mirror.
+    """
+
+    skipped: bool
+    full: bool
+    raindrops: int
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return None if value is None else datetime.fromisoformat(value)
+
+
+def _collection_of(item: dict[str, Any]) -> int:
+    """Return the collection id of a raw Raindrop item, ie. from it's {"$id": ...} reference."""
+    collection = item.get("collection", CollectionRef.Unsorted.id)
+    return collection.get("$id", CollectionRef.Unsorted.id) if isinstance(collection, dict) else collection
+
+
+def _in_scope(scope: CollectionRef) -> str:
+    """Return the SQL condition selecting the Raindrops in the scope provided."""
+    return "collection_id = -99" if scope.id == CollectionRef.Trash.id else "collection_id != -99"
+
+
+class Mirror:
+    """Local SQLite copy of the Raindrops, Collections, Tags and User of a Raindrop account.
+
+    Parameters:
+        path: Path to the SQLite database file to use (created if necessary), or ":memory:".
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Open (or create) the mirror at the path provided."""
+        self.path = path
+        self._db = sqlite3.connect(str(path))
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self._db.close()
+
+    def __enter__(self) -> Mirror:
+        """Context manager use: nothing to do, the database is opened on creation."""
+        return self
+
+    def __exit__(self, _type, _value, _traceback) -> None:  # type: ignore
+        """Context manager use: close the database."""
+        self.close()
+
+    ################################################################################
+    # Synchronisation
+    ################################################################################
+    def sync(self, api: T_API, full: bool = False) -> SyncResult:
+        """Bring the mirror up-to-date with the Raindrop account associated with the API provided.
+
+        Args:
+            api: API Handle to use for the requests.
+
+            full: Optional, ignore the state of the last sync and re-pull everything.
+
+        Returns:
+            A ``SyncResult`` describing what was done.
+        """
+        # Both the "meta" status and the counts of the system collections come from the same request.
+        stats = api.get(URL.format(path="user/stats")).json()
+        meta = json.dumps(stats.get("meta"), sort_keys=True)
+        if not full and self.last_sync is not None and self._get_state("meta") == meta:
+            return SyncResult(skipped=True, full=False, raindrops=0)
+
+        with self._db:  # ie. a single transaction, a failed sync leaves the mirror as it was.
+            self._sync_collections(api)
+            self._sync_tags(api)
+            self._set_state("user", json.dumps(api.get(URL.format(path="user")).json()["user"]))
+            self._set_state("counts", json.dumps(stats.get("items", [])))
+
+            counts = {item["_id"]: item["count"] for item in stats.get("items", [])}
+            written, was_full = 0, True
+            for scope in _SCOPES:
+                if full or self._get_state(f"watermark:{scope.id}") is None:
+                    written += self._pull_all(api, scope)
+                else:
+                    written += self._pull_changed(api, scope)
+                    was_full = False
+
+            # Raindrops permanently deleted don't show up in any search, reconcile by counts:
+            for scope in _SCOPES:
+                expected = counts.get(scope.id)
+                if expected is not None and expected != self._count(scope):
+                    written += self._pull_all(api, scope)
+
+            self._set_state("meta", meta)
+            self._set_state("last_sync", datetime.now(UTC).isoformat())
+
+        return SyncResult(skipped=False, full=was_full, raindrops=written)
+
+    def _sync_collections(self, api: T_API) -> None:
+        items = []
+        for path in ("collections", "collections/childrens"):
+            items.extend(api.get(URL.format(path=path)).json()["items"])
+        self._db.execute("DELETE FROM collections")
+        self._db.executemany(
+            "INSERT OR REPLACE INTO collections (id, data) VALUES (?, ?)",
+            [(item["_id"], json.dumps(item)) for item in items],
+        )
+
+    def _sync_tags(self, api: T_API) -> None:
+        self._db.execute("DELETE FROM tags")
+        self._db.executemany(
+            "INSERT OR REPLACE INTO tags (tag, count) VALUES (?, ?)",
+            [(tag.tag, tag.count) for tag in Tag.get(api)],
+        )
+
+    def _upsert(self, items: list[dict[str, Any]]) -> None:
+        self._db.executemany(
+            "INSERT OR REPLACE INTO raindrops (id, collection_id, last_update, data) VALUES (?, ?, ?, ?)",
+            [(item["_id"], _collection_of(item), item.get("lastUpdate"), json.dumps(item)) for item in items],
+        )
+
+    def _advance_watermark(self, scope: CollectionRef, items: list[dict[str, Any]]) -> None:
+        """Move the watermark of a scope to the latest lastUpdate seen (from Raindrop's clock, not ours)."""
+        key = f"watermark:{scope.id}"
+        latest = [_parse_datetime(item["lastUpdate"]) for item in items if item.get("lastUpdate")]
+        if current := self._get_state(key):
+            latest.append(_parse_datetime(current))
+        self._set_state(key, max(latest).isoformat() if latest else "")
+
+    def _pull_all(self, api: T_API, scope: CollectionRef) -> int:
+        """Replace all the Raindrops in a scope with those currently on Raindrop."""
+        self._db.execute(f"DELETE FROM raindrops WHERE {_in_scope(scope)}")
+        self._db.execute("DELETE FROM state WHERE key = ?", (f"watermark:{scope.id}",))
+        written = 0
+        for page in Raindrop._iter_search_pages(api, scope):
+            self._upsert(page["items"])
+            self._advance_watermark(scope, page["items"])
+            written += len(page["items"])
+        if not written:
+            self._advance_watermark(scope, [])
+        return written
+
+    def _pull_changed(self, api: T_API, scope: CollectionRef) -> int:
+        """Upsert the Raindrops of a scope changed since the last sync, stopping at the first unchanged one."""
+        watermark = _parse_datetime(self._get_state(f"watermark:{scope.id}") or None)
+        written = 0
+        # No prefetch, we typically stop part-way through the first page and the next one would be wasted:
+        for page in Raindrop._iter_search_pages(api, scope, prefetch=False, sort=RaindropSort.last_update_dn):
+            changed = []
+            for item in page["items"]:
+                last_update = _parse_datetime(item.get("lastUpdate"))
+                if watermark is not None and last_update is not None and last_update < watermark:
+                    break
+                changed.append(item)
+            self._upsert(changed)
+            self._advance_watermark(scope, changed)
+            written += len(changed)
+            if len(changed) < len(page["items"]):
+                break
+        return written
+
+    def _count(self, scope: CollectionRef) -> int:
+        return self._db.execute(f"SELECT COUNT(*) FROM raindrops WHERE {_in_scope(scope)}").fetchone()[0]
+
+    def _get_state(self, key: str) -> str | None:
+        row = self._db.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, value))
+
+    ################################################################################
+    # Local queries
+    ################################################################################
+    @property
+    def last_sync(self) -> datetime | None:
+        """Return when the mirror was last (successfully) synchronised, None if never."""
+        return _parse_datetime(self._get_state("last_sync"))
+
+    def raindrops(self, collection: Collection | CollectionRef | int | None = None) -> Iterator[Raindrop]:
+        """Iterate over the mirrored Raindrops, either all (except those in Trash) or those in a specific collection.
+
+        Args:
+            collection: Optional, Collection (or CollectionRef or collection id) to limit the Raindrops to,
+                ``CollectionRef.All`` (or None) for all Raindrops except those in the Trash.
+        """
+        id_ = getattr(collection, "id", collection)
+        if id_ is None or id_ == CollectionRef.All.id:
+            rows = self._db.execute(f"SELECT data FROM raindrops WHERE {_in_scope(CollectionRef.All)} ORDER BY id")
+        else:
+            rows = self._db.execute("SELECT data FROM raindrops WHERE collection_id = ? ORDER BY id", (id_,))
+        for (data,) in rows:
+            yield decode(Raindrop, json.loads(data))
+
+    def search(self, query: str, collection: Collection | CollectionRef | int | None = None) -> Iterator[Raindrop]:
+        """Iterate over the mirrored Raindrops matching a query in Raindrop's search syntax (see ``Query``).
+
+        Args:
+            query: The query, eg. '#python -#archived created:>2023-01 "type hints"'.
+
+            collection: Optional, limit the search to a collection (see ``raindrops``).
+        """
+        return Query(query).filter(self.raindrops(collection))
+
+    def get(self, id: int) -> Raindrop | None:
+        """Return the mirrored Raindrop with the id provided, None if there isn't one."""
+        row = self._db.execute("SELECT data FROM raindrops WHERE id = ?", (id,)).fetchone()
+        return decode(Raindrop, json.loads(row[0])) if row else None
+
+    def collections(self) -> list[Collection]:
+        """Return all mirrored (non-system) Collections."""
+        return [decode(Collection, json.loads(data)) for (data,) in self._db.execute("SELECT data FROM collections")]
+
+    def tags(self) -> list[Tag]:
+        """Return all mirrored Tags (across all collections)."""
+        rows = self._db.execute("SELECT tag, count FROM tags ORDER BY tag")
+        return [decode(Tag, {"_id": tag, "count": count}) for tag, count in rows]
+
+    def user(self) -> User | None:
+        """Return the mirrored User, None if never synchronised."""
+        data = self._get_state("user")
+        return decode(User, json.loads(data)) if data else None
+
+    def counts(self) -> list[SystemCollection]:
+        """Return the counts of Raindrops in each of the *system* collections as of the last sync."""
+        return [decode(SystemCollection, item) for item in json.loads(self._get_state("counts") or "[]")]
@@ -8,11 +8,19 @@ For example, to create a new raindrop, use Raindrop.create_link(...); a collecti
 """
 from __future__ import annotations
 
+import asyncio
 import enum
+import functools
+import itertools
+import math
+import mimetypes
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+import requests
 from pydantic import (
     BaseModel,
     EmailStr,
@@ -20,18 +28,24 @@ from pydantic import (
     HttpUrl,
     NonNegativeInt,
     PositiveInt,
+    ValidationError,
     root_validator,
     validator,
 )
 
-from .api import T_API  # ie. for typing only...
+from .api import T_API, ChangeEvent, T_AsyncAPI
+from .decode import LazyModel, decode
+from .upload import DEFAULT_CHUNK_SIZE, STREAM_THRESHOLD, MultipartUpload, T_Progress, UploadManifest, file_sha256
 
 __all__ = [
     "Access",
     "AccessLevel",
     "BrokenLevel",
+    "BulkCreateResult",
+    "BulkFailure",
     "Collection",
     "CollectionRef",
+    "CollectionTree",
     "FontColor",
     "Group",
     "Raindrop",
@@ -47,17 +61,22 @@ __all__ = [
 # Base URL for Raindrop IO's API
 URL = "https://api.raindrop.io/rest/v1/{path}"
 
+# Number of Raindrops to request per page when searching (the maximum Raindrop allows).
+SEARCH_PERPAGE = 50
+
+# Maximum number of Raindrops that can be created, updated or deleted in a single "bulk" request.
+BULK_LIMIT = 100
+
 
 ################################################################################
 # Utility methods
 ################################################################################
 def _collect_other_attributes(cls, v):
     """Gather all non-recognised/unofficial non-empty attribute values into a single one."""
-    skip_attrs = "_id"  # We don't need to store alias attributes again (pydantic will take care of)
-    v["other"] = dict()
-    for attr, value in v.items():
-        if value and attr not in cls.__fields__ and attr not in skip_attrs:
-            v["other"][attr] = value
+    fields = cls.__fields__
+    # We don't need to store alias attributes again (pydantic will take care of), eg. "_id" or "lastUpdate":
+    skip_attrs = {field.alias for field in fields.values()}
+    v["other"] = {attr: value for attr, value in v.items() if value and attr not in fields and attr not in skip_attrs}
     return v
 
 
@@ -77,6 +96,58 @@ def _resolve_parent_reference(parent_reference: dict | int | None) -> int | None
     return parent_reference.get("$id")
 
 
+def _collection_id(collection: Collection | CollectionRef | int) -> int:
+    """Return the id of a collection argument provided as either a Collection, a CollectionRef or an id already."""
+    if isinstance(collection, Collection | CollectionRef):
+        return collection.id
+    return collection
+
+
+def _from_api(cls: type[BaseModel], api: T_API | T_AsyncAPI, item: dict[str, Any]) -> Any:
+    """Return an instance of a model from an item received from Raindrop, skipping validation if the API trusts it."""
+    if getattr(api, "trusted_decode", False) is True:
+        return decode(cls, item)
+    return cls(**item)
+
+
+def _projection(cls: type[BaseModel], fields: Iterable[str]) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Return a callable reducing an item received from Raindrop to just the attributes of the fields named.
+
+    Attributes of other fields (and any unofficial ones, unless "other" is named) are dropped before the item is
+    turned into a model, such that they're never decoded nor kept.
+
+    Raises:
+        ValueError: If a field named isn't one of the model's.
+    """
+    fields = set(fields)
+    if unknown := fields - cls.__fields__.keys():
+        raise ValueError(f"Unknown {cls.__name__} field(s) requested: {', '.join(sorted(unknown))}")
+    aliases = {cls.__fields__[name].alias for name in fields if name != "other"}
+    if "other" in fields:
+        known = {field.alias for field in cls.__fields__.values()}
+
+        # As gathered by _collect_other_attributes, ie. anything that isn't a field of the model:
+        def _project(item: dict[str, Any]) -> dict[str, Any]:
+            return {
+                attr: value
+                for attr, value in item.items()
+                if attr in aliases or (attr not in cls.__fields__ and attr not in known)
+            }
+
+        return _project
+    return lambda item: {alias: item[alias] for alias in aliases if alias in item}
+
+
+def _num_pages(results: dict[str, Any], perpage: int = SEARCH_PERPAGE) -> int | None:
+    """Return the total number of pages for a search, based on the "count" returned with any page of results.
+
+    Returns None if Raindrop didn't tell us the count (in which case, we have to page until we hit an empty page).
+    """
+    if (count := results.get("count")) is None:
+        return None
+    return math.ceil(count / perpage)
+
+
 ################################################################################
 # Enumerated types
 ################################################################################
@@ -149,6 +220,50 @@ class RaindropType(enum.Enum):
     audio = "audio"
 
 
+################################################################################
+# Results of bulk operations
+################################################################################
+class BulkFailure(NamedTuple):
+    """An item of a bulk operation that failed.
+
+    Attributes:
+        index: Position of the item in the input provided.
+        item: The item itself (as provided).
+        error: The exception raised on behalf of the item.
+    """
+
+    index: int
+    item: Any
+    error: Exception
+
+
+class BulkCreateResult(NamedTuple):
+    """Outcome of a bulk creation, ie. ``Raindrop.create_many``.
+
+    Attributes:
+        created: The Raindrops successfully created, in the same order as the input provided.
+        failures: The items that couldn't be created (and why).
+    """
+
+    created: list[Raindrop]
+    failures: list[BulkFailure]
+
+
+class BulkUploadResult(NamedTuple):
+    """Outcome of a bulk file upload, ie. ``Raindrop.create_files``.
+
+    Attributes:
+        created: The Raindrops successfully created, in the same order as the paths provided.
+        skipped: The paths not uploaded as their content already was (ie. by an earlier upload, or another path of the
+            same upload), with the id of the Raindrop created for that content.
+        failures: The paths that couldn't be uploaded (and why).
+    """
+
+    created: list[Raindrop]
+    skipped: dict[Path, int]
+    failures: list[BulkFailure]
+
+
 ################################################################################
 # Base Models
 ################################################################################
@@ -263,7 +378,7 @@ class Collection(BaseModel):
         """
         ret = api.get(URL.format(path="collections"))
         items = ret.json()["items"]
-        return [cls(**item) for item in items]
+        return [_from_api(cls, api, item) for item in items]
 
     @classmethod
     def get_child_collections(cls, api: T_API) -> list[Collection]:
@@ -283,7 +398,7 @@ class Collection(BaseModel):
         """
         ret = api.get(URL.format(path="collections/childrens"))
         items = ret.json()["items"]
-        return [cls(**item) for item in items]
+        return [_from_api(cls, api, item) for item in items]
 
     @classmethod
     def get_collections(cls, api: T_API) -> list[Collection]:
@@ -298,6 +413,22 @@ class Collection(BaseModel):
         """
         return cls.get_root_collections(api) + cls.get_child_collections(api)
 
+    @classmethod
+    async def get_collections_async(cls, api: T_AsyncAPI) -> list[Collection]:
+        """Awaitable version of ``get_collections``, querying root & child Collections concurrently.
+
+        Args:
+            api: AsyncAPI Handle to use for the request.
+
+        Returns:
+            The (potentially empty) list of all **non-system** Collections associated with the API's user.
+        """
+        root, child = await asyncio.gather(
+            api.get(URL.format(path="collections")),
+            api.get(URL.format(path="collections/childrens")),
+        )
+        return [_from_api(cls, api, item) for item in root.json()["items"] + child.json()["items"]]
+
     @classmethod
     def get(cls, api: T_API, id: int) -> Collection:
         """Return a Raindrop Collection instance based on it's id.
@@ -315,7 +446,31 @@ class Collection(BaseModel):
         """
         url = URL.format(path=f"collection/{id}")
         item = api.get(url).json()["item"]
-        return cls(**item)
+        return _from_api(cls, api, item)
+
+    @classmethod
+    async def get_async(cls, api: T_AsyncAPI, id: int) -> Collection:
+        """Awaitable version of ``get``, returning a Raindrop Collection instance based on it's id."""
+        url = URL.format(path=f"collection/{id}")
+        item = (await api.get(url)).json()["item"]
+        return _from_api(cls, api, item)
+
+    @staticmethod
+    def _collection_args(
+        cover: list[str] | None = None,
+        expanded: bool | None = None,
+        parent: int | None = None,
+        public: bool | None = None,
+        sort: int | None = None,
+        title: str | None = None,
+        view: View | None = None,
+    ) -> dict[str, Any]:
+        """Return the arguments for a create/update request, ie. only those attribute values actually provided."""
+        args: dict[str, Any] = {}
+        for attr in ["expanded", "view", "title", "sort", "public", "parent", "cover"]:
+            if (value := locals().get(attr)) is not None:
+                args[attr] = value
+        return args
 
     @classmethod
     def create(
@@ -351,25 +506,28 @@ class Collection(BaseModel):
         Returns:
             ``Collection`` instance created.
         """
-        args: dict[str, Any] = {}
-        if cover is not None:
-            args["cover"] = cover
-        if expanded is not None:
-            args["expanded"] = cover
-        if parent is not None:
-            args["parent"] = parent
-        if public is not None:
-            args["public"] = public
-        if sort is not None:
-            args["sort"] = sort
-        if title is not None:
-            args["title"] = title
-        if view is not None:
-            args["view"] = view
-
+        args = cls._collection_args(cover, expanded, parent, public, sort, title, view)
         url = URL.format(path="collection")
         item = api.post(url, json=args).json()["item"]
-        return cls(**item)
+        return _from_api(cls, api, item)
+
+    @classmethod
+    async def create_async(
+        cls,
+        api: T_AsyncAPI,
+        title: str,
+        cover: list[str] | None = None,
+        expanded: bool | None = None,
+        parent: int | None = None,
+        public: bool | None = None,
+        sort: int | None = None,
+        view: View | None = None,
+    ) -> Collection:
+        """Awaitable version of ``create``, creating a new Raindrop collection (see ``create`` for arguments)."""
+        args = cls._collection_args(cover, expanded, parent, public, sort, title, view)
+        url = URL.format(path="collection")
+        item = (await api.post(url, json=args)).json()["item"]
+        return _from_api(cls, api, item)
 
     @classmethod
     def update(
@@ -408,13 +566,29 @@ class Collection(BaseModel):
         Returns:
             Updated ``Collection`` instance.
         """
-        args: dict[str, Any] = {}
-        for attr in ["expanded", "view", "title", "sort", "public", "parent", "cover"]:
-            if (value := locals().get(attr)) is not None:
-                args[attr] = value
+        args = cls._collection_args(cover, expanded, parent, public, sort, title, view)
         url = URL.format(path=f"collection/{id}")
         item = api.put(url, json=args).json()["item"]
-        return cls(**item)
+        return _from_api(cls, api, item)
+
+    @classmethod
+    async def update_async(
+        cls,
+        api: T_AsyncAPI,
+        id: int,
+        cover: list[str] | None = None,
+        expanded: bool | None = None,
+        parent: int | None = None,
+        public: bool | None = None,
+        sort: int | None = None,
+        title: str | None = None,
+        view: View | None = None,
+    ) -> Collection:
+        """Awaitable version of ``update``, updating an existing Raindrop collection (see ``update`` for arguments)."""
+        args = cls._collection_args(cover, expanded, parent, public, sort, title, view)
+        url = URL.format(path=f"collection/{id}")
+        item = (await api.put(url, json=args)).json()["item"]
+        return _from_api(cls, api, item)
 
     @classmethod
     def delete(cls, api: T_API, id: int) -> None:
@@ -429,9 +603,10 @@ class Collection(BaseModel):
             None.
         """
         api.delete(URL.format(path=f"collection/{id}"), json={})
+        api._notify(ChangeEvent.stale, None)  # ie. its Raindrops were moved to the Trash
 
     @classmethod
-    def get_or_create(cls, api: T_API, title: str) -> Collection:
+    def get_or_create(cls, api: T_API, title: str, tree: CollectionTree | None = None) -> Collection:
         """Get a Raindrop collection based on it's **title**, if it doesn't exist, create it.
 
         Args:
@@ -439,16 +614,151 @@ class Collection(BaseModel):
 
             title: Title of the collection.
 
+            tree: Optional, ``CollectionTree`` to look the (root) collection up in (instead of querying Raindrop for
+              the root collections on each call). Collections created are added to it.
+
         Returns:
             Collection with the specified collection title if it already exists or newly created
               collection if it doesn't.
         """
-        for collection in Collection.get_root_collections(api):
+        roots = tree.roots if tree is not None else Collection.get_root_collections(api)
+        for collection in roots:
             if title.casefold() == collection.title.casefold():
                 return collection
 
         # Doesn't exist, create it!
-        return Collection.create(api, title=title)
+        collection = Collection.create(api, title=title)
+        return collection if tree is None else tree.add(collection)
+
+
+class CollectionTree:
+    """In-memory index of the (non-system) Collection hierarchy, ie. the "tree" of root and child Collections.
+
+    Built from a single query of the root & child Collections (see ``CollectionTree.get``), after which all lookups
+    are dictionary hits instead of requests to Raindrop:
+
+    - By id: ``tree[id]`` or ``tree.by_id(id)``.
+
+    - By title (case-insensitive): ``tree.by_title("Python")`` (titles aren't necessarily unique, see ``titled``).
+
+    - By path of titles (case-insensitive): ``tree.by_path("Programming/Python/Packaging")``.
+
+    Along with navigation through ``roots``, ``children``, ``ancestors`` and ``subtree``.
+
+    Note:
+        The tree is a snapshot, changes made to Collections afterwards are **not** reflected (other than those
+        explicitly ``add``-ed, eg. through ``Collection.get_or_create``).
+    """
+
+    SEPARATOR = "/"
+
+    def __init__(self, collections: Iterable[Collection] = ()) -> None:
+        """Index the collections provided."""
+        self._by_id: dict[int, Collection] = {}
+        self._by_title: dict[str, list[int]] = {}
+        self._by_path: dict[str, int] = {}
+        self._children: dict[int | None, list[int]] = {}
+        for collection in collections:
+            self._by_id[collection.id] = collection
+        self._reindex()
+
+    @classmethod
+    def get(cls, api: T_API) -> CollectionTree:
+        """Query Raindrop for all (non-system) Collections and build a tree from them."""
+        return cls(Collection.get_collections(api))
+
+    def _parent_id(self, collection: Collection) -> int | None:
+        """Return the id of a collection's parent, treating those whose parent we don't know of as root collections."""
+        return collection.parent if collection.parent in self._by_id else None
+
+    def _reindex(self) -> None:
+        self._by_title.clear()
+        self._by_path.clear()
+        self._children.clear()
+        for collection in self._by_id.values():
+            self._by_title.setdefault(collection.title.casefold(), []).append(collection.id)
+            self._children.setdefault(self._parent_id(collection), []).append(collection.id)
+        for ids in self._children.values():
+            ids.sort(key=lambda id_: (self._by_id[id_].sort is None, self._by_id[id_].sort))
+        for collection in self.subtree():
+            # Where siblings have the same title, first one (in sort order) wins.
+            self._by_path.setdefault(self.path(collection).casefold(), collection.id)
+
+    def add(self, collection: Collection) -> Collection:
+        """Add (or replace) a collection in the tree, returning it."""
+        self._by_id[collection.id] = collection
+        self._reindex()
+        return collection
+
+    def __len__(self) -> int:
+        """Return the number of collections in the tree."""
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Collection]:
+        """Iterate over all collections in the tree (depth-first, in sort order)."""
+        return self.subtree()
+
+    def __contains__(self, id: int) -> bool:
+        """Return True if a collection with the id provided is in the tree."""
+        return id in self._by_id
+
+    def __getitem__(self, id: int) -> Collection:
+        """Return the collection with the id provided, raising KeyError if it isn't in the tree."""
+        return self._by_id[id]
+
+    def by_id(self, id: int) -> Collection | None:
+        """Return the collection with the id provided, None if it isn't in the tree."""
+        return self._by_id.get(id)
+
+    def titled(self, title: str) -> list[Collection]:
+        """Return all collections (anywhere in the tree) with the title provided (case-insensitive)."""
+        return [self._by_id[id_] for id_ in self._by_title.get(title.casefold(), [])]
+
+    def by_title(self, title: str) -> Collection | None:
+        """Return the first collection (anywhere in the tree) with the title provided (case-insensitive), if any."""
+        ids = self._by_title.get(title.casefold())
+        return self._by_id[ids[0]] if ids else None
+
+    def by_path(self, path: str) -> Collection | None:
+        """Return the collection at the path of titles provided, eg. "Programming/Python" (case-insensitive)."""
+        id_ = self._by_path.get(path.strip(self.SEPARATOR).casefold())
+        return None if id_ is None else self._by_id[id_]
+
+    def path(self, collection: Collection | int) -> str:
+        """Return the path of titles to the collection provided, eg. "Programming/Python"."""
+        collection = self._by_id[_collection_id(collection)]
+        titles = [ancestor.title for ancestor in reversed(self.ancestors(collection))]
+        return self.SEPARATOR.join([*titles, collection.title])
+
+    @property
+    def roots(self) -> list[Collection]:
+        """Return the root (ie. top-level) collections in the tree."""
+        return [self._by_id[id_] for id_ in self._children.get(None, [])]
+
+    def children(self, collection: Collection | int) -> list[Collection]:
+        """Return the immediate children of the collection provided."""
+        return [self._by_id[id_] for id_ in self._children.get(_collection_id(collection), [])]
+
+    def ancestors(self, collection: Collection | int) -> list[Collection]:
+        """Return the ancestors of the collection provided, from its parent up to its root collection."""
+        ret = []
+        parent_id = self._parent_id(self._by_id[_collection_id(collection)])
+        while parent_id is not None and len(ret) < len(self._by_id):  # (guard against cycles)
+            ret.append(self._by_id[parent_id])
+            parent_id = self._parent_id(self._by_id[parent_id])
+        return ret
+
+    def subtree(self, collection: Collection | int | None = None) -> Iterator[Collection]:
+        """Iterate (depth-first) over the collection provided and all its descendants, or the entire tree if None."""
+        stack = list(reversed(self._children.get(None, []))) if collection is None else [_collection_id(collection)]
+        seen: set[int] = set()
+        while stack:
+            id_ = stack.pop()
+            if id_ in seen:
+                continue
+            seen.add(id_)
+            yield self._by_id[id_]
+            stack.extend(reversed(self._children.get(id_, [])))
 
 
 class Group(BaseModel):
@@ -517,7 +827,13 @@ class User(BaseModel):
     def get(cls, api: T_API) -> User:
         """Get all the information about the Raindrop user associated with the API token."""
         user = api.get(URL.format(path="user")).json()["user"]
-        return cls(**user)
+        return _from_api(cls, api, user)
+
+    @classmethod
+    async def get_async(cls, api: T_AsyncAPI) -> User:
+        """Awaitable version of ``get``, returning the Raindrop user associated with the API token."""
+        user = (await api.get(URL.format(path="user"))).json()["user"]
+        return _from_api(cls, api, user)
 
 
 class SystemCollection(BaseModel):
@@ -553,7 +869,7 @@ class SystemCollection(BaseModel):
     def get_counts(cls, api: T_API) -> list[Collection]:
         """Get the count of Raindrops in each of the 3 *system* collections."""
         items = api.get(URL.format(path="user/stats")).json()["items"]
-        return [cls(**item) for item in items]
+        return [_from_api(cls, api, item) for item in items]
 
     @classmethod
     def get_meta(cls, api: T_API) -> dict:
@@ -657,7 +973,57 @@ class Raindrop(BaseModel):
     def get(cls, api: T_API, id: int) -> Raindrop:
         """Return a Raindrop bookmark based on it's id."""
         item = api.get(URL.format(path=f"{id}")).json()["item"]
-        return cls(**item)
+        return _from_api(cls, api, item)
+
+    @classmethod
+    async def get_async(cls, api: T_AsyncAPI, id: int) -> Raindrop:
+        """Awaitable version of ``get``, returning a Raindrop bookmark based on it's id."""
+        item = (await api.get(URL.format(path=f"{id}"))).json()["item"]
+        return _from_api(cls, api, item)
+
+    @staticmethod
+    def _raindrop_args(
+        collection: (Collection | CollectionRef, int) | None = None,
+        cover: str | None = None,
+        excerpt: str | None = None,
+        important: bool | None = None,
+        link: str | None = None,
+        media: list[dict[str, Any]] | None = None,
+        order: int | None = None,
+        please_parse: bool | None = False,
+        tags: list[str] | None = None,
+        title: str | None = None,
+    ) -> dict[str, Any]:
+        """Return the arguments for a create/update request, ie. only those attribute values actually provided.
+
+        Note: The collection is returned in the *reference* form (ie. ``{"$id": id}``), used on creation.
+        """
+        args: dict[str, Any] = {}
+
+        if please_parse:
+            args["please_parse"] = {}
+
+        for attr in [
+            "cover",
+            "excerpt",
+            "important",
+            "link",
+            "media",
+            "order",
+            "tags",
+            "title",
+        ]:
+            if (value := locals().get(attr)) is not None:
+                args[attr] = value
+
+        if collection is not None:
+            # <collection> arg could be **either** an actual collection
+            # or simply an int collection "id" already, handle either:
+            if isinstance(collection, Collection | CollectionRef):
+                args["collection"] = {"$id": collection.id}
+            else:
+                args["collection"] = {"$id": collection}
+        return args
 
     @classmethod
     def create_link(
@@ -711,33 +1077,152 @@ class Raindrop(BaseModel):
         """
         # Setup the args that will be passed to the underlying Raindrop API, only link is
         # absolutely required, rest are optional!
-        args: dict[str, Any] = dict(type=RaindropType.link, link=link)
+        args = dict(type=RaindropType.link) | cls._raindrop_args(
+            collection,
+            cover,
+            excerpt,
+            important,
+            link,
+            media,
+            order,
+            please_parse,
+            tags,
+            title,
+        )
+        url = URL.format(path="raindrop")
+        raindrop = _from_api(cls, api, api.post(url, json=args).json()["item"])
+        api._notify(ChangeEvent.saved, [raindrop])
+        return raindrop
 
-        if please_parse:
-            args["please_parse"] = {}
+    @classmethod
+    async def create_link_async(
+        cls,
+        api: T_AsyncAPI,
+        link: str,
+        collection: (Collection | CollectionRef, int) | None = None,
+        cover: str | None = None,
+        excerpt: str | None = None,
+        important: bool | None = None,
+        media: list[dict[str, Any]] | None = None,
+        order: int | None = None,
+        please_parse: bool = False,
+        tags: list[str] | None = None,
+        title: str | None = None,
+    ) -> Raindrop:
+        """Awaitable version of ``create_link``, creating a link-type Raindrop (see ``create_link`` for arguments)."""
+        args = dict(type=RaindropType.link) | cls._raindrop_args(
+            collection,
+            cover,
+            excerpt,
+            important,
+            link,
+            media,
+            order,
+            please_parse,
+            tags,
+            title,
+        )
+        url = URL.format(path="raindrop")
+        raindrop = _from_api(cls, api, (await api.post(url, json=args)).json()["item"])
+        api._notify(ChangeEvent.saved, [raindrop])
+        return raindrop
 
-        for attr in [
-            "cover",
-            "excerpt",
-            "important",
-            "media",
-            "order",
-            "tags",
-            "title",
-        ]:
-            if (value := locals().get(attr)) is not None:
-                args[attr] = value
+    @classmethod
+    def create_many(
+        cls,
+        api: T_API,
+        items: Iterable[dict[str, Any] | str],
+        collection: (Collection | CollectionRef, int) | None = None,
+        please_parse: bool = False,
+        chunk_size: int = BULK_LIMIT,
+    ) -> BulkCreateResult:
+        """Create many new link-type Raindrop bookmarks, using as few requests as possible.
 
-        if collection is not None:
-            # <collection> arg could be **either** an actual collection
-            # or simply an int collection "id" already, handle either:
-            if isinstance(collection, Collection | CollectionRef):
-                args["collection"] = {"$id": collection.id}
-            else:
-                args["collection"] = {"$id": collection}
-        url = URL.format(path="raindrop")
-        item = api.post(url, json=args).json()["item"]
-        return cls(**item)
+        Items are sent to Raindrop's *bulk* create endpoint, in chunks of up to ``chunk_size`` (max 100) items each.
+
+        Args:
+            api: API Handle to use for the request.
+
+            items: Required, the Raindrops to create. Each is either a link or a dictionary of the same arguments
+              taken by ``create_link``, eg. ``{"link": "https://python.org", "title": "Python", "tags": ["abc"]}``.
+
+            collection: Optional, Collection (or CollectionRef) to place all Raindrops "into" unless an item specifies
+              its own. If not specified, new Raindrops will be in system Collection "Unsorted".
+
+            please_parse: Optional, Flag that asks API to automatically parse metadata of all Raindrops in the
+              background.
+
+            chunk_size: Optional, maximum number of items to send per request.
+
+        Returns:
+            A ``BulkCreateResult`` with the Raindrops created (in input order) and any items that failed.
+
+        Note:
+            If Raindrop rejects a chunk as a whole (ie. a 4xx response), each of its items is retried individually
+            such that only the item(s) actually at fault are reported as failures.
+        """
+        chunk_size = max(1, min(chunk_size, BULK_LIMIT))
+        created: dict[int, Raindrop] = {}
+        failures: list[BulkFailure] = []
+
+        def _create_individually(chunk: list[tuple[int, Any, dict[str, Any]]]) -> None:
+            for index, item, args in chunk:
+                try:
+                    returned = api.post(URL.format(path="raindrop"), json=args).json()["item"]
+                    created[index] = _from_api(cls, api, returned)
+                except (requests.exceptions.RequestException, ValidationError) as exc:
+                    failures.append(BulkFailure(index, item, exc))
+
+        def _create(chunk: list[tuple[int, Any, dict[str, Any]]]) -> None:
+            try:
+                ret = api.post(URL.format(path="raindrops"), json={"items": [args for _, _, args in chunk]})
+            except requests.exceptions.HTTPError as exc:
+                status = exc.response.status_code if exc.response is not None else None
+                if isinstance(status, int) and 400 <= status < 500 and status != 429 and len(chunk) > 1:
+                    _create_individually(chunk)
+                else:
+                    failures.extend(BulkFailure(index, item, exc) for index, item, _ in chunk)
+                return
+            except requests.exceptions.RequestException as exc:
+                failures.extend(BulkFailure(index, item, exc) for index, item, _ in chunk)
+                return
+
+            results = ret.json().get("items") or []
+            for (index, item, _), result in itertools.zip_longest(chunk, results[: len(chunk)]):
+                if result is None:
+                    failures.append(BulkFailure(index, item, ValueError("Raindrop did not return this item")))
+                else:
+                    try:
+                        created[index] = _from_api(cls, api, result)
+                    except ValidationError as exc:
+                        failures.append(BulkFailure(index, item, exc))
+
+        chunk: list[tuple[int, Any, dict[str, Any]]] = []
+        for index, item in enumerate(items):
+            try:
+                kwargs = {"link": item} if isinstance(item, str) else dict(item)
+                kwargs.setdefault("collection", collection)
+                kwargs.setdefault("please_parse", please_parse)
+                if not kwargs.get("link"):
+                    raise ValueError("A link is required for each Raindrop")
+                args = dict(type=RaindropType.link) | cls._raindrop_args(**kwargs)
+            except (TypeError, ValueError) as exc:
+                failures.append(BulkFailure(index, item, exc))
+                continue
+            chunk.append((index, item, args))
+            if len(chunk) == chunk_size:
+                _create(chunk)
+                chunk = []
+        if chunk:
+            _create(chunk)
+
+        result = BulkCreateResult(
+            [created[index] for index in sorted(created)],
+            sorted(failures, key=lambda failure: failure.index),
+        )
+        if result.created:
+            api._notify(ChangeEvent.saved, result.created)
+        return result
 
     @classmethod
     def create_file(
@@ -748,6 +1233,8 @@ class Raindrop(BaseModel):
         collection: (Collection | CollectionRef, int) | None = CollectionRef.Unsorted,
         tags: list[str] | None = None,
         title: str | None = None,
+        progress: T_Progress | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> Raindrop:
         """Create a new file-based Raindrop bookmark.
 
@@ -765,10 +1252,18 @@ class Raindrop(BaseModel):
 
             title: Optional, Title to associated with this Raindrop.
 
+            progress: Optional, callable given an ``UploadProgress`` (bytes sent, total and throughput) after each
+              chunk of the file is sent.
+
+            chunk_size: Optional, bytes of the file read (and sent) at a time when streaming.
+
         Returns:
             ``Raindrop`` instance created.
 
         Note:
+            Files larger than ``upload.STREAM_THRESHOLD`` (or any file when a progress callback is provided) are
+            streamed from disk a chunk at a time, rather than encoded in memory (see ``raindropiopy.upload``).
+
             Only a limited number of file-types are supported by RaindropIO (minimally, "application/pdf"),
             specifically (as of 2023-02):
 
@@ -780,20 +1275,7 @@ class Raindrop(BaseModel):
 
             - Documents (pdf, md, txt)
         """
-        # Uses a different URL for file uploading..
-        url = URL.format(path="raindrop/file")
-
-        # NOTE: "put_file" arguments and structure here confirmed through communication
-        #       with RustemM on 2022-11-29 and his subsequent update to API docs.
-        if isinstance(collection, Collection | CollectionRef):
-            data = {"collectionId": str(collection.id)}
-        else:
-            data = {"collectionId": str(collection)}
-
-        with open(path, "rb") as fh_:
-            files = {"file": (path.name, fh_, content_type)}
-            item = api.put_file(url, path, data, files).json()["item"]
-            raindrop = cls(**item)
+        raindrop = cls._upload_file(api, path, content_type, collection, progress, chunk_size)
 
         # Raindrop's "Create Raindrop From File" does not allow us to set other attributes,
         # thus, we need to check if any of the possible attributes need to be set and do so
@@ -806,10 +1288,163 @@ class Raindrop(BaseModel):
         if args:
             url = URL.format(path=f"raindrop/{raindrop.id}")
             item = api.put(url, json=args).json()["item"]
-            return cls(**item)
+            raindrop = _from_api(cls, api, item)
+        api._notify(ChangeEvent.saved, [raindrop])
+        return raindrop
+
+    @classmethod
+    def _upload_file(
+        cls,
+        api: T_API,
+        path: Path,
+        content_type: str,
+        collection: (Collection | CollectionRef, int) | None,
+        progress: T_Progress | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Raindrop:
+        """Upload a file, returning the Raindrop created for it (see ``create_file``)."""
+        # Uses a different URL for file uploading..
+        url = URL.format(path="raindrop/file")
+
+        # NOTE: "put_file" arguments and structure here confirmed through communication
+        #       with RustemM on 2022-11-29 and his subsequent update to API docs.
+        if isinstance(collection, Collection | CollectionRef):
+            data = {"collectionId": str(collection.id)}
         else:
+            data = {"collectionId": str(collection)}
+
+        if progress is not None or path.stat().st_size > STREAM_THRESHOLD:
+            upload = MultipartUpload(path, data, content_type=content_type, chunk_size=chunk_size, progress=progress)
+            item = api.put_upload(url, upload).json()["item"]
+        else:
+            with open(path, "rb") as fh_:
+                files = {"file": (path.name, fh_, content_type)}
+                item = api.put_file(url, path, data, files).json()["item"]
+        return _from_api(cls, api, item)
+
+    @classmethod
+    def create_files(
+        cls,
+        api: T_API,
+        paths: Iterable[Path | str],
+        collection: (Collection | CollectionRef, int) = CollectionRef.Unsorted,
+        content_type: str | None = None,
+        tags: list[str] | None = None,
+        concurrency: int = 4,
+        manifest: UploadManifest | None = None,
+    ) -> BulkUploadResult:
+        """Create many new file-based Raindrop bookmarks, uploading files in parallel and skipping duplicates.
+
+        Each file's content is hashed (SHA-256) first: files whose content was uploaded already, as recorded in the
+        ``manifest`` or by another path of this upload, are skipped. The others are uploaded ``concurrency`` at a time
+        (streamed from disk if large, see ``create_file``) and recorded in the manifest once created, ie. as each
+        completes or, with ``tags``, once they're set, such that an interrupted upload can simply be run again.
+
+        Errors are reported per file in the result's ``failures`` rather than raised, including a failure to set the
+        tags (in which case none of the files are recorded, ie. running again uploads and tags them again).
+
+        Args:
+            api: API Handle to use for the requests (with a ``pool_maxsize`` of at least ``concurrency``).
+
+            paths: Required, the files to be uploaded.
+
+            collection: Optional, Collection (or CollectionRef) to place all Raindrops "into". If not specified, new
+              Raindrops will be in system Collection *Unsorted*.
+
+            content_type: Optional, mime-type of all the files, by default guessed from each file's name.
+
+            tags: Optional, List of tags to associate with all Raindrops created, set with a single bulk update (per
+              100 Raindrops) once all files are uploaded.
+
+            concurrency: Optional, maximum number of files hashed (and uploaded) at the same time.
+
+            manifest: Optional, record of the files uploaded previously (and to which those uploaded are added).
+
+        Returns:
+            A ``BulkUploadResult`` with the Raindrops created (in input order), the paths skipped and any that failed.
+        """
+        paths = [Path(path) for path in paths]
+        failures: list[BulkFailure] = []
+
+        def _hash(path: Path) -> str | Exception:
+            try:
+                return file_sha256(path)
+            except OSError as exc:
+                return exc
+
+        # Hash everything first, such that we know of duplicates *within* this upload before sending anything.
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            digests = list(executor.map(_hash, paths))
+
+        skipped: dict[Path, int] = {}
+        duplicates: dict[str, list[int]] = {}  # ie. indices of paths with the same content as one being uploaded.
+        pending: list[tuple[int, str]] = []
+        for index, (path, digest) in enumerate(zip(paths, digests, strict=True)):
+            if isinstance(digest, Exception):
+                failures.append(BulkFailure(index, path, digest))
+            elif manifest is not None and (raindrop_id := manifest.get(digest)) is not None:
+                skipped[path] = raindrop_id
+            elif digest in duplicates:
+                duplicates[digest].append(index)
+            else:
+                duplicates[digest] = []
+                pending.append((index, digest))
+
+        def _fail(index: int, exc: Exception) -> None:
+            failures.extend(BulkFailure(dup, paths[dup], exc) for dup in [index, *duplicates[digests[index]]])
+
+        def _record(index: int, raindrop: Raindrop) -> None:
+            if manifest is not None:
+                manifest.add(digests[index], raindrop.id, paths[index])
+
+        def _upload(index: int) -> Raindrop | Exception:
+            # Any error is returned (not raised), ie. it fails this file alone, not those uploaded alongside.
+            path = paths[index]
+            try:
+                type_ = content_type or mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+                raindrop = cls._upload_file(api, path, type_, collection)
+                if tags is None:
+                    _record(index, raindrop)
+            except Exception as exc:
+                return exc
             return raindrop
 
+        created: dict[int, Raindrop] = {}
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            indices = [index for index, _ in pending]
+            for index, outcome in zip(indices, executor.map(_upload, indices), strict=True):
+                if isinstance(outcome, Exception):
+                    _fail(index, outcome)
+                else:
+                    created[index] = outcome
+
+        if created and tags is not None:
+            # Raindrop's file upload doesn't take tags, set them on all Raindrops at once rather than one at a time.
+            try:
+                cls.update_many(api, CollectionRef.All, ids=[raindrop.id for raindrop in created.values()], tags=tags)
+            except Exception as exc:
+                for index in created:
+                    _fail(index, exc)
+                created = {}
+            for index, raindrop in list(created.items()):
+                raindrop.tags = list(tags)
+                try:
+                    _record(index, raindrop)
+                except Exception as exc:
+                    _fail(index, exc)
+                    del created[index]
+
+        for index, raindrop in created.items():
+            skipped.update((paths[dup], raindrop.id) for dup in duplicates[digests[index]])
+        result = BulkUploadResult(
+            [created[index] for index in sorted(created)],
+            skipped,
+            sorted(failures, key=lambda failure: failure.index),
+        )
+        if result.created:
+            api._notify(ChangeEvent.saved, result.created)
+        return result
+
     @classmethod
     def update(
         cls,
@@ -858,36 +1493,112 @@ class Raindrop(BaseModel):
         Returns:
             ``Raindrop`` instance that was updated.
         """
-        # Setup the args that will be passed to the underlying Raindrop API
-        args: dict[str, Any] = {}
+        args = cls._update_args(collection, cover, excerpt, important, link, media, order, please_parse, tags, title)
+        url = URL.format(path=f"raindrop/{id}")
+        raindrop = _from_api(cls, api, api.put(url, json=args).json()["item"])
+        api._notify(ChangeEvent.saved, [raindrop])
+        return raindrop
 
-        if please_parse:
-            args["please_parse"] = {}
+    @classmethod
+    async def update_async(
+        cls,
+        api: T_AsyncAPI,
+        id: int,
+        collection: (Collection | CollectionRef, int) | None = None,
+        cover: str | None = None,
+        excerpt: str | None = None,
+        important: bool | None = None,
+        link: str | None = None,
+        media: list[dict[str, Any]] | None = None,
+        order: int | None = None,
+        please_parse: bool | None = False,
+        tags: list[str] | None = None,
+        title: str | None = None,
+    ) -> Raindrop:
+        """Awaitable version of ``update``, updating an existing Raindrop bookmark (see ``update`` for arguments)."""
+        args = cls._update_args(collection, cover, excerpt, important, link, media, order, please_parse, tags, title)
+        url = URL.format(path=f"raindrop/{id}")
+        raindrop = _from_api(cls, api, (await api.put(url, json=args)).json()["item"])
+        api._notify(ChangeEvent.saved, [raindrop])
+        return raindrop
 
-        for attr in [
-            "cover",
-            "excerpt",
-            "important",
-            "link",
-            "media",
-            "order",
-            "tags",
-            "title",
-        ]:
+    @classmethod
+    def _update_args(cls, *args: Any) -> dict[str, Any]:
+        """Return the arguments for an update request; unlike creation, the collection is sent as a bare id."""
+        ret = cls._raindrop_args(*args)
+        if "collection" in ret:
+            ret["collection"] = ret["collection"]["$id"]
+        return ret
+
+    @classmethod
+    def update_many(
+        cls,
+        api: T_API,
+        collection: Collection | CollectionRef | int,
+        ids: list[int] | None = None,
+        search: str | None = None,
+        nested: bool = False,
+        cover: str | None = None,
+        important: bool | None = None,
+        media: list[dict[str, Any]] | None = None,
+        move_to: Collection | CollectionRef | int | None = None,
+        tags: list[str] | None = None,
+    ) -> int:
+        """Update many Raindrop bookmarks in a collection at once (without having to retrieve them first).
+
+        By default, *all* Raindrops in the collection are updated, use either (or both) of ``ids`` and ``search`` to
+        limit the Raindrops updated.
+
+        Args:
+            api: API Handle to use for the request.
+
+            collection: Required, Collection (or CollectionRef or collection id) holding the Raindrops to be updated,
+                use ``CollectionRef.All`` to update Raindrops in *any* collection.
+
+            ids: Optional, only update the Raindrops with these ids.
+
+            search: Optional, only update the Raindrops matching this search string (see ``search``).
+
+            nested: Optional, also update the Raindrops in the collection's sub-collections.
+
+            cover: Optional, new URL to set as the Raindrops' "cover" (use "<screenshot>" for a screenshot).
+
+            important: Optional, Flag to mark (or unmark) the Raindrops as important nee a favorite.
+
+            media: Optional, new list of media dictionaries for the Raindrops.
+
+            move_to: Optional, Collection (or CollectionRef or collection id) to move the Raindrops "into".
+
+            tags: Optional, tags to **add** to the Raindrops (an empty list *removes* all their tags instead).
+
+        Returns:
+            The number of Raindrops updated (as reported by Raindrop).
+        """
+        args: dict[str, Any] = {}
+        for attr in ["cover", "important", "media", "tags"]:
             if (value := locals().get(attr)) is not None:
                 args[attr] = value
+        if move_to is not None:
+            args["collection"] = {"$id": _collection_id(move_to)}
 
-        if collection is not None:
-            # <collection> arg could be **either** an actual collection
-            # or simply an int collection "id" already, handle either:
-            if isinstance(collection, Collection | CollectionRef):
-                args["collection"] = collection.id
-            else:
-                args["collection"] = collection
-
-        url = URL.format(path=f"raindrop/{id}")
-        item = api.put(url, json=args).json()["item"]
-        return cls(**item)
+        params: dict[str, Any] = {}
+        if search:
+            params["search"] = search
+        if nested:
+            params["nested"] = "true"
+
+        url = URL.format(path=f"raindrops/{_collection_id(collection)}")
+        if ids is None:
+            modified = api.put(url, json=args, params=params).json().get("modified", 0)
+            api._notify(ChangeEvent.stale, None)
+            return modified
+
+        modified = 0
+        for start in range(0, len(ids), BULK_LIMIT):
+            chunk = args | {"ids": list(ids[start : start + BULK_LIMIT])}
+            modified += api.put(url, json=chunk, params=params).json().get("modified", 0)
+        api._notify(ChangeEvent.stale, list(ids))
+        return modified
 
     @classmethod
     def delete(cls, api: T_API, id: int) -> None:
@@ -902,6 +1613,105 @@ class Raindrop(BaseModel):
             None.
         """
         api.delete(URL.format(path=f"raindrop/{id}"), json={})
+        api._notify(ChangeEvent.deleted, [id])
+
+    @classmethod
+    async def delete_async(cls, api: T_AsyncAPI, id: int) -> None:
+        """Awaitable version of ``delete``, deleting a Raindrop bookmark."""
+        await api.delete(URL.format(path=f"raindrop/{id}"), json={})
+        api._notify(ChangeEvent.deleted, [id])
+
+    @classmethod
+    def delete_many(
+        cls,
+        api: T_API,
+        collection: Collection | CollectionRef | int,
+        ids: list[int] | None = None,
+        search: str | None = None,
+    ) -> int:
+        """Delete many Raindrop bookmarks in a collection at once.
+
+        Raindrops are moved to the *Trash* collection; deleting Raindrops *from* ``CollectionRef.Trash`` removes
+        them permanently.
+
+        Warning:
+            If neither ``ids`` nor ``search`` are provided, **all** Raindrops in the collection are deleted
+            (eg. ``Raindrop.delete_many(api, CollectionRef.Trash)`` empties the Trash).
+
+        Args:
+            api: API Handle to use for the request.
+
+            collection: Required, Collection (or CollectionRef or collection id) holding the Raindrops to be deleted.
+
+            ids: Optional, only delete the Raindrops with these ids (sent in chunks of up to 100 ids per request).
+
+            search: Optional, only delete the Raindrops matching this search string (see ``search``).
+
+        Returns:
+            The number of Raindrops deleted (as reported by Raindrop).
+        """
+        params = {"search": search} if search else None
+        url = URL.format(path=f"raindrops/{_collection_id(collection)}")
+        if ids is None:
+            modified = api.delete(url, json={}, params=params).json().get("modified", 0)
+            api._notify(ChangeEvent.stale, None)
+            return modified
+
+        modified = 0
+        for start in range(0, len(ids), BULK_LIMIT):
+            chunk = {"ids": list(ids[start : start + BULK_LIMIT])}
+            modified += api.delete(url, json=chunk, params=params).json().get("modified", 0)
+        if search:  # ie. only those of the ids that matched the search were deleted, we don't know which.
+            api._notify(ChangeEvent.stale, list(ids))
+        else:
+            api._notify(ChangeEvent.deleted, list(ids))
+        return modified
+
+    @staticmethod
+    def _search_request(
+        collection: Collection | CollectionRef,
+        search: str | None,
+        page: int,
+        perpage: int,
+        sort: RaindropSort | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Return the url and query parameters for a single page of search results."""
+        params = {"perpage": perpage, "page": page}
+        if search:
+            params["search"] = search
+        if sort:
+            params["sort"] = sort.value
+        return URL.format(path=f"raindrops/{collection.id}"), params
+
+    @classmethod
+    def _search_page(
+        cls,
+        api: T_API,
+        collection: Collection | CollectionRef = CollectionRef.All,
+        search: str | None = None,
+        page: int = 0,
+        perpage: int = SEARCH_PERPAGE,
+        sort: RaindropSort | None = None,
+    ) -> dict[str, Any]:
+        """Return the raw JSON response for a single page of search results (ie. with "items" and "count" keys)."""
+        url, params = cls._search_request(collection, search, page, perpage, sort)
+        return api.get(url, params=params).json()
+
+    @classmethod
+    def _from_items(
+        cls,
+        api: T_API | T_AsyncAPI,
+        items: list[dict[str, Any]],
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> list[Raindrop] | list[LazyRaindrop]:
+        """Return the Raindrops for the items of a page of search results, projected and/or as lazy views."""
+        if fields is not None:
+            project = _projection(cls, fields)
+            items = [project(item) for item in items]
+        if lazy:
+            return [LazyRaindrop(item) for item in items]
+        return [_from_api(cls, api, item) for item in items]
 
     @classmethod
     def _search_paged(
@@ -910,20 +1720,19 @@ class Raindrop(BaseModel):
         collection: CollectionRef = CollectionRef.All,
         search: str | None = None,
         page: int = 0,
-        perpage: int = 50,
-    ) -> list[Raindrop]:
+        perpage: int = SEARCH_PERPAGE,
+        sort: RaindropSort | None = None,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> list[Raindrop] | list[LazyRaindrop]:
         """Lower-level search for bookmarks on a "paged" basis.
 
         Raindrop's search API works on a "paged" basis. This method implements the underlying
         search reflecting paging (while the primary ``search`` method below hides it
         completely).
         """
-        params = {"perpage": perpage, "page": page}
-        if search:
-            params["search"] = search
-        url = URL.format(path=f"raindrops/{collection.id}")
-        results = api.get(url, params=params).json()
-        return [cls(**item) for item in results["items"]]
+        results = cls._search_page(api, collection, search, page, perpage, sort)
+        return cls._from_items(api, results["items"], lazy, fields)
 
     @classmethod
     def search(
@@ -931,7 +1740,11 @@ class Raindrop(BaseModel):
         api: T_API,
         collection: Collection | CollectionRef = CollectionRef.All,
         search: str | None = None,
-    ) -> list[Raindrop]:
+        concurrency: int = 1,
+        sort: RaindropSort | None = None,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> list[Raindrop] | list[LazyRaindrop]:
         """Search for Raindrops.
 
         Args:
@@ -943,28 +1756,224 @@ class Raindrop(BaseModel):
             search: Optional, search string to search Raindrops for (see
                 `Raindrop.io Search Help <https://help.raindrop.io/using-search#operators>`_ for more information.
 
+            concurrency: Optional, maximum number of pages to request from Raindrop at the same time. Once the first
+                page has told us the total number of matching Raindrops, the remaining pages are fetched in parallel
+                using this many threads (results are always returned in page order). Defaults to 1, ie. sequentially.
+
+            sort: Optional, order in which to return the Raindrops (otherwise, Raindrop's default order).
+
+            lazy: Optional, return ``LazyRaindrop`` views instead, converting each attribute only when first accessed
+                (cheaper when only a few attributes of each Raindrop are used). Defaults to False.
+
+            fields: Optional, names of the only attributes to decode and keep on each Raindrop, eg.
+                ``["id", "link", "last_update"]`` (all others are left at their defaults, "other" included unless
+                named). Defaults to all attributes.
+
         Returns:
             A (potentially empty) list of Raindrops that match the search criteria provided.
+
+        Raises:
+            ValueError: If ``fields`` names an attribute that isn't one of Raindrop's.
         """
-        page = 0
-        results = list()
-        while raindrops := Raindrop._search_paged(
-            api,
-            collection,
-            page=page,
-            search=search,
-        ):
+        if fields is not None:
+            fields = list(fields)
+            _projection(cls, fields)  # ie. report unknown fields before making any request.
+        first = cls._search_page(api, collection, search, sort=sort)
+        results = cls._from_items(api, first["items"], lazy, fields)
+
+        if (num_pages := _num_pages(first)) is None:
+            # No count returned, fall back to paging until we get an empty page back.
+            page = 1
+            while raindrops := cls._search_paged(
+                api, collection, search=search, page=page, sort=sort, lazy=lazy, fields=fields
+            ):
+                results.extend(raindrops)
+                page += 1
+            return results
+
+        def _fetch(page: int) -> list[Raindrop] | list[LazyRaindrop]:
+            return cls._search_paged(api, collection, search=search, page=page, sort=sort, lazy=lazy, fields=fields)
+
+        if concurrency > 1 and num_pages > 2:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for raindrops in executor.map(_fetch, range(1, num_pages)):
+                    results.extend(raindrops)
+        else:
+            for page in range(1, num_pages):
+                results.extend(_fetch(page))
+        return results
+
+    @classmethod
+    def _iter_search_pages(
+        cls,
+        api: T_API,
+        collection: Collection | CollectionRef = CollectionRef.All,
+        search: str | None = None,
+        prefetch: bool = True,
+        sort: RaindropSort | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the raw JSON response of each page of search results, in order.
+
+        If prefetch is set, the request for the *next* page is issued in a background thread as soon as the current
+        page is available, such that fetching the next page overlaps with whatever the caller does with the current
+        one (ie. at most two pages are ever held at once).
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        def _request(page: int) -> Callable[[], dict[str, Any]]:
+            """Return a callable for the page's results, its request already underway if prefetching (else deferred)."""
+            if executor:
+                return executor.submit(cls._search_page, api, collection, search, page, SEARCH_PERPAGE, sort).result
+            return functools.partial(cls._search_page, api, collection, search, page, SEARCH_PERPAGE, sort)
+
+        try:
+            page, pending = 0, _request(0)
+            while True:
+                results = pending()
+                if not results["items"]:
+                    return
+                num_pages = _num_pages(results)
+                more = num_pages is None or page + 1 < num_pages
+                if more:
+                    pending = _request(page + 1)
+                yield results
+                if not more:
+                    return
+                page += 1
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def iter_search(
+        cls,
+        api: T_API,
+        collection: Collection | CollectionRef = CollectionRef.All,
+        search: str | None = None,
+        prefetch: bool = True,
+        sort: RaindropSort | None = None,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[Raindrop] | Iterator[LazyRaindrop]:
+        """Search for Raindrops, yielding them one at a time instead of returning them all at once.
+
+        Unlike ``search``, only the current (and next) page of results is held in memory at any time, making
+        this the better choice for processing very large collections.
+
+        Args:
+            api: API Handle to use for the request.
+
+            collection: Optional, ``Collection`` (or ``CollectionRef``) to search over.
+                Defaults to ``CollectionRef.All``.
+
+            search: Optional, search string to search Raindrops for (see ``search``).
+
+            prefetch: Optional, request the next page of results in the background while the current page is being
+                consumed. Defaults to True.
+
+            sort: Optional, order in which to return the Raindrops (otherwise, Raindrop's default order).
+
+            lazy: Optional, yield ``LazyRaindrop`` views instead (see ``search``). Defaults to False.
+
+            fields: Optional, names of the only attributes to decode and keep on each Raindrop (see ``search``).
+
+        Returns:
+            An iterator over the Raindrops that match the search criteria provided.
+        """
+        if fields is not None:
+            fields = list(fields)
+        for results in cls._iter_search_pages(api, collection, search, prefetch, sort):
+            yield from cls._from_items(api, results["items"], lazy, fields)
+
+    @classmethod
+    async def _search_paged_async(
+        cls,
+        api: T_AsyncAPI,
+        collection: CollectionRef = CollectionRef.All,
+        search: str | None = None,
+        page: int = 0,
+        perpage: int = SEARCH_PERPAGE,
+        sort: RaindropSort | None = None,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> list[Raindrop] | list[LazyRaindrop]:
+        """Awaitable version of ``_search_paged``."""
+        url, params = cls._search_request(collection, search, page, perpage, sort)
+        results = (await api.get(url, params=params)).json()
+        return cls._from_items(api, results["items"], lazy, fields)
+
+    @classmethod
+    async def search_async(
+        cls,
+        api: T_AsyncAPI,
+        collection: Collection | CollectionRef = CollectionRef.All,
+        search: str | None = None,
+        concurrency: int = 1,
+        sort: RaindropSort | None = None,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> list[Raindrop] | list[LazyRaindrop]:
+        """Awaitable version of ``search``, searching for Raindrops (see ``search`` for arguments)."""
+        if fields is not None:
+            fields = list(fields)
+            _projection(cls, fields)  # ie. report unknown fields before making any request.
+        url, params = cls._search_request(collection, search, 0, SEARCH_PERPAGE, sort)
+        first = (await api.get(url, params=params)).json()
+        results = cls._from_items(api, first["items"], lazy, fields)
+
+        async def _fetch(page: int) -> list[Raindrop] | list[LazyRaindrop]:
+            return await cls._search_paged_async(
+                api, collection, search=search, page=page, sort=sort, lazy=lazy, fields=fields
+            )
+
+        if (num_pages := _num_pages(first)) is None:
+            page = 1
+            while raindrops := await _fetch(page):
+                results.extend(raindrops)
+                page += 1
+            return results
+
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def _fetch_limited(page: int) -> list[Raindrop] | list[LazyRaindrop]:
+            async with semaphore:
+                return await _fetch(page)
+
+        for raindrops in await asyncio.gather(*[_fetch_limited(page) for page in range(1, num_pages)]):
             results.extend(raindrops)
-            page += 1
         return results
 
 
+class LazyRaindrop(LazyModel):
+    """Read-only view of a Raindrop from a search, converting each attribute only when it's first accessed.
+
+    Returned by the search methods when called with ``lazy=True``, attributes are the same as ``Raindrop``'s (eg.
+    ``view.link`` is a parsed url, ``view.created`` a datetime). Use ``materialize`` for the full ``Raindrop``, eg. to
+    update it.
+    """
+
+    model = Raindrop
+    __slots__ = ()
+
+    def materialize(self) -> Raindrop:
+        """Return the full Raindrop for this view."""
+        return decode(Raindrop, self._item)
+
+
 class Tag(BaseModel):
     """Represents existing Tags, either all or just a specific collection."""
 
     tag: str = Field(None, alias="_id")
     count: int
 
+    @staticmethod
+    def _url(collection_id: int | None = None) -> str:
+        """Return the url for tag requests, either across all collections or limited to a specific one."""
+        url = URL.format(path="tags")
+        if collection_id:
+            url += "/" + str(collection_id)
+        return url
+
     @classmethod
     def get(cls, api: T_API, collection_id: int | None = None) -> list[Tag]:
         """Get all the tags currently defined, either in a specific collections or across all collections.
@@ -977,22 +1986,65 @@ class Tag(BaseModel):
         Returns:
             List of ``Tag``.
         """
-        url = URL.format(path="tags")
-        if collection_id:
-            url += "/" + str(collection_id)
-        items = api.get(url).json()["items"]
-        return [Tag(**item) for item in items]
+        items = api.get(cls._url(collection_id)).json()["items"]
+        return [_from_api(cls, api, item) for item in items]
 
     @classmethod
-    def delete(cls, api: T_API, tags: list[str]) -> None:
-        """Delete one or more Tags.
+    async def get_async(cls, api: T_AsyncAPI, collection_id: int | None = None) -> list[Tag]:
+        """Awaitable version of ``get``, getting all the tags currently defined (see ``get`` for arguments)."""
+        items = (await api.get(cls._url(collection_id))).json()["items"]
+        return [_from_api(cls, api, item) for item in items]
+
+    @classmethod
+    def delete(cls, api: T_API, tags: list[str], collection_id: int | None = None) -> None:
+        """Delete one or more Tags (ie. remove them from every Raindrop they're associated with).
 
         Args:
             api: API Handle to use for the request.
 
             tags: List of tags to be deleted.
 
+            collection_id: Optional, Id of specific collection to limit the deletion to (otherwise, all collections).
+
+        Returns:
+            None.
+        """
+        api.delete(cls._url(collection_id), json={"tags": list(tags)})
+        api._notify(ChangeEvent.stale, None)
+
+    @classmethod
+    def rename(cls, api: T_API, tag: str, new_tag: str, collection_id: int | None = None) -> None:
+        """Rename a Tag on every Raindrop it's associated with.
+
+        Args:
+            api: API Handle to use for the request.
+
+            tag: Existing tag to be renamed.
+
+            new_tag: New name for the tag.
+
+            collection_id: Optional, Id of specific collection to limit the rename to (otherwise, all collections).
+
+        Returns:
+            None.
+        """
+        cls.merge(api, [tag], new_tag, collection_id)
+
+    @classmethod
+    def merge(cls, api: T_API, tags: list[str], new_tag: str, collection_id: int | None = None) -> None:
+        """Merge one or more Tags into a single (new or existing) Tag on every Raindrop they're associated with.
+
+        Args:
+            api: API Handle to use for the request.
+
+            tags: List of existing tags to be merged.
+
+            new_tag: Tag to replace all of them with.
+
+            collection_id: Optional, Id of specific collection to limit the merge to (otherwise, all collections).
+
         Returns:
             None.
         """
-        api.delete(URL.format(path="tags"), json={})
+        api.put(cls._url(collection_id), json={"replace": new_tag, "tags": list(tags)})
+        api._notify(ChangeEvent.stale, None)
@@ -0,0 +1,222 @@
+"""Local evaluation of Raindrop's search syntax against Raindrops already in hand.
+
+``Raindrop.search(api, search=...)`` has Raindrop evaluate a query server-side. The same query string can instead be
+compiled once into a ``Query`` and evaluated locally, eg. to re-filter Raindrops held in memory (or in a ``Mirror``)
+on every refinement of a dashboard without any further request to Raindrop:
+
+>>> query = Query('#python -#archived domain:github.com created:>2023-01 "type hints"')
+>>> matching = list(query.filter(raindrops))
+
+Supported syntax (combine terms with spaces, all must match unless ``match:or`` is used):
+
+- ``word`` and ``"a phrase"``: case-insensitive match anywhere in a Raindrop's title, excerpt, tags, domain or link.
+- ``#tag`` and ``#"multi word tag"``: Raindrop has this tag (case-insensitive).
+- ``domain:example.com``: Raindrop's domain is (or is a sub-domain of) example.com.
+- ``type:article``: Raindrop is of this type (see ``RaindropType``).
+- ``created:2023-01-31``, ``created:>2023-01``, ``lastUpdate:<=2023``: Raindrop was created (or last updated) on, after,
+  before etc. a day, month or year (``>``, ``>=``, ``<``, ``<=``).
+- ``important:true``, ``broken:true``, ``notag:true``: Raindrop is (or with ``false``, isn't) a favourite, broken or
+  without any tags.
+- ``-term``: Raindrop does **not** match the term, eg. ``-#archived`` or ``-"a phrase"``.
+- ``match:or``: Raindrop matches *any* of the terms instead of all of them.
+
+Anything else with a colon (eg. ``https://example.com``) is treated as a plain word.
+"""
+from __future__ import annotations
+
+import calendar
+import datetime
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import NamedTuple
+
+from .models import Raindrop, RaindropType
+
+__all__ = [
+    "Query",
+    "Term",
+    "parse",
+]
+
+_TERM = re.compile(
+    r"""
+    (?P<negated>-)?
+    (?:(?P<key>[A-Za-z]+):(?P<op>>=|<=|>|<)?|(?P<tag>\#))?
+    (?:"(?P<phrase>[^"]*)"?|(?P<word>\S+))
+    """,
+    re.VERBOSE,
+)
+
+_DATE = re.compile(r"(?P<year>\d{4})(?:-(?P<month>\d{1,2})(?:-(?P<day>\d{1,2}))?)?$")
+
+_BOOLEANS = {"true": True, "false": False}
+
+# Operators keys above take (ie. any other "key:" is simply part of a word), keyed by their casefolded form.
+_KEYS = {"domain", "type", "created", "lastupdate", "important", "broken", "notag", "match"}
+
+T_Predicate = Callable[[Raindrop, Callable[[], str]], bool]
+
+
+class Term(NamedTuple):
+    """A single term of a parsed query.
+
+    Attributes:
+        key: The (casefolded) operator, eg. "domain", "#" for a tag or None for plain words and phrases.
+        op: Comparison for date operators (ie. one of "=", ">", ">=", "<", "<="), otherwise "=".
+        value: The value to match, eg. the tag, the domain or the word itself.
+        negated: True if the term was prefixed by "-", ie. Raindrops must *not* match it.
+    """
+
+    key: str | None
+    op: str
+    value: str
+    negated: bool
+
+
+def parse(query: str) -> list[Term]:
+    """Split a query string into its terms (see ``Query`` for the syntax supported)."""
+    terms = []
+    for match in _TERM.finditer(query):
+        value = match["phrase"] if match["phrase"] is not None else match["word"]
+        key = match["key"].casefold() if match["key"] else ("#" if match["tag"] else None)
+        if key is not None and key != "#" and key not in _KEYS:
+            # ie. not an operator after all, just a word with a colon in it (eg. a url).
+            value, key = f"{match['key']}:{match['op'] or ''}{value}", None
+        if key is None and match["phrase"] is None and not value:
+            continue
+        terms.append(Term(key, match["op"] or "=", value, bool(match["negated"])))
+    return terms
+
+
+def _period(value: str) -> tuple[datetime.date, datetime.date]:
+    """Return the first and last day of the day, month or year provided (ie. "2023-01-31", "2023-01" or "2023")."""
+    if not (match := _DATE.match(value)):
+        raise ValueError(f"Invalid date '{value}' in query, expected YYYY, YYYY-MM or YYYY-MM-DD")
+    year, month, day = int(match["year"]), match["month"], match["day"]
+    if day is not None:
+        date = datetime.date(year, int(month), int(day))
+        return date, date
+    if month is not None:
+        month = int(month)
+        return datetime.date(year, month, 1), datetime.date(year, month, calendar.monthrange(year, month)[1])
+    return datetime.date(year, 1, 1), datetime.date(year, 12, 31)
+
+
+def _boolean(term: Term) -> bool:
+    try:
+        return _BOOLEANS[term.value.casefold()]
+    except KeyError:
+        raise ValueError(f"Invalid value '{term.value}' for '{term.key}:' in query, expected true or false") from None
+
+
+def _text(raindrop: Raindrop) -> str:
+    """Return all the searchable text of a Raindrop, casefolded, for word and phrase terms."""
+    parts = [raindrop.title, raindrop.excerpt, raindrop.domain, str(raindrop.link or ""), *(raindrop.tags or [])]
+    return "\n".join(part for part in parts if part).casefold()
+
+
+def _compile(term: Term) -> T_Predicate:
+    """Return a predicate for a single (non-negated) term, called with a Raindrop and a getter of its text."""
+    key, value = term.key, term.value
+    if key is None:
+        if not value:  # ie. an empty phrase, '""', would otherwise match every Raindrop.
+            raise ValueError("Invalid empty phrase '\"\"' in query")
+        needle = value.casefold()
+        return lambda raindrop, text: needle in text()
+
+    if key == "#":
+        tag = value.casefold()
+        return lambda raindrop, text: any(tag == candidate.casefold() for candidate in raindrop.tags or [])
+
+    if key == "domain":
+        domain = value.casefold()
+        subdomain = "." + domain
+
+        def _domain(raindrop: Raindrop, text: Callable[[], str]) -> bool:
+            candidate = (raindrop.domain or "").casefold()
+            return candidate == domain or candidate.endswith(subdomain)
+
+        return _domain
+
+    if key == "type":
+        try:
+            type_ = RaindropType(value.casefold())
+        except ValueError:
+            types = ", ".join(type_.value for type_ in RaindropType)
+            raise ValueError(f"Invalid type '{value}' in query, expected one of {types}") from None
+        return lambda raindrop, text: raindrop.type == type_
+
+    if key in ("created", "lastupdate"):
+        first, last = _period(value)
+        attr = "created" if key == "created" else "last_update"
+        within = {
+            "=": lambda date: first <= date <= last,
+            ">": lambda date: date > last,
+            ">=": lambda date: date >= first,
+            "<": lambda date: date < first,
+            "<=": lambda date: date <= last,
+        }[term.op]
+
+        def _dated(raindrop: Raindrop, text: Callable[[], str]) -> bool:
+            when = getattr(raindrop, attr)
+            if when is None:
+                return False
+            if when.tzinfo is None:  # ie. Raindrop's timestamps are in UTC, not the machine's local time.
+                return within(when.date())
+            return within(when.astimezone(datetime.UTC).date())
+
+        return _dated
+
+    flag = _boolean(term)
+    if key == "notag":
+        return lambda raindrop, text: (not raindrop.tags) == flag
+    return lambda raindrop, text: bool(getattr(raindrop, key)) == flag  # ie. important or broken
+
+
+class Query:
+    """A Raindrop search query compiled for evaluation against Raindrops locally.
+
+    Parameters:
+        query: The query string, in Raindrop's search syntax (see module documentation).
+
+    Raises:
+        ValueError: If an operator has an invalid value, eg. ``type:banana`` or ``created:>yesterday``.
+    """
+
+    def __init__(self, query: str) -> None:
+        """Parse and compile the query provided."""
+        self.query = query
+        self.terms = parse(query)
+        self.match_any = False
+
+        # Structured terms are evaluated before text ones, such that a Raindrop's text is only assembled if needed.
+        predicates: list[tuple[T_Predicate, bool]] = []
+        texts: list[tuple[T_Predicate, bool]] = []
+        for term in self.terms:
+            if term.key == "match":
+                self.match_any = term.value.casefold() == "or"
+                continue
+            (texts if term.key is None else predicates).append((_compile(term), term.negated))
+        self._predicates = predicates + texts
+
+    def __repr__(self) -> str:
+        """Return the query as it was provided."""
+        return f"Query({self.query!r})"
+
+    def __call__(self, raindrop: Raindrop) -> bool:
+        """Return True if the Raindrop matches the query."""
+        cache: list[str] = []
+
+        def text() -> str:
+            if not cache:
+                cache.append(_text(raindrop))
+            return cache[0]
+
+        if not self._predicates:
+            return True
+        results = (predicate(raindrop, text) != negated for predicate, negated in self._predicates)
+        return any(results) if self.match_any else all(results)
+
+    def filter(self, raindrops: Iterable[Raindrop]) -> Iterator[Raindrop]:
+        """Yield the Raindrops that match the query, in the order provided."""
+        return (raindrop for raindrop in raindrops if self(raindrop))
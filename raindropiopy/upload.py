@@ -0,0 +1,250 @@
+"""Streaming multipart uploads of files to Raindrop, ie. without holding the file (or the encoded body) in memory.
+
+When given ``files=``, requests encodes the entire multipart body in memory before sending it, ie. uploading a 200MB
+video costs (at least) 200MB. A ``MultipartUpload`` produces the same body a chunk at a time instead, reading the file
+from disk as it's sent, while reporting progress along the way:
+
+>>> def progress(p: UploadProgress) -> None:
+>>>     print(f"{p.fraction:.0%} at {p.rate / 1e6:.1f}MB/s")
+>>> raindrop = Raindrop.create_file(api, Path("talk.mp4"), "video/mp4", progress=progress)
+
+Files larger than ``STREAM_THRESHOLD`` are always streamed by ``Raindrop.create_file``.
+
+Many files are uploaded at once by ``Raindrop.create_files``, which skips files whose content was uploaded already
+(as recorded, by SHA-256 of their content, in an ``UploadManifest``):
+
+>>> with UploadManifest("~/.cache/raindrop-uploads.sqlite") as manifest:
+>>>     result = Raindrop.create_files(api, Path("archive").glob("*.pdf"), manifest=manifest, tags=["archive"])
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "STREAM_THRESHOLD",
+    "MultipartUpload",
+    "UploadManifest",
+    "UploadProgress",
+    "file_sha256",
+]
+
+# Bytes read from disk (and handed to the connection) at a time.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Files larger than this (in bytes) are streamed by Raindrop.create_file, even without a progress callback.
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+
+class UploadProgress(NamedTuple):
+    """Progress of an upload, as passed to progress callbacks after each chunk sent.
+
+    Attributes:
+        sent: Bytes of the request body sent so far.
+        total: Total bytes of the request body.
+        elapsed: Seconds since the upload started.
+    """
+
+    sent: int
+    total: int
+    elapsed: float
+
+    @property
+    def fraction(self) -> float:
+        """Return the fraction of the body sent so far (from 0.0 to 1.0)."""
+        return self.sent / self.total if self.total else 1.0
+
+    @property
+    def rate(self) -> float:
+        """Return the average throughput so far, in bytes per second."""
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+T_Progress = Callable[[UploadProgress], None]
+
+
+def _quote(value: str) -> str:
+    """Quote a Content-Disposition parameter value (as browsers, and urllib3, do)."""
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartUpload:
+    """Streaming ``multipart/form-data`` body of a file upload (along with any form fields).
+
+    Used as the ``data`` of a request (see ``API.put_upload``), the body is produced a chunk at a time, the file being
+    read from disk as it's sent. Its length is known up-front (ie. sent with a Content-Length, not chunked) and it can
+    be iterated again (eg. when a request is retried), the file being re-read from the start each time.
+
+    Parameters:
+        path: File to be uploaded.
+
+        fields: Optional, form fields sent before the file, eg. {"collectionId": "-1"}.
+
+        name: Form field name of the file.
+
+        filename: Filename sent for the file, defaults to the name of the path.
+
+        content_type: Mime-type of the file.
+
+        chunk_size: Bytes read from the file at a time.
+
+        progress: Optional, callable given an ``UploadProgress`` after each chunk sent.
+
+    Attributes:
+        sent: Bytes of the body sent so far (of the latest attempt).
+        elapsed: Seconds spent sending the body so far (of the latest attempt).
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        fields: dict[str, str] | None = None,
+        name: str = "file",
+        filename: str | None = None,
+        content_type: str = "application/octet-stream",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: T_Progress | None = None,
+    ) -> None:
+        """Prepare the body of an upload (the file itself isn't read until the body is)."""
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.boundary = uuid.uuid4().hex
+        head = [
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(key)}"\r\n\r\n{value}\r\n'
+            for key, value in (fields or {}).items()
+        ]
+        filename = _quote(filename or self.path.name)
+        head.append(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n",
+        )
+        self._head = "".join(head).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._size = self.path.stat().st_size
+        self.sent = 0
+        self.elapsed = 0.0
+
+    @property
+    def content_type(self) -> str:
+        """Return the Content-Type header of the body (ie. with its boundary)."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def rate(self) -> float:
+        """Return the average throughput of the body sent so far, in bytes per second."""
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __len__(self) -> int:
+        """Return the total size of the body in bytes."""
+        return len(self._head) + self._size + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the body a chunk at a time, reading the file as we go (and reporting progress after each chunk)."""
+        self.sent, self.elapsed, started = 0, 0.0, time.monotonic()
+        pending = 0
+
+        def _sent() -> None:
+            # Called as each chunk is requested, ie. once the previous one has been handed to the connection.
+            nonlocal pending
+            self.sent, pending = self.sent + pending, 0
+            self.elapsed = time.monotonic() - started
+            if self.progress is not None and self.sent:
+                self.progress(UploadProgress(self.sent, len(self), self.elapsed))
+
+        pending = len(self._head)
+        yield self._head
+        with open(self.path, "rb") as fh_:
+            while chunk := fh_.read(self.chunk_size):
+                _sent()
+                pending = len(chunk)
+                yield chunk
+        _sent()
+        pending = len(self._tail)
+        yield self._tail
+        _sent()
+
+
+def file_sha256(path: Path | str) -> str:
+    """Return the (hex) SHA-256 digest of a file's content, memory-mapping it rather than reading it into memory."""
+    with open(path, "rb") as fh_:
+        if not (size := Path(path).stat().st_size):
+            return hashlib.sha256().hexdigest()  # ie. empty files can't be mapped.
+        with mmap.mmap(fh_.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()  # Nb: hashlib releases the GIL, ie. threads hash in parallel.
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    sha256 TEXT PRIMARY KEY,
+    raindrop_id INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    uploaded REAL NOT NULL
+);
+"""
+
+
+class UploadManifest:
+    """Local record of the files uploaded to Raindrop, keyed by the SHA-256 of their content.
+
+    Used by ``Raindrop.create_files`` to skip files whose content was uploaded already (by any path). Nb: Raindrops
+    deleted since are *not* detected, use ``remove`` (or a fresh manifest) to upload their files again.
+
+    Parameters:
+        path: SQLite database to use (created if it doesn't exist), defaults to an in-memory one.
+    """
+
+    def __init__(self, path: Path | str = ":memory:") -> None:
+        """Open (or create) the manifest database."""
+        path = str(Path(path).expanduser()) if str(path) != ":memory:" else str(path)
+        self._db = sqlite3.connect(path, check_same_thread=False)  # ie. uploads complete on several threads.
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the manifest database."""
+        self._db.close()
+
+    def __enter__(self) -> UploadManifest:
+        """Context manager use, close the database on exit."""
+        return self
+
+    def __exit__(self, _type, _value, _traceback) -> None:  # type: ignore
+        """Context manager use, close the database on exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of files recorded."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM uploads").fetchone()[0]
+
+    def get(self, sha256: str) -> int | None:
+        """Return the id of the Raindrop created for content with the digest provided, None if it wasn't uploaded."""
+        with self._lock:
+            row = self._db.execute("SELECT raindrop_id FROM uploads WHERE sha256 = ?", (sha256,)).fetchone()
+        return None if row is None else row[0]
+
+    def add(self, sha256: str, raindrop_id: int, path: Path | str) -> None:
+        """Record the upload of a file (with the digest of its content) and the id of the Raindrop created for it."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO uploads (sha256, raindrop_id, path, size, uploaded) VALUES (?, ?, ?, ?, ?)",
+                (sha256, raindrop_id, str(path), Path(path).stat().st_size, time.time()),
+            )
+            self._db.commit()
+
+    def remove(self, sha256: str) -> None:
+        """Forget the upload of content with the digest provided (ie. such that it's uploaded again)."""
+        with self._lock:
+            self._db.execute("DELETE FROM uploads WHERE sha256 = ?", (sha256,))
+            self._db.commit()
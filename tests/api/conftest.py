@@ -1,6 +1,10 @@
 """Provide all shared test fixtures for API tests."""
 
+import json
+from typing import Any
+
 import pytest
+import requests
 from pathlib import Path
 
 from vcr import VCR
@@ -16,6 +20,18 @@ vcr = VCR(
 )
 
 
+def response(status: int = 200, body: Any = None, headers: dict | None = None) -> requests.Response:
+    """Return a (real) requests Response with the status code, JSON body (default: empty object) and headers provided.
+
+    Use as "from tests.api.conftest import response" for the return value/side effect of a patched request.
+    """
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    resp._content = json.dumps({} if body is None else body).encode()
+    return resp
+
+
 @pytest.fixture()
 def mock_api():
     """Fixture for a "mock" API instance."""
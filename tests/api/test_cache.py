@@ -0,0 +1,72 @@
+"""Test the persistent cache of GET responses."""
+from unittest.mock import patch
+
+from raindropiopy import API, Raindrop, ResponseCache, Tag
+from tests.api.conftest import response
+from tests.api.test_models_raindrop import raindrop
+from tests.api.test_models_tag import TAG
+
+
+def test_fresh_responses_avoid_requests(tmp_path) -> None:
+    """Test that responses within their TTL are used without any request, across API (and cache) instances."""
+    for _ in range(2):
+        with ResponseCache(tmp_path / "cache.sqlite") as cache:
+            api = API("dummy", cache=cache)
+            with patch("raindropiopy.api.OAuth2Session.request", return_value=response(body={"items": [TAG]})) as m:
+                assert Tag.get(api) == Tag.get(api) == [Tag(**TAG)]
+    assert m.call_count == 0  # ie. the second "run" started warm.
+    assert cache.hits == 2
+
+
+def test_revalidation() -> None:
+    """Test that stale responses are revalidated with their ETag, and reused on a 304."""
+    cache = ResponseCache(ttls={})
+    api = API("dummy", cache=cache)
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value = response(body={"item": raindrop}, headers={"ETag": 'W/"1"'})
+        first = Raindrop.get(api, 2000)
+        m.return_value = response(304)
+        assert Raindrop.get(api, 2000) == first
+        assert m.call_args[1]["headers"]["If-None-Match"] == 'W/"1"'
+    assert (cache.misses, cache.revalidated) == (1, 1)
+
+
+def test_uncacheable() -> None:
+    """Test that responses that could neither be used nor revalidated aren't kept."""
+    cache = ResponseCache(ttls={})
+    api = API("dummy", cache=cache)
+    with patch("raindropiopy.api.OAuth2Session.request", return_value=response(body={"item": raindrop})):
+        Raindrop.get(api, 2000)
+    assert len(cache) == 0
+
+
+def test_invalidated_by_changes() -> None:
+    """Test that changes through the API invalidate the cached responses they make stale."""
+    cache = ResponseCache()
+    api = API("dummy", cache=cache)
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value = response(body={"items": [TAG]})
+        Tag.get(api)
+        m.return_value = response(body={"user": {}})
+        api.get("https://api.raindrop.io/rest/v1/user")
+        assert len(cache) == 2
+
+        m.return_value = response(body={"result": True})
+        Tag.rename(api, "old", "new")
+        assert len(cache) == 1  # ie. tags have changed, the user hasn't.
+
+        m.reset_mock()
+        m.return_value = response(body={"items": [TAG]})
+        Tag.get(api)
+        assert m.call_count == 1
+
+
+def test_evicted_by_size() -> None:
+    """Test that the least recently used responses are evicted to keep within the size limit."""
+    cache = ResponseCache(max_size=300)
+    api = API("dummy", cache=cache)
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        for collection_id in (1, 2, 3):
+            m.return_value = response(body={"items": [TAG | {"count": collection_id, "pad": "x" * 60}]})
+            Tag.get(api, collection_id)
+    assert len(cache) == 2
@@ -0,0 +1,53 @@
+"""Test the pluggable JSON codecs used for requests and responses."""
+import datetime
+import json
+from unittest.mock import patch
+
+import pytest
+
+from raindropiopy import API, CollectionRef, Raindrop, RaindropType
+from raindropiopy import codec as codec_module
+from raindropiopy.codec import CODECS, get_codec
+from tests.api.conftest import response
+from tests.api.test_models_raindrop import raindrop
+
+PAYLOAD = {
+    "type": RaindropType.article,
+    "created": datetime.datetime(2024, 1, 2, 3, 4, 5, 6000, tzinfo=datetime.UTC),
+    "naive": datetime.datetime(2024, 1, 2),
+    "title": "Crème brûlée",
+    "ids": [1, 2.5, None, True],
+}
+
+
+def _installed(name: str):
+    return pytest.param(name, marks=pytest.mark.skipif(codec_module._MODULES[name] is None, reason=f"no {name}"))
+
+
+@pytest.mark.parametrize("name", [_installed(name) for name in CODECS])
+def test_same_serialisation(name) -> None:
+    """Test that every codec serialises enums and datetimes through _json_unknown, as the standard library does."""
+    api = API("dummy", json_codec=name)
+    expected = API("dummy")._to_json(PAYLOAD)
+    assert json.loads(api._to_json(PAYLOAD)) == json.loads(expected)
+    assert json.loads(expected)["created"] == "2024-01-02T03:04:05.006000+00:00"
+    with pytest.raises(TypeError):
+        api._to_json({"unknown": object()})
+
+
+@pytest.mark.parametrize("name", [_installed(name) for name in CODECS])
+def test_responses_decoded(name) -> None:
+    """Test that responses are decoded through the codec, giving the same models."""
+    api = API("dummy", json_codec=name)
+    with patch("raindropiopy.api.OAuth2Session.request", return_value=response(body={"item": raindrop})):
+        assert Raindrop.update(api, 2000, collection=CollectionRef.Unsorted) == Raindrop(**raindrop)
+
+
+def test_get_codec() -> None:
+    """Test that "auto" picks the first codec installed and unknown names are reported."""
+    with patch.dict(codec_module._MODULES, {"orjson": None, "msgspec": None}):
+        assert get_codec("auto").name == "json"
+        with pytest.raises(ImportError):
+            get_codec("orjson")
+    with pytest.raises(ValueError):
+        get_codec("yaml")
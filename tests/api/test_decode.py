@@ -0,0 +1,128 @@
+"""Test the trusted (ie. non-validating) decoding of API responses against full pydantic validation."""
+import copy
+import time
+from unittest.mock import patch
+
+import pydantic
+import pytest
+
+from raindropiopy import API, Collection, LazyRaindrop, Raindrop, SystemCollection, Tag, User
+from raindropiopy.decode import decode
+from tests.api.test_models_collection import COLLECTION, SUB_COLLECTION
+from tests.api.test_models_raindrop import raindrop
+from tests.api.test_models_tag import TAG
+from tests.api.test_models_user import test_user
+
+
+@pytest.mark.parametrize(
+    "model, item",
+    [
+        (Raindrop, raindrop),
+        (Raindrop, raindrop | {"collection": COLLECTION, "file": {"name": "a.pdf", "size": 1, "type": "pdf"}}),
+        (Raindrop, raindrop | {"link": "http://sub.example.co.uk:8080/a/b?c=d#", "cache": {"status": "ready"}}),
+        (Raindrop, raindrop | {"link": "https://127.0.0.1/x", "lastUpdate": 1700000000}),  # ie. falls back
+        (Raindrop, raindrop | {"cover": 1, "title": 2, "important": "true", "tags": ["a", 3]}),  # ie. coerced
+        (Raindrop, raindrop | {"link": "http://example.com:8080#a", "created": "2020-01-02 01:01"}),
+        (Raindrop, raindrop | {"link": "HTTPS://www.example.com/"}),  # ie. left to pydantic
+        (Collection, COLLECTION),
+        (Collection, SUB_COLLECTION),
+        (User, test_user),  # ie. falls back, "registered" isn't ISO-8601
+        (User, test_user | {"registered": "2020-01-02T01:01:01.000Z"}),
+        (Tag, TAG),
+        (SystemCollection, {"_id": -99, "count": 3}),
+    ],
+)
+def test_same_as_validated(model, item) -> None:
+    """Test that decoded models are identical to fully validated ones."""
+    expected = model(**copy.deepcopy(item))
+    decoded = decode(model, copy.deepcopy(item))
+    assert decoded == expected
+    assert decoded.__fields_set__ == expected.__fields_set__
+    if model is Raindrop and expected.link is not None:
+        parts = ("scheme", "user", "password", "host", "tld", "host_type", "port", "path", "query", "fragment")
+        assert [getattr(decoded.link, part) for part in parts] == [getattr(expected.link, part) for part in parts]
+
+
+def test_item_untouched() -> None:
+    """Test that the item decoded is not changed (eg. by gathering 'other' attributes)."""
+    item = copy.deepcopy(raindrop)
+    decode(Raindrop, item)
+    assert item == raindrop
+
+
+@pytest.mark.parametrize(
+    "model, item",
+    [
+        (Tag, {"_id": "no count"}),
+        (Tag, {"_id": "abc", "count": None}),
+        (Raindrop, raindrop | {"created": "2020-01-02"}),  # ie. a date alone isn't a datetime to pydantic
+        (Raindrop, raindrop | {"link": "https://www.example.com/a b"}),
+        (Raindrop, raindrop | {"type": "unknown"}),
+        (Collection, COLLECTION | {"count": -1}),
+    ],
+)
+def test_invalid(model, item) -> None:
+    """Test that invalid items are reported just as with full validation."""
+    with pytest.raises(pydantic.ValidationError):
+        model(**copy.deepcopy(item))
+    with pytest.raises(pydantic.ValidationError):
+        decode(model, copy.deepcopy(item))
+
+
+def test_faster_than_validated() -> None:
+    """Test (as a regression guard, see examples/benchmark_decode.py for figures) that decoding beats validating."""
+    items = [raindrop | {"_id": index, "link": f"https://www.example.com/{index}"} for index in range(1000)]
+    decode(Raindrop, items[0])
+
+    def _best_of(build) -> float:
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            for item in items:
+                build(item)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    assert _best_of(lambda item: Raindrop(**item)) > 2 * _best_of(lambda item: decode(Raindrop, item))
+
+
+def test_api_opt_in() -> None:
+    """Test that an API with trusted_decode set builds the same models, without validating them."""
+    api = API("dummy", trusted_decode=True)
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value.json.return_value = {"count": 1, "items": [raindrop]}
+        with patch.object(Raindrop, "__init__", side_effect=AssertionError("validated")):
+            found = Raindrop.search(api)
+    assert found == [Raindrop(**raindrop)]
+
+
+def test_lazy_views() -> None:
+    """Test that lazy views convert attributes as full validation would, only on first access."""
+    item = copy.deepcopy(raindrop) | {"unofficial": 1}
+    expected = Raindrop(**copy.deepcopy(item))
+    view = LazyRaindrop(item)
+    assert not view.__dict__
+    assert LazyRaindrop(item | {"title": 1, "important": "true"}).important is True  # ie. coerced by pydantic
+    assert view.link == expected.link
+    assert list(view.__dict__) == ["link"]
+    for name in Raindrop.__fields__:
+        assert getattr(view, name) == getattr(expected, name), name
+    assert view.other["unofficial"] == 1
+    assert view.materialize() == expected
+    assert item == raindrop | {"unofficial": 1}  # ie. untouched
+    with pytest.raises(AttributeError):
+        view.title = "changed"
+    with pytest.raises(AttributeError):
+        _ = view.missing
+
+
+def test_lazy_search() -> None:
+    """Test that searches return lazy views when asked to."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value.json.return_value = {"count": 1, "items": [raindrop]}
+        with patch.object(Raindrop, "__init__", side_effect=AssertionError("validated")):
+            found = Raindrop.search(api, lazy=True)
+            assert [type(view) for view in found] == [LazyRaindrop]
+            assert [view.id for view in Raindrop.iter_search(api, lazy=True, prefetch=False)] == [raindrop["_id"]]
+    assert found[0].materialize() == Raindrop(**raindrop)
@@ -0,0 +1,62 @@
+"""Test the streaming export and import of Raindrops, Collections and Tags."""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from raindropiopy import API, Collection, Raindrop, Tag
+from raindropiopy.export import export_arrow, export_ndjson, export_parquet, read_arrow, read_ndjson, read_parquet
+from tests.api.test_models_collection import COLLECTION, SUB_COLLECTION
+from tests.api.test_models_raindrop import raindrop
+from tests.api.test_models_tag import TAG
+
+
+def _respond(method, url, params=None, **kwargs):
+    """Answer search, collection and tag requests, with Raindrops over two pages."""
+    resp = Mock(headers={})
+    if "/raindrops/" in url:
+        page = params["page"]
+        ids = range(page * 50, min((page + 1) * 50, 60))
+        resp.json.return_value = {"count": 60, "items": [raindrop | {"_id": id_, "unofficial": id_} for id_ in ids]}
+    elif url.endswith("collections"):
+        resp.json.return_value = {"items": [COLLECTION]}
+    elif url.endswith("collections/childrens"):
+        resp.json.return_value = {"items": [SUB_COLLECTION]}
+    else:
+        resp.json.return_value = {"items": [TAG]}
+    return resp
+
+
+@pytest.mark.parametrize(
+    "model, expected",
+    [
+        (Raindrop, [Raindrop(**raindrop | {"_id": id_, "unofficial": id_}) for id_ in range(60)]),
+        (Collection, [Collection(**COLLECTION), Collection(**SUB_COLLECTION)]),
+        (Tag, [Tag(**TAG)]),
+    ],
+)
+def test_ndjson_round_trip(tmp_path, model, expected) -> None:
+    """Test that models read back from an NDJSON export are the same as those exported."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request", side_effect=_respond):
+        assert export_ndjson(api, tmp_path / "export.ndjson", model=model) == len(expected)
+    assert list(read_ndjson(tmp_path / "export.ndjson", model=model)) == expected
+
+
+def test_ndjson_unsupported_model(tmp_path) -> None:
+    """Test that only Raindrops, Collections and Tags can be exported."""
+    with pytest.raises(ValueError):
+        export_ndjson(API("dummy"), tmp_path / "export.ndjson", model=API)
+
+
+@pytest.mark.parametrize("export, read", [(export_parquet, read_parquet), (export_arrow, read_arrow)])
+def test_arrow_round_trip(tmp_path, export, read) -> None:
+    """Test that models read back from Arrow and Parquet exports are the same as those exported."""
+    pytest.importorskip("pyarrow")
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request", side_effect=_respond):
+        assert export(api, tmp_path / "raindrops", model=Raindrop) == 60
+        assert export(api, tmp_path / "tags", model=Tag) == 1
+    assert [found.id for found in read(tmp_path / "raindrops")] == list(range(60))
+    assert list(read(tmp_path / "tags", model=Tag)) == [Tag(**TAG)]
+    with pytest.raises(ValueError):
+        list(read(tmp_path / "tags", model=Raindrop))
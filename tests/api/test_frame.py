@@ -0,0 +1,93 @@
+"""Test the column-oriented RaindropFrame."""
+import datetime
+from unittest.mock import patch
+
+import pytest
+
+from raindropiopy import API, CollectionRef, Raindrop, RaindropFrame, RaindropType
+from tests.api.test_models_raindrop import raindrop
+
+ITEMS = [
+    raindrop | {"_id": 1, "tags": ["python", "typing"], "domain": "docs.python.org"},
+    raindrop | {"_id": 2, "tags": ["rust"], "domain": "doc.rust-lang.org", "type": "article", "broken": True},
+    raindrop | {"_id": 3, "tags": [], "type": "image", "created": "2023-06-15T10:00:00Z", "collection": {"$id": 7}},
+    raindrop | {"_id": 4, "tags": ["python"], "domain": "docs.python.org", "lastUpdate": None},
+]
+
+
+def _frame() -> RaindropFrame:
+    return RaindropFrame.from_items(ITEMS)
+
+
+def test_columns() -> None:
+    """Test that items are held in typed, dictionary-encoded columns."""
+    frame = _frame()
+    assert len(frame) == 4
+    assert list(frame.id) == [1, 2, 3, 4]
+    assert list(frame.collection_id) == [-1, -1, 7, -1]
+    assert frame.domains == ["docs.python.org", "doc.rust-lang.org", "www.example.com"]
+    assert list(frame.domain) == [0, 1, 2, 0]
+    assert frame.row_tags(0) == ["python", "typing"]
+    assert frame.row_tags(2) == []
+    assert frame.last_update[3] != frame.last_update[3]  # ie. NaN
+
+
+def test_where() -> None:
+    """Test filtering on each of the columns, alone and combined."""
+    frame = _frame()
+    assert list(frame.where()) == [0, 1, 2, 3]
+    assert list(frame.where(tag="python")) == [0, 3]
+    assert list(frame.where(tag="missing")) == []
+    assert list(frame.where(domain="docs.python.org", tag="typing")) == [0]
+    assert list(frame.where(type=RaindropType.image)) == [2]
+    assert list(frame.where(broken=True)) == [1]
+    assert list(frame.where(collection=CollectionRef.Unsorted)) == [0, 1, 3]
+    assert list(frame.where(created_after=datetime.datetime(2021, 1, 1, tzinfo=datetime.UTC))) == [2]
+    assert list(frame.where(updated_before=datetime.datetime(2021, 1, 1, tzinfo=datetime.UTC))) == [0, 1, 2]
+
+    assert list(frame.where(tag="python", created_before=datetime.datetime(2021, 1, 1, tzinfo=datetime.UTC))) == [0, 3]
+    assert list(frame.where(created_after=datetime.datetime(2030, 1, 1, tzinfo=datetime.UTC))) == []
+
+    python = frame.filter(tag="python")
+    assert list(python.id) == [1, 4]
+    assert python.row_tags(0) == ["python", "typing"]
+    assert python.count_by("tag") == {"python": 2, "typing": 1}
+
+
+def test_where_after_extend() -> None:
+    """Test that the indexes built by filtering include rows added afterwards (and count repeated tags once)."""
+    frame = _frame()
+    assert list(frame.where(tag="python")) == [0, 3]
+    frame.extend([raindrop | {"_id": 5, "tags": ["python", "python"], "created": "2024-01-01T00:00:00Z"}])
+    assert list(frame.where(tag="python")) == [0, 3, 4]
+    assert list(frame.where(created_after=datetime.datetime(2021, 1, 1, tzinfo=datetime.UTC))) == [2, 4]
+
+
+def test_count_by() -> None:
+    """Test group-by counts of each groupable column."""
+    frame = _frame()
+    assert frame.count_by("domain").most_common(1) == [("docs.python.org", 2)]
+    assert frame.count_by("tag") == {"python": 2, "typing": 1, "rust": 1}
+    assert frame.count_by("type") == {RaindropType.link: 2, RaindropType.article: 1, RaindropType.image: 1}
+    assert frame.count_by("collection") == {-1: 3, 7: 1}
+    with pytest.raises(ValueError):
+        frame.count_by("title")
+
+
+def test_rows_to_raindrops() -> None:
+    """Test that rows convert back to Raindrops with the attributes held by the frame."""
+    expected = Raindrop(**ITEMS[1])
+    found = _frame()[1]
+    for attr in ("id", "collection", "created", "last_update", "type", "broken", "link", "title", "domain", "tags"):
+        assert getattr(found, attr) == getattr(expected, attr), attr
+    assert [found.id for found in _frame()] == [1, 2, 3, 4]
+
+
+def test_from_search() -> None:
+    """Test that a frame can be built straight from the pages of a search."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value.json.return_value = {"count": 4, "items": ITEMS}
+        with patch.object(Raindrop, "__init__", side_effect=AssertionError("model created")):
+            frame = RaindropFrame.from_search(api)
+    assert list(frame.id) == [1, 2, 3, 4]
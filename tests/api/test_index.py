@@ -0,0 +1,136 @@
+"""Test the offline full-text SearchIndex, including keeping it current through the model methods."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from raindropiopy import API, ChangeEvent, Collection, Raindrop, SearchIndex, Tag
+from tests.api.test_models_raindrop import raindrop
+
+PYTHON = raindrop | {"_id": 1, "title": "Python Tutorial", "excerpt": "Learn it", "tags": ["programming"]}
+RUST = raindrop | {"_id": 2, "title": "Rust book", "excerpt": "Python users welcome", "tags": ["programming"]}
+COOKING = raindrop | {"_id": 3, "title": "Crème brûlée", "domain": "recipes.example.com", "tags": ["dessert"]}
+
+
+def _index() -> SearchIndex:
+    index = SearchIndex()
+    index.add(Raindrop(**item) for item in (PYTHON, RUST, COOKING))
+    return index
+
+
+def test_search_ranked() -> None:
+    """Test that prefixes match and title matches outrank excerpt ones."""
+    with _index() as index:
+        assert len(index) == 3
+        assert [found.id for found in index.search("pyth")] == [1, 2]
+        assert [found.id for found in index.search("pyth tut")] == [1]
+        assert [found.id for found in index.search("creme")] == [3]  # ie. diacritics are ignored
+        assert [found.id for found in index.search("recipes")] == [3]  # ie. by domain
+        assert [found.id for found in index.search("programming", limit=1)] == [1]
+
+
+def test_search_query_is_not_interpreted() -> None:
+    """Test that FTS5 syntax in the user's text can't break a query."""
+    with _index() as index:
+        assert [found.id for found in index.search('rust" (boo* -')] == [2]
+        assert index.search("  ***  ") == []
+
+
+def test_round_trip() -> None:
+    """Test that Raindrops returned are equal to those indexed, unofficial attributes included."""
+    with _index() as index:
+        assert index.search("tutorial")[0] == Raindrop(**PYTHON)
+
+
+def test_build() -> None:
+    """Test that an index can be built from a search of Raindrop."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value.json.side_effect = [{"count": 2, "items": [PYTHON, RUST]}]
+        index = SearchIndex.build(api)
+    assert len(index) == 2
+    assert not index.stale
+
+
+def test_attached_to_model_methods() -> None:
+    """Test that the index follows changes made through the model methods."""
+    api = API("dummy")
+    index = _index()
+    index.attach(api)
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value.json.return_value = {"item": raindrop | {"_id": 4, "title": "Go by example"}}
+        Raindrop.create_link(api, "https://gobyexample.com")
+        assert [found.id for found in index.search("go")] == [4]
+
+        m.return_value.json.return_value = {"item": PYTHON | {"title": "Snakes"}}
+        Raindrop.update(api, 1, title="Snakes")
+        assert [found.id for found in index.search("pyth")] == [2]
+        assert [found.id for found in index.search("snakes")] == [1]
+
+        m.return_value.json.return_value = {"result": True}
+        Raindrop.delete(api, 2)
+        assert 2 not in index
+
+        m.return_value.json.return_value = {"modified": 1}
+        Raindrop.update_many(api, -1, ids=[1], tags=["reptiles"])
+        assert index.stale
+
+    index.detach(api)
+    assert not api._listeners
+
+
+def test_attached_changes_from_threads() -> None:
+    """Test that changes made through an API shared by worker threads are indexed (on those threads)."""
+    api = API("dummy")
+    index = _index()
+    index.attach(api)
+
+    def _request(method, url, data=None, **kwargs):
+        id_ = int(json.loads(data)["link"].rsplit("/", 1)[1])
+        return Mock(headers={}, json=Mock(return_value={"item": raindrop | {"_id": id_, "title": f"Worker {id_}"}}))
+
+    with patch("raindropiopy.api.OAuth2Session.request", side_effect=_request):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda id_: Raindrop.create_link(api, f"https://example.com/{id_}"), range(10, 18)))
+    assert sorted(found.id for found in index.search("worker", limit=None)) == list(range(10, 18))
+
+
+def test_trashed_are_removed() -> None:
+    """Test that a Raindrop saved into the Trash is removed from the index."""
+    with _index() as index:
+        index._on_change(ChangeEvent.saved, [Raindrop(**PYTHON | {"collection": {"$id": -99}})])
+        assert 1 not in index
+
+
+def test_tag_and_collection_changes_mark_stale() -> None:
+    """Test that merging/deleting tags and deleting a collection mark an attached index as stale."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value.json.return_value = {"result": True}
+        for change in (
+            lambda: Tag.merge(api, ["programming"], "coding"),
+            lambda: Tag.rename(api, "dessert", "sweets"),
+            lambda: Tag.delete(api, ["programming"]),
+            lambda: Collection.delete(api, 1),
+        ):
+            with _index() as index:
+                index.attach(api)
+                change()
+                assert index.stale
+                index.detach(api)
+
+
+def test_failing_listener(caplog) -> None:
+    """Test that a listener raising is logged, not passed on, and doesn't keep others from being told."""
+    api = API("dummy")
+
+    def _broken(event: ChangeEvent, payload) -> None:
+        raise RuntimeError("broken listener")
+
+    api.subscribe(_broken)
+    with _index() as index:
+        index.attach(api)
+        with patch("raindropiopy.api.OAuth2Session.request") as m:
+            m.return_value.json.return_value = {"result": True}
+            Raindrop.delete(api, 2)
+        assert 2 not in index
+    assert [record.exc_info[0] for record in caplog.records] == [RuntimeError]
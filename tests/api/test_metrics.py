@@ -0,0 +1,133 @@
+"""Test the instrumentation of requests (hooks and the in-memory metrics registry)."""
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+import requests
+
+from raindropiopy import API, AsyncAPI, MetricsRegistry, Raindrop, RequestMetric, RetryPolicy, Tag
+from raindropiopy.metrics import endpoint_template
+from raindropiopy.models import URL
+from tests.api.conftest import response
+from tests.api.test_models_raindrop import raindrop
+from tests.api.test_models_tag import TAG
+
+
+def test_endpoint_template() -> None:
+    """Test that ids are replaced in the API path of a url."""
+    assert endpoint_template("https://api.raindrop.io/rest/v1/raindrops/-1") == "raindrops/{id}"
+    assert endpoint_template("https://api.raindrop.io/rest/v1/raindrop/123/") == "raindrop/{id}"
+    assert endpoint_template("https://api.raindrop.io/rest/v1/collection/5/cover") == "collection/{id}/cover"
+    assert endpoint_template("https://api.raindrop.io/rest/v1/collections/childrens") == "collections/childrens"
+
+
+def test_hooks_and_registry() -> None:
+    """Test that each request (retries included) is described to the hooks and aggregated by the registry."""
+    api = API("dummy", retry=RetryPolicy(max_attempts=2))
+    registry, seen = MetricsRegistry(), []
+    api.add_request_hook(registry)
+    api.add_request_hook(seen.append)
+    headers = {"X-RateLimit-Limit": "120", "X-RateLimit-Remaining": "117"}
+    with patch("raindropiopy.api.OAuth2Session.request") as m, patch("raindropiopy.api.time.sleep"):
+        m.side_effect = [response(502), response(body={"item": raindrop}, headers=headers)]
+        api.get(URL.format(path="raindrop/2000"))
+        m.side_effect = [response(body={"item": raindrop})]
+        Raindrop.update(api, 2000, title="A title")
+        m.side_effect = [response(body={"items": [TAG]})]
+        Tag.get(api)
+        m.side_effect = [response(404), response(404)]
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.get(URL.format(path="raindrop/3000"))
+
+        api.remove_request_hook(seen.append)
+        m.side_effect = [response(body={"items": [TAG]})]
+        Tag.get(api)
+
+    assert [(metric.method, metric.endpoint, metric.status, metric.retries, metric.error) for metric in seen] == [
+        ("GET", "raindrop/{id}", 200, 1, None),
+        ("PUT", "raindrop/{id}", 200, 0, None),
+        ("GET", "tags", 200, 0, None),
+        ("GET", "raindrop/{id}", 404, 0, "HTTPError"),
+    ]
+    assert all(isinstance(metric, RequestMetric) and metric.duration >= 0 for metric in seen)
+    assert seen[0].response_bytes == len(json.dumps({"item": raindrop}))
+    assert seen[1].request_bytes == len(json.dumps({"title": "A title"}).encode())
+    assert seen[0].ratelimit_remaining == 117 and seen[0].ratelimit_limit == 120
+
+    snapshot = registry.snapshot()
+    get = snapshot["GET raindrop/{id}"]
+    assert get["count"] == 2 and get["retries"] == 1
+    assert get["statuses"] == {200: 1, 404: 1} and get["errors"] == {"HTTPError": 1}
+    assert get["duration"]["buckets"][float("inf")] == 2
+    assert snapshot["GET tags"]["count"] == 2
+    assert snapshot["ratelimit"] == {"remaining": 117, "limit": 120}
+
+    registry.reset()
+    assert registry.snapshot() == {"ratelimit": {"remaining": None, "limit": None}}
+
+
+def test_connection_errors() -> None:
+    """Test that requests failing without any response are recorded too."""
+    api = API("dummy", retry=None)
+    registry = MetricsRegistry()
+    api.add_request_hook(registry)
+    with patch("raindropiopy.api.OAuth2Session.request", side_effect=requests.exceptions.ConnectionError()):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            Tag.get(api)
+    series = registry.snapshot()["GET tags"]
+    assert series["statuses"] == {} and series["errors"] == {"ConnectionError": 1}
+
+
+def test_failing_hook(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that a hook raising is logged, not passed on (ie. neither failing a request nor masking its error)."""
+    api = API("dummy", retry=None)
+    seen: list[RequestMetric] = []
+
+    def _broken(metric: RequestMetric) -> None:
+        raise RuntimeError("broken hook")
+
+    api.add_request_hook(_broken)
+    api.add_request_hook(seen.append)
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.side_effect = [response(body={"items": [TAG]})]
+        assert Tag.get(api)[0].tag == TAG["_id"]
+        m.side_effect = [response(404)]
+        with pytest.raises(requests.exceptions.HTTPError):
+            Tag.get(api)
+    assert [metric.status for metric in seen] == [200, 404]
+    assert [record.exc_info[0] for record in caplog.records] == [RuntimeError, RuntimeError]
+
+
+def test_prometheus() -> None:
+    """Test the export in Prometheus' text exposition format."""
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    for duration, status in ((0.05, 200), (0.5, 200), (5.0, 500)):
+        registry(RequestMetric("GET", "raindrops/{id}", status, duration, 0, 10, 0, None, 100, 120))
+    text = registry.to_prometheus()
+    labels = 'method="GET",endpoint="raindrops/{id}"'
+    assert "# TYPE raindrop_request_duration_seconds histogram" in text
+    assert f'raindrop_request_duration_seconds_bucket{{{labels},le="0.1"}} 1\n' in text
+    assert f'raindrop_request_duration_seconds_bucket{{{labels},le="1.0"}} 2\n' in text
+    assert f'raindrop_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3\n' in text
+    assert f"raindrop_request_duration_seconds_count{{{labels}}} 3\n" in text
+    assert f"raindrop_response_bytes_total{{{labels}}} 30\n" in text
+    assert f'raindrop_responses_total{{{labels},status="500"}} 1\n' in text
+    assert "raindrop_ratelimit_remaining 100\n" in text
+    assert "raindrop_ratelimit_limit 120\n" in text
+
+
+def test_async() -> None:
+    """Test that the asyncio-based API is instrumented the same way."""
+
+    def handler(request):
+        return httpx.Response(200, json={"items": [TAG]})
+
+    api = AsyncAPI("dummy")
+    api.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    seen: list[RequestMetric] = []
+    api.add_request_hook(seen.append)
+    asyncio.run(Tag.get_async(api))
+    assert [(metric.method, metric.endpoint, metric.status) for metric in seen] == [("GET", "tags", 200)]
+    assert seen[0].response_bytes > 0
@@ -0,0 +1,117 @@
+"""Test the local SQLite Mirror and its incremental synchronisation against a fake Raindrop account."""
+from unittest.mock import Mock
+
+from raindropiopy import CollectionRef, Mirror
+from tests.api.test_models_collection import COLLECTION, SUB_COLLECTION
+from tests.api.test_models_raindrop import raindrop
+
+USER = {
+    "_id": 1,
+    "email": "someone@example.com",
+    "email_MD5": "md5",
+    "fullName": "Some One",
+    "password": True,
+    "pro": True,
+    "registered": "2022-01-01T00:00:00.000Z",
+    "config": {},
+    "groups": [],
+    "files": {"used": 0, "size": 10000000, "lastCheckPoint": "2022-01-01T00:00:00.000Z"},
+}
+
+
+class _Account:
+    """Fake Raindrop account answering the handful of GET requests a sync makes."""
+
+    def __init__(self, count: int) -> None:
+        self.raindrops = {id_: self._raindrop(id_, minute=id_ % 60) for id_ in range(1, count + 1)}
+        self.trash: dict[int, dict] = {}
+        self.meta = {"changedBookmarksDate": "2023-01-01T00:00:00.000Z"}
+        self.requests: list[tuple[str, dict | None]] = []
+
+    @staticmethod
+    def _raindrop(id_: int, minute: int = 0, collection: int = 1000) -> dict:
+        last_update = f"2023-01-01T00:{minute:02d}:00.000Z"
+        return raindrop | {"_id": id_, "lastUpdate": last_update, "collection": {"$id": collection}}
+
+    def get(self, url: str, params: dict | None = None) -> Mock:
+        path = url.split("/rest/v1/")[1]
+        self.requests.append((path, params))
+        if path == "user/stats":
+            items = [{"_id": 0, "count": len(self.raindrops)}, {"_id": -99, "count": len(self.trash)}]
+            body = {"meta": self.meta, "items": items}
+        elif path == "collections":
+            body = {"items": [COLLECTION]}
+        elif path == "collections/childrens":
+            body = {"items": [SUB_COLLECTION]}
+        elif path == "tags":
+            body = {"items": [{"_id": "abc", "count": len(self.raindrops)}]}
+        elif path == "user":
+            body = {"user": USER}
+        else:
+            scope = self.trash if path == "raindrops/-99" else self.raindrops
+            items = list(scope.values())
+            if params.get("sort") == "-lastUpdate":
+                items.sort(key=lambda item: item["lastUpdate"], reverse=True)
+            start = params["page"] * params["perpage"]
+            body = {"count": len(items), "items": items[start : start + params["perpage"]]}
+        return Mock(json=Mock(return_value=body))
+
+    def raindrop_requests(self) -> list[tuple[str, dict]]:
+        return [(path, params) for path, params in self.requests if path.startswith("raindrops/")]
+
+
+def test_full_then_skipped(tmp_path) -> None:
+    """Test that the first sync pulls everything and an unchanged account is not paged through again."""
+    account = _Account(count=120)
+    with Mirror(tmp_path / "mirror.db") as mirror:
+        result = mirror.sync(account)
+        assert (result.skipped, result.full, result.raindrops) == (False, True, 120)
+        assert len(list(mirror.raindrops())) == 120
+        assert mirror.get(7).id == 7
+        assert [collection.id for collection in mirror.collections()] == [1000, 1001]
+        assert [tag.tag for tag in mirror.tags()] == ["abc"]
+        assert mirror.user().email == "someone@example.com"
+        assert [count.id for count in mirror.counts()] == [0, -99]
+        assert mirror.last_sync is not None
+        assert [found.id for found in mirror.search("#abc created:2020-01")] == list(range(1, 121))
+        assert list(mirror.search("-#abc")) == []
+
+        account.requests.clear()
+        assert mirror.sync(account).skipped
+        assert [path for path, _ in account.requests] == ["user/stats"]
+
+
+def test_incremental(tmp_path) -> None:
+    """Test that only Raindrops changed since the last sync are requested and written."""
+    account = _Account(count=120)
+    with Mirror(tmp_path / "mirror.db") as mirror:
+        mirror.sync(account)
+
+        account.raindrops[3] = account._raindrop(3, minute=59) | {"title": "changed"}
+        account.raindrops[121] = account._raindrop(121, minute=59)
+        account.meta = {"changedBookmarksDate": "2023-01-02T00:00:00.000Z"}
+        account.requests.clear()
+
+        result = mirror.sync(account)
+        assert (result.skipped, result.full) == (False, False)
+        # Both changed raindrops (plus the unchanged one sharing the watermark) are on the first page, no more:
+        assert [params["page"] for _, params in account.raindrop_requests()] == [0, 0]
+        assert mirror.get(3).title == "changed"
+        assert mirror.get(121) is not None
+        assert len(list(mirror.raindrops())) == 121
+
+
+def test_deleted_triggers_repull(tmp_path) -> None:
+    """Test that Raindrops deleted on the server (invisible to a search) are reconciled through the counts."""
+    account = _Account(count=10)
+    with Mirror(tmp_path / "mirror.db") as mirror:
+        mirror.sync(account)
+
+        account.trash[5] = account._raindrop(5, minute=59, collection=-99)
+        del account.raindrops[5]
+        del account.raindrops[6]  # ie. permanently, never in the Trash
+        account.meta = {"changedBookmarksDate": "2023-01-02T00:00:00.000Z"}
+
+        mirror.sync(account)
+        assert sorted(raindrop.id for raindrop in mirror.raindrops()) == [1, 2, 3, 4, 7, 8, 9, 10]
+        assert [raindrop.id for raindrop in mirror.raindrops(CollectionRef.Trash)] == [5]
@@ -1,11 +1,17 @@
 """Test out the API using a patched requests module."""
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+import requests
 from requests import Response
 
-from raindropiopy import API
+from raindropiopy import API, RateLimiter, RetryPolicy
+from tests.api.conftest import response
 
 
 def test_refresh() -> None:
@@ -34,3 +40,211 @@ def test_refresh() -> None:
 
         assert isinstance(api.token, dict)
         assert api.token["access_token"] == "updated"
+
+
+def test_rate_limiter_unknown_limit() -> None:
+    """Test that we don't pace anything until we've heard about Raindrop's rate limit."""
+    limiter = RateLimiter()
+    assert all(limiter.reserve() == 0 for _ in range(100))
+    assert limiter.budget.rate is None
+
+
+def test_rate_limiter_spreads_remaining_budget() -> None:
+    """Test that the remaining budget is spread over the remaining window after a small burst."""
+    limiter = RateLimiter(burst=5)
+    limiter.update(limit=120, remaining=10, reset=int(time.time()) + 5)
+
+    budget = limiter.budget
+    assert budget.limit == 120 and budget.remaining == 10
+    assert 2.0 <= budget.rate <= 2.6  # ie. 10 requests over the (nearly) 5 seconds left.
+
+    waits = [limiter.reserve() for _ in range(7)]
+    assert waits[:5] == [0.0] * 5  # Burst..
+    assert 0.3 < waits[5] < waits[6] < 1.1  # ..then paced.
+
+
+def test_rate_limiter_exhausted() -> None:
+    """Test that once the budget is exhausted, nothing is sent until the window resets."""
+    limiter = RateLimiter()
+    limiter.update(limit=120, remaining=0, reset=int(time.time()) + 30)
+    assert limiter.reserve() >= 28
+
+
+def test_rate_limiter_recovered() -> None:
+    """Test that once budget is reported again, we no longer wait for the window we were told to wait for."""
+    limiter = RateLimiter()
+    limiter.update(limit=120, remaining=0, reset=int(time.time()) + 30)
+    limiter.update(limit=120, remaining=100, reset=int(time.time()) + 60)
+    assert limiter.reserve() < 1  # ie. paced for the new budget, rather than waiting ~30s.
+
+
+def test_rate_limit_headers_paced() -> None:
+    """Test that responses update our budget and that requests are paced when requested."""
+    api = API("dummy", pace_requests=True)
+    with patch("requests.Session.request") as m, patch("raindropiopy.api.time.sleep") as sleep:
+        m.return_value = response(
+            headers={
+                "X-RateLimit-Limit": "120",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + 30),
+            },
+        )
+
+        api.get("https://localhost")
+        assert api.rate_limit_budget.remaining == 0
+        assert not sleep.called
+
+        api.get("https://localhost")
+        assert sleep.call_args[0][0] >= 28
+
+
+def test_retry_transient_server_error() -> None:
+    """Test that idempotent requests are retried on 5xx's but non-idempotent ones aren't."""
+    api = API("dummy")
+    with patch("requests.Session.request") as m, patch("raindropiopy.api.time.sleep") as sleep:
+        m.side_effect = [response(502), response(503), response(200)]
+        assert api.get("https://localhost").status_code == 200
+        assert m.call_count == 3
+        assert all(0 <= call[0][0] <= 1.0 for call in sleep.call_args_list)  # ie. 0.5 * 2**attempt, jittered.
+
+        m.reset_mock()
+        m.side_effect = [response(502), response(200)]
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.post("https://localhost", json={})
+        assert m.call_count == 1
+
+
+def test_retry_too_many_requests() -> None:
+    """Test that 429's are retried for any verb, honouring Retry-After or X-RateLimit-Reset."""
+    api = API("dummy")
+    with patch("requests.Session.request") as m, patch("raindropiopy.api.time.sleep") as sleep:
+        m.side_effect = [response(429, headers={"Retry-After": "3"}), response(200)]
+        api.post("https://localhost", json={})
+        assert 3 <= sleep.call_args[0][0] <= 3.5
+
+        m.side_effect = [response(429, headers={"X-RateLimit-Reset": str(int(time.time()) + 10)}), response(200)]
+        api.post("https://localhost", json={})
+        assert 8 <= sleep.call_args[0][0] <= 10.5
+
+
+def test_retry_gives_up() -> None:
+    """Test that we stop after max_attempts or when retrying would take longer than max_elapsed."""
+    api = API("dummy", retry=RetryPolicy(max_attempts=3))
+    with patch("requests.Session.request") as m, patch("raindropiopy.api.time.sleep"):
+        m.side_effect = [response(500)] * 5
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.get("https://localhost")
+        assert m.call_count == 3
+
+    api = API("dummy", retry=RetryPolicy(max_elapsed=60))
+    with patch("requests.Session.request") as m, patch("raindropiopy.api.time.sleep"):
+        m.side_effect = [response(429, headers={"Retry-After": "300"}), response(200)]
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.get("https://localhost")
+        assert m.call_count == 1
+
+
+def test_retry_connection_error_and_disabled() -> None:
+    """Test that connection errors are retried (if idempotent) and that retrying can be turned off."""
+    api = API("dummy")
+    with patch("requests.Session.request") as m, patch("raindropiopy.api.time.sleep"):
+        m.side_effect = [requests.exceptions.ConnectionError(), response(200)]
+        assert api.delete("https://localhost").status_code == 200
+
+    api = API("dummy", retry=None)
+    with patch("requests.Session.request") as m:
+        m.side_effect = [response(503), response(200)]
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.get("https://localhost")
+
+
+def test_retry_put_file() -> None:
+    """Test that file uploads are only retried on 429's, rewinding the file before sending it again."""
+    api = API("dummy")
+    path_ = Path(__file__)
+    with patch("requests.Session.request") as m, patch("raindropiopy.api.time.sleep"):
+        m.side_effect = [response(502), response(200)]
+        with open(path_, "rb") as fh_, pytest.raises(requests.exceptions.HTTPError):
+            api.put_file("https://localhost", path_, {}, {"file": (path_.name, fh_, "text/plain")})
+
+        m.side_effect = [response(429), response(200)]
+        with open(path_, "rb") as fh_:
+            fh_.read()
+            api.put_file("https://localhost", path_, {}, {"file": (path_.name, fh_, "text/plain")})
+            assert fh_.tell() == 0
+
+
+def test_coalesce_requests() -> None:
+    """Test that identical GETs in flight at the same time are sent once, all callers sharing the response."""
+    api = API("dummy", coalesce_requests=True)
+    release = threading.Event()
+
+    def _request(*args, **kwargs):
+        release.wait(5)
+        return response(200)
+
+    with patch("requests.Session.request", side_effect=_request) as m:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            same = [executor.submit(api.get, "https://localhost/user", {"a": 1}) for _ in range(6)]
+            other = executor.submit(api.get, "https://localhost/user", {"a": 2})
+            time.sleep(0.1)  # ie. all requests are in flight.
+            release.set()
+            responses = {id(future.result()) for future in same}
+            other.result()
+        assert len(responses) == 1
+        assert m.call_count == 2
+
+        m.reset_mock()
+        api.get("https://localhost/user", {"a": 1})  # ie. nothing's in flight anymore.
+        assert m.call_count == 1
+
+
+def test_thread_sessions() -> None:
+    """Test that each thread gets its own session, all sharing the API's connection pool (closed with the API)."""
+    api = API("dummy", pool_maxsize=32, pool_block=True)
+    barrier = threading.Barrier(4)
+
+    def _session(_):
+        barrier.wait(5)  # ie. all workers are alive at the same time (and are distinct threads).
+        api.get("https://localhost")
+        return api.session
+
+    with patch("requests.Session.request", return_value=response(200)):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = list(executor.map(_session, range(4)))
+    assert len({id(session) for session in sessions}) == 4
+    adapters = {id(session.get_adapter("https://api.raindrop.io")) for session in sessions}
+    assert len(adapters) == 1
+    adapter = sessions[0].get_adapter("https://api.raindrop.io")
+    assert adapter._pool_maxsize == 32 and adapter._pool_block
+
+    with patch.object(type(adapter), "close") as close:
+        api.close()
+    assert close.called
+    assert api.session is None
+
+
+def test_thread_sessions_refresh_once() -> None:
+    """Test that an expired token is refreshed once on behalf of all threads, each then sending the new token."""
+    api = API({"access_token": "expired", "refresh_token": "rotated", "expires_at": time.time() - 1})
+    barrier = threading.Barrier(4)
+    refreshes, sent = [], []
+
+    def _request(method, url, headers=None, data=None, **kwargs):
+        if url == "https://raindrop.io/oauth/access_token":
+            refreshes.append(data)
+            time.sleep(0.05)  # ie. the other threads find the token expired too, meanwhile.
+            return response(body={"access_token": "fresh", "refresh_token": "new", "expires_in": 3600})
+        sent.append(headers["Authorization"])
+        return response(200)
+
+    def _get(_):
+        barrier.wait(5)
+        api.get("https://localhost")
+
+    with patch("requests.Session.request", side_effect=_request):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_get, range(4)))
+    assert refreshes == [{"grant_type": "refresh_token", "refresh_token": "rotated"}]
+    assert sent == ["Bearer fresh"] * 4
+    assert api.token["refresh_token"] == "new"
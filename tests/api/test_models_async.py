@@ -0,0 +1,171 @@
+"""Test the asyncio-based AsyncAPI and the awaitable variants of the Core Classes using a mock transport."""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from raindropiopy import AsyncAPI, Collection, Raindrop, RaindropSort, Tag, User
+from tests.api.test_models_collection import COLLECTION, SUB_COLLECTION
+from tests.api.test_models_raindrop import raindrop
+from tests.api.test_models_user import test_user
+
+
+def _api(handler) -> AsyncAPI:
+    """Return an AsyncAPI instance whose requests are answered by the handler provided."""
+    api = AsyncAPI("dummy")
+    api.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return api
+
+
+def test_rate_limit_headers() -> None:
+    """Test that we track the same rate-limit headers as the blocking API."""
+
+    def handler(request):
+        headers = {"X-RateLimit-Limit": "120", "X-RateLimit-Remaining": "119", "X-RateLimit-Reset": "1700000000"}
+        return httpx.Response(200, headers=headers, json={"items": []})
+
+    api = _api(handler)
+    asyncio.run(Tag.get_async(api))
+    assert api.ratelimit == 120
+    assert api.ratelimit_remaining == 119
+    assert api.ratelimit_reset == 1700000000
+
+
+def test_http_error() -> None:
+    """Test that HTTP error codes are raised."""
+    api = _api(lambda request: httpx.Response(404, json={}))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(Raindrop.get_async(api, 2000))
+
+
+def test_get_user() -> None:
+    """Test that we can get the user (as in the AsyncAPI example)."""
+    user = asyncio.run(User.get_async(_api(lambda request: httpx.Response(200, json={"user": test_user}))))
+    assert user.id == 1000
+
+
+def test_open_while_open() -> None:
+    """Test that an open connection isn't silently replaced (ie. leaking its connections) by another."""
+
+    async def _run(api):
+        async with api:
+            with pytest.raises(RuntimeError):
+                api.open()
+        api.open()  # ie. once closed, a new connection can be opened.
+        await api.close()
+
+    asyncio.run(_run(AsyncAPI("dummy")))
+
+
+def test_get_collections() -> None:
+    """Test that we get both root and child collections."""
+
+    def handler(request):
+        if request.url.path.endswith("childrens"):
+            return httpx.Response(200, json={"items": [SUB_COLLECTION]})
+        return httpx.Response(200, json={"items": [COLLECTION]})
+
+    collections = asyncio.run(Collection.get_collections_async(_api(handler)))
+    assert [collection.id for collection in collections] == [1000, 1001]
+    assert collections[1].parent == 1000
+
+
+def test_create_link_and_update() -> None:
+    """Test that we send the same request bodies as the blocking versions."""
+    sent = []
+
+    def handler(request):
+        sent.append((request.method, request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json={"item": raindrop})
+
+    async def _run(api):
+        created = await Raindrop.create_link_async(api, "https://example.com", collection=1000, tags=["abc"])
+        updated = await Raindrop.update_async(api, created.id, collection=1001, title="title")
+        return created, updated
+
+    created, updated = asyncio.run(_run(_api(handler)))
+    assert created.id == updated.id == 2000
+    assert sent[0] == (
+        "POST",
+        "/rest/v1/raindrop",
+        {"type": "link", "link": "https://example.com", "tags": ["abc"], "collection": {"$id": 1000}},
+    )
+    assert sent[1] == ("PUT", "/rest/v1/raindrop/2000", {"title": "title", "collection": 1001})
+
+
+def test_search() -> None:
+    """Test that we page through search results until an empty page is returned."""
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json={"items": [raindrop] if page < 2 else []})
+
+    found = asyncio.run(Raindrop.search_async(_api(handler)))
+    assert len(found) == 2
+
+
+def test_search_sorted_fields() -> None:
+    """Test that a search can be sorted and projected, on every page."""
+    sorts = []
+
+    def handler(request):
+        sorts.append(request.url.params["sort"])
+        page = int(request.url.params["page"])
+        ids = range(page * 50, min((page + 1) * 50, 60))
+        return httpx.Response(200, json={"count": 60, "items": [raindrop | {"_id": id_} for id_ in ids]})
+
+    found = asyncio.run(
+        Raindrop.search_async(_api(handler), sort=RaindropSort.last_update_dn, fields=["id", "link"], concurrency=2),
+    )
+    assert sorts == ["-lastUpdate"] * 2
+    assert [item.id for item in found] == list(range(60))
+    assert str(found[0].link) == raindrop["link"] and found[0].title is None
+
+    with pytest.raises(ValueError):
+        asyncio.run(Raindrop.search_async(_api(handler), fields=["url"]))
+    assert len(sorts) == 2  # ie. nothing requested
+
+
+def test_many_concurrent_requests() -> None:
+    """Test that a single AsyncAPI can drive many concurrent requests."""
+
+    def handler(request):
+        return httpx.Response(200, json={"item": raindrop})
+
+    async def _run(api):
+        async with api:
+            return await asyncio.gather(*[Raindrop.get_async(api, 2000) for _ in range(200)])
+
+    assert len(asyncio.run(_run(_api(handler)))) == 200
+
+
+def test_search_concurrent() -> None:
+    """Test that a concurrent search uses the count and keeps the results in page order."""
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        ids = range(page * 50, min((page + 1) * 50, 120))
+        return httpx.Response(200, json={"count": 120, "items": [raindrop | {"_id": id_} for id_ in ids]})
+
+    found = asyncio.run(Raindrop.search_async(_api(handler), concurrency=4))
+    assert [item.id for item in found] == list(range(120))
+
+
+def test_coalesce_requests() -> None:
+    """Test that identical GETs from several tasks at the same time are sent once."""
+    requests_sent = []
+
+    async def handler(request):
+        requests_sent.append(request.url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"items": [{"_id": "abc", "count": 1}]})
+
+    async def _main(api):
+        return await asyncio.gather(*[Tag.get_async(api) for _ in range(5)])
+
+    api = _api(handler)
+    api.coalesce_requests = True
+    found = asyncio.run(_main(api))
+    assert found == [[Tag(**{"_id": "abc", "count": 1})]] * 5
+    assert len(requests_sent) == 1
@@ -5,7 +5,7 @@ from unittest.mock import patch, Mock
 
 import pytest
 
-from raindropiopy import AccessLevel, Collection, SystemCollection, View
+from raindropiopy import AccessLevel, Collection, CollectionTree, SystemCollection, View
 
 COLLECTION = {
     "_id": 1000,
@@ -260,3 +260,60 @@ def tst_create(mock_api) -> None:
 
         # Confirm
         assert c.id == 1000
+
+
+def _tree() -> CollectionTree:
+    """Return a small tree: aCollectionTitle -> [aSubCollectionTitle -> [Leaf], Other] and a 2nd root "Python"."""
+    return CollectionTree(
+        [
+            Collection(**COLLECTION),
+            Collection(**SUB_COLLECTION),
+            Collection(**(SUB_COLLECTION | {"_id": 1002, "title": "Other", "sort": 4000})),
+            Collection(**(SUB_COLLECTION | {"_id": 1003, "title": "Leaf", "parent": {"$id": 1001}})),
+            Collection(**(COLLECTION | {"_id": 2000, "title": "Python", "sort": 1})),
+        ],
+    )
+
+
+def test_collection_tree_lookups() -> None:
+    """Test that we can look collections up by id, title and path."""
+    tree = _tree()
+    assert len(tree) == 5
+    assert tree[1001].title == "aSubCollectionTitle"
+    assert tree.by_id(9999) is None and 9999 not in tree
+    assert tree.by_title("ASUBCOLLECTIONTITLE").id == 1001
+    assert [collection.id for collection in tree.titled("leaf")] == [1003]
+    assert tree.by_path("acollectiontitle/asubcollectiontitle/LEAF").id == 1003
+    assert tree.by_path("aCollectionTitle/Leaf") is None
+    assert tree.path(1003) == "aCollectionTitle/aSubCollectionTitle/Leaf"
+
+
+def test_collection_tree_navigation() -> None:
+    """Test that we can navigate the tree, in sort order."""
+    tree = _tree()
+    assert [collection.id for collection in tree.roots] == [2000, 1000]
+    assert [collection.id for collection in tree.children(1000)] == [1001, 1002]
+    assert [collection.id for collection in tree.ancestors(1003)] == [1001, 1000]
+    assert [collection.id for collection in tree.subtree(1000)] == [1000, 1001, 1003, 1002]
+    assert [collection.id for collection in tree] == [2000, 1000, 1001, 1003, 1002]
+
+
+def test_collection_tree_get_or_create(mock_api) -> None:
+    """Test that get_or_create uses the tree instead of querying Raindrop."""
+    tree = _tree()
+    with patch("requests_oauthlib.OAuth2Session.request") as patched_request:
+        assert Collection.get_or_create(mock_api, "python", tree=tree).id == 2000
+        assert not patched_request.called
+
+        patched_request.return_value.json.return_value = {"item": COLLECTION | {"_id": 3000, "title": "New"}}
+        assert Collection.get_or_create(mock_api, "New", tree=tree).id == 3000
+        assert patched_request.call_count == 1
+        assert tree.by_path("new").id == 3000
+
+        # Only root collections match, by title alone (ie. a "/" isn't a path separator).
+        patched_request.return_value.json.return_value = {"item": COLLECTION | {"_id": 3001, "title": "Leaf"}}
+        assert Collection.get_or_create(mock_api, "Leaf", tree=tree).id == 3001
+        title = "aCollectionTitle/aSubCollectionTitle"
+        patched_request.return_value.json.return_value = {"item": COLLECTION | {"_id": 3002, "title": title}}
+        assert Collection.get_or_create(mock_api, title, tree=tree).id == 3002
+        assert patched_request.call_count == 3
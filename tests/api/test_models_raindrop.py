@@ -1,7 +1,13 @@
 """Test all the core methods of the Raindrop API."""
 import datetime
+import json
+import time
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from pydantic import ValidationError
 
 from raindropiopy import API, Raindrop, RaindropType, CollectionRef
 
@@ -135,3 +141,236 @@ def test_delete() -> None:
             "DELETE",
             "https://api.raindrop.io/rest/v1/raindrop/2000",
         )
+
+
+def _paged_responses(count: int, perpage: int = 50):
+    """Return a side-effect function answering search requests with pages of Raindrops (with unique ids)."""
+
+    def _request(method, url, params=None, **kwargs):
+        page = params["page"]
+        ids = range(page * perpage, min((page + 1) * perpage, count))
+        resp = Mock(headers={})
+        resp.json.return_value = {"count": count, "items": [raindrop | {"_id": id_} for id_ in ids]}
+        return resp
+
+    return _request
+
+
+def test_search_uses_count() -> None:
+    """Test that we stop paging based on the count returned, ie. without requesting an empty page."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.side_effect = _paged_responses(120)
+        found = Raindrop.search(api)
+        assert [item.id for item in found] == list(range(120))
+        assert [call[1]["params"]["page"] for call in m.call_args_list] == [0, 1, 2]
+
+
+def test_search_concurrent() -> None:
+    """Test that a concurrent search returns the same Raindrops, in the same order, as a sequential one."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.side_effect = _paged_responses(1234)
+        found = Raindrop.search(api, concurrency=8)
+        assert [item.id for item in found] == list(range(1234))
+        assert sorted(call[1]["params"]["page"] for call in m.call_args_list) == list(range(25))
+
+
+def test_search_without_count() -> None:
+    """Test that we fall back to paging until an empty page if Raindrop doesn't provide a count."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value.json.side_effect = [{"items": [raindrop]}, {"items": [raindrop]}, {"items": []}]
+        assert len(Raindrop.search(api, concurrency=8)) == 2
+
+
+def test_search_fields() -> None:
+    """Test that a projected search only decodes and keeps the fields requested."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.side_effect = _paged_responses(60)
+        found = Raindrop.search(api, fields=["id", "link", "last_update"])
+        assert [item.id for item in found] == list(range(60))
+        assert str(found[0].link) == raindrop["link"]
+        assert found[0].last_update == datetime.datetime(2020, 1, 1, 1, 1, 1, tzinfo=datetime.UTC)
+        assert found[0].title is None
+        assert found[0].other == {}
+
+        found = Raindrop.search(api, fields=["title", "other"])
+        assert found[0].title == "title"
+        assert found[0].other == {"creatorRef": 3000, "pleaseParse": {"weight": 1}, "sort": 3333333}
+
+        m.reset_mock()
+        with pytest.raises(ValueError):
+            Raindrop.search(api, fields=["id", "url"])
+        m.assert_not_called()
+
+
+def test_iter_search() -> None:
+    """Test that we can stream search results, with and without prefetching the next page."""
+    api = API("dummy")
+    for prefetch in (True, False):
+        with patch("raindropiopy.api.OAuth2Session.request") as m:
+            m.side_effect = _paged_responses(120)
+            found = Raindrop.iter_search(api, prefetch=prefetch)
+            assert next(found).id == 0
+            assert [item.id for item in found] == list(range(1, 120))
+            assert [call[1]["params"]["page"] for call in m.call_args_list] == [0, 1, 2]
+
+
+def test_iter_search_prefetch() -> None:
+    """Test that the next page is requested while the current one is still being consumed."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.side_effect = _paged_responses(120)
+        found = Raindrop.iter_search(api)
+        next(found)  # ie. we're only on the first item of the first page..
+        for _ in range(100):  # ..give the background thread a chance to run..
+            if m.call_count == 2:
+                break
+            time.sleep(0.01)
+        assert m.call_count == 2  # ..and the second page has been requested.
+        found.close()
+
+
+def test_iter_search_no_prefetch() -> None:
+    """Test that without prefetching, the next page isn't requested until the current one has been consumed."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.side_effect = _paged_responses(120)
+        found = Raindrop.iter_search(api, prefetch=False)
+        for _ in range(50):
+            next(found)
+        assert m.call_count == 1
+        next(found)
+        assert m.call_count == 2
+
+
+def _echo_created(method, url, data=None, **kwargs):
+    """Side-effect function answering (bulk) create requests by echoing the links sent back as new Raindrops."""
+    body = json.loads(data)
+    resp = Mock(headers={}, status_code=200)
+    if url.endswith("raindrops"):
+        resp.json.return_value = {"items": [raindrop | {"link": item["link"]} for item in body["items"]]}
+    else:
+        resp.json.return_value = {"item": raindrop | {"link": body["link"]}}
+    return resp
+
+
+def test_create_many() -> None:
+    """Test that we create Raindrops in chunks, returning them in input order."""
+    api = API("dummy")
+    links = [f"https://example.com/{i}" for i in range(250)]
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.side_effect = _echo_created
+        result = Raindrop.create_many(api, links[:200] + [{"link": link, "tags": ["abc"]} for link in links[200:]])
+
+        assert [item.link for item in result.created] == links
+        assert result.failures == []
+        assert [len(json.loads(call[1]["data"])["items"]) for call in m.call_args_list] == [100, 100, 50]
+        assert json.loads(m.call_args[1]["data"])["items"][0] == {
+            "type": "link",
+            "link": links[200],
+            "tags": ["abc"],
+        }
+
+
+def test_create_many_failures() -> None:
+    """Test that invalid items and items rejected by Raindrop are reported individually."""
+    api = API("dummy")
+    rejected = Mock(status_code=400)
+
+    def _request(method, url, data=None, **kwargs):
+        if url.endswith("raindrops") or "bad" in json.loads(data)["link"]:
+            resp = Mock(headers={}, status_code=400)
+            resp.raise_for_status.side_effect = requests.exceptions.HTTPError(response=rejected)
+            return resp
+        return _echo_created(method, url, data)
+
+    items = ["https://example.com/0", {"title": "no link"}, "https://bad.example.com", "https://example.com/3"]
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.side_effect = _request
+        result = Raindrop.create_many(api, items, collection=1000)
+
+        assert [item.link for item in result.created] == ["https://example.com/0", "https://example.com/3"]
+        assert [(failure.index, type(failure.error)) for failure in result.failures] == [
+            (1, ValueError),
+            (2, requests.exceptions.HTTPError),
+        ]
+        assert json.loads(m.call_args[1]["data"])["collection"] == {"$id": 1000}
+
+
+def test_create_many_invalid_returned() -> None:
+    """Test that a Raindrop returned that fails validation is a failure of its item, not of the whole batch."""
+    api = API("dummy")
+    rejected = Mock(status_code=400)
+
+    def _request(method, url, data=None, **kwargs):
+        resp = _echo_created(method, url, data)
+        if url.endswith("raindrops"):
+            if any("invalid" in item["link"] for item in json.loads(data)["items"]):
+                resp.raise_for_status.side_effect = requests.exceptions.HTTPError(response=rejected)
+            else:
+                resp.json.return_value["items"][0]["_id"] = "not an id"
+        elif "invalid" in json.loads(data)["link"]:
+            resp.json.return_value["item"]["_id"] = "not an id"
+        return resp
+
+    items = ["https://example.com/0", "https://example.com/1", "https://example.com/2"]
+    items += ["https://example.com/3", "https://invalid.example.com", "https://example.com/5"]
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.side_effect = _request
+        result = Raindrop.create_many(api, items, chunk_size=3)
+
+        assert [item.link for item in result.created] == [items[1], items[2], items[3], items[5]]
+        assert [(failure.index, failure.item, type(failure.error)) for failure in result.failures] == [
+            (0, items[0], ValidationError),
+            (4, items[4], ValidationError),
+        ]
+
+
+def test_update_many() -> None:
+    """Test that we can update (and move) many Raindrops at once, chunking the ids provided."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value.json.return_value = {"result": True, "modified": 100}
+        modified = Raindrop.update_many(
+            api,
+            CollectionRef.Unsorted,
+            ids=list(range(150)),
+            tags=["abc"],
+            important=True,
+            move_to=1000,
+        )
+        assert modified == 200
+        assert m.call_count == 2
+        assert m.call_args[0] == ("PUT", "https://api.raindrop.io/rest/v1/raindrops/-1")
+        assert json.loads(m.call_args[1]["data"]) == {
+            "important": True,
+            "tags": ["abc"],
+            "collection": {"$id": 1000},
+            "ids": list(range(100, 150)),
+        }
+
+        m.reset_mock()
+        Raindrop.update_many(api, 1000, search="#abc", nested=True, tags=[])
+        assert m.call_args[0] == ("PUT", "https://api.raindrop.io/rest/v1/raindrops/1000")
+        assert m.call_args[1]["params"] == {"search": "#abc", "nested": "true"}
+        assert json.loads(m.call_args[1]["data"]) == {"tags": []}
+
+
+def test_delete_many() -> None:
+    """Test that we can delete many Raindrops at once, chunking the ids provided."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        m.return_value.json.side_effect = [{"result": True, "modified": 100}, {"result": True, "modified": 5}]
+        assert Raindrop.delete_many(api, 1000, ids=list(range(105))) == 105
+        assert m.call_args[0] == ("DELETE", "https://api.raindrop.io/rest/v1/raindrops/1000")
+        assert json.loads(m.call_args[1]["data"]) == {"ids": list(range(100, 105))}
+
+        m.reset_mock()
+        m.return_value.json.side_effect = [{"result": True, "modified": 42}]
+        assert Raindrop.delete_many(api, CollectionRef.Trash, search="#abc") == 42
+        assert m.call_count == 1
+        assert m.call_args[0] == ("DELETE", "https://api.raindrop.io/rest/v1/raindrops/-99")
+        assert m.call_args[1]["params"] == {"search": "#abc"}
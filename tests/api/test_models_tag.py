@@ -1,4 +1,5 @@
 """Test the Tag API."""
+import json
 from unittest.mock import patch
 
 from raindropiopy import API, Tag
@@ -19,3 +20,29 @@ def test_get() -> None:
         tag = tags[0]
         assert tag.tag == "a Sample Tag"
         assert tag.count == 1
+
+
+def test_delete() -> None:
+    """Test that we send the tags to be deleted, optionally limited to a collection."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        Tag.delete(api, ["abc", "def"])
+        assert m.call_args[0] == ("DELETE", "https://api.raindrop.io/rest/v1/tags")
+        assert json.loads(m.call_args[1]["data"]) == {"tags": ["abc", "def"]}
+
+        Tag.delete(api, ["abc"], collection_id=1000)
+        assert m.call_args[0] == ("DELETE", "https://api.raindrop.io/rest/v1/tags/1000")
+
+
+def test_rename_and_merge() -> None:
+    """Test that renaming and merging tags are single requests."""
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request") as m:
+        Tag.rename(api, "abc", "xyz")
+        assert m.call_args[0] == ("PUT", "https://api.raindrop.io/rest/v1/tags")
+        assert json.loads(m.call_args[1]["data"]) == {"replace": "xyz", "tags": ["abc"]}
+
+        Tag.merge(api, ["abc", "def"], "xyz", collection_id=1000)
+        assert m.call_count == 2
+        assert m.call_args[0] == ("PUT", "https://api.raindrop.io/rest/v1/tags/1000")
+        assert json.loads(m.call_args[1]["data"]) == {"replace": "xyz", "tags": ["abc", "def"]}
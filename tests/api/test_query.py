@@ -0,0 +1,79 @@
+"""Test the local evaluation of Raindrop search queries."""
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from raindropiopy import Query, Raindrop
+from raindropiopy.query import Term, parse
+from tests.api.test_models_raindrop import raindrop
+
+RAINDROPS = [
+    Raindrop(**raindrop | {"_id": 1, "title": "Python type hints", "tags": ["Python", "typing"], "important": True}),
+    Raindrop(**raindrop | {"_id": 2, "title": "Rust book", "tags": ["rust"], "domain": "doc.rust-lang.org"}),
+    Raindrop(**raindrop | {"_id": 3, "title": "Holiday photo", "tags": [], "type": "image"}),
+    Raindrop(**raindrop | {"_id": 4, "title": "Old news", "created": "2019-06-15T10:00:00Z", "domain": "example.org"}),
+    Raindrop(**raindrop | {"_id": 5, "title": "Year end", "created": "2019-12-31T23:30:00", "tags": ["news"]}),
+]
+
+
+@pytest.fixture
+def local_time_not_utc(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Run a test on a machine whose local time is behind UTC."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _ids(query: str) -> list[int]:
+    return [found.id for found in Query(query).filter(RAINDROPS)]
+
+
+def test_parse() -> None:
+    """Test that queries are split into terms, keeping urls as words."""
+    assert parse('-#"my tag" created:>=2023-01 "a phrase" https://example.com') == [
+        Term("#", "=", "my tag", True),
+        Term("created", ">=", "2023-01", False),
+        Term(None, "=", "a phrase", False),
+        Term(None, "=", "https://example.com", False),
+    ]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("", [1, 2, 3, 4, 5]),
+        ("python", [1]),
+        ('"type hints"', [1]),
+        ('"hints type"', []),
+        ("#python", [1]),
+        ("#pyth", []),
+        ("-#python", [2, 3, 4, 5]),
+        ("domain:rust-lang.org", [2]),
+        ("domain:example.com", [1, 3, 5]),
+        ("type:image", [3]),
+        ("important:true", [1]),
+        ("important:false -type:image", [2, 4, 5]),
+        ("notag:true", [3]),
+        ("created:2019", [4, 5]),
+        ("created:2019-12-31", [5]),  # ie. a naive timestamp is in UTC, not local time
+        ("created:>2019-06", [1, 2, 3, 5]),
+        ("created:<=2019-06-15", [4]),
+        ("created:<2019-06-15", []),
+        ("match:or #rust type:image", [2, 3]),
+        ("rust -book", []),
+    ],
+)
+@pytest.mark.usefixtures("local_time_not_utc")
+def test_query(query: str, expected: list[int]) -> None:
+    """Test each of the operators supported."""
+    assert _ids(query) == expected
+
+
+@pytest.mark.parametrize("query", ["type:banana", "created:>yesterday", "important:maybe", '""', 'python ""'])
+def test_invalid(query: str) -> None:
+    """Test that invalid operator values are reported when compiling."""
+    with pytest.raises(ValueError):
+        Query(query)
@@ -0,0 +1,163 @@
+"""Test streaming multipart uploads (and their use by Raindrop.create_file and Raindrop.create_files)."""
+import hashlib
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+from urllib3 import encode_multipart_formdata
+
+from raindropiopy import API, CollectionRef, MultipartUpload, Raindrop, UploadManifest, UploadProgress
+from raindropiopy.upload import file_sha256
+from tests.api.conftest import response
+from tests.api.test_models_raindrop import raindrop
+
+
+def test_body() -> None:
+    """Test that the body streamed is exactly that of a regular (in-memory) multipart encoding, a chunk at a time."""
+    path = Path(__file__)
+    upload = MultipartUpload(path, {"collectionId": "-1"}, content_type="text/plain", chunk_size=256)
+    expected, content_type = encode_multipart_formdata(
+        [("collectionId", "-1"), ("file", (path.name, path.read_bytes(), "text/plain"))],
+        boundary=upload.boundary,
+    )
+    chunks = list(upload)
+    assert b"".join(chunks) == expected
+    assert len(upload) == len(expected)
+    assert upload.content_type == content_type
+    assert max(len(chunk) for chunk in chunks[1:-1]) == 256
+    assert b"".join(upload) == expected  # ie. it can be sent again, eg. on a retry.
+
+
+def test_progress() -> None:
+    """Test that progress is reported as chunks are sent, up to the full size of the body."""
+    seen: list[UploadProgress] = []
+    upload = MultipartUpload(Path(__file__), chunk_size=1024, progress=seen.append)
+    for _ in upload:
+        pass
+    assert [progress.sent for progress in seen] == sorted(progress.sent for progress in seen)
+    assert seen[-1].sent == seen[-1].total == len(upload) == upload.sent
+    assert seen[-1].fraction == 1.0
+    assert upload.rate >= 0 and seen[-1].rate >= 0
+
+
+def test_create_file_streamed() -> None:
+    """Test that create_file streams the file (with its collection) when asked for progress."""
+    api = API("dummy")
+    seen: list[UploadProgress] = []
+    sent: list[bytes] = []
+
+    def _request(method, url, **kwargs):
+        sent.append(b"".join(kwargs["data"]))  # ie. as the connection would.
+        return response(body={"item": raindrop})
+
+    with patch("raindropiopy.api.OAuth2Session.request", side_effect=_request) as m:
+        item = Raindrop.create_file(api, Path(__file__), "text/plain", progress=seen.append, chunk_size=512)
+
+    assert item.id == 2000
+    assert m.call_args[0] == ("PUT", "https://api.raindrop.io/rest/v1/raindrop/file")
+    upload = m.call_args[1]["data"]
+    assert isinstance(upload, MultipartUpload) and "files" not in m.call_args[1]
+    assert m.call_args[1]["headers"]["Content-Type"] == upload.content_type
+    assert f'name="collectionId"\r\n\r\n{CollectionRef.Unsorted.id}\r\n'.encode() in sent[0]
+    assert Path(__file__).read_bytes() in sent[0]
+    assert seen[-1].sent == len(sent[0])
+
+
+def test_create_file_large() -> None:
+    """Test that large files are streamed even without a progress callback."""
+    api = API("dummy")
+    with (
+        patch("raindropiopy.models.STREAM_THRESHOLD", 16),
+        patch("raindropiopy.api.OAuth2Session.request", return_value=response(body={"item": raindrop})) as m,
+    ):
+        Raindrop.create_file(api, Path(__file__), "text/plain")
+    assert isinstance(m.call_args[1]["data"], MultipartUpload)
+
+
+def test_file_sha256(tmp_path) -> None:
+    """Test that files are hashed by content (empty ones included)."""
+    (tmp_path / "a").write_bytes(b"abc")
+    (tmp_path / "empty").write_bytes(b"")
+    assert file_sha256(tmp_path / "a") == hashlib.sha256(b"abc").hexdigest()
+    assert file_sha256(tmp_path / "empty") == hashlib.sha256(b"").hexdigest()
+
+
+def test_create_files(tmp_path) -> None:
+    """Test that files are uploaded in parallel once per content, with tags set in bulk and uploads recorded."""
+    paths = []
+    for name, content in (("a.pdf", b"a"), ("b.txt", b"b"), ("copy.pdf", b"a"), ("c.txt", b"c")):
+        paths.append(tmp_path / name)
+        paths[-1].write_bytes(content)
+    manifest = UploadManifest()
+    manifest.add(hashlib.sha256(b"c").hexdigest(), 1234, paths[3])
+    ids = iter(range(100, 200))
+    uploads: list[tuple[str, str]] = []
+
+    def _request(method, url, data=None, files=None, **kwargs):
+        resp = response(body={"item": raindrop})
+        if url.endswith("raindrop/file"):
+            name, _, content_type = files["file"]
+            uploads.append((name, content_type))
+            resp._content = json.dumps({"item": raindrop | {"_id": next(ids), "title": name}}).encode()
+        else:
+            resp._content = json.dumps({"result": True, "modified": 2}).encode()
+        return resp
+
+    api = API("dummy")
+    with patch("raindropiopy.api.OAuth2Session.request", side_effect=_request) as m:
+        result = Raindrop.create_files(api, [*paths, tmp_path / "missing"], tags=["archive"], manifest=manifest)
+
+    assert sorted(uploads) == [("a.pdf", "application/pdf"), ("b.txt", "text/plain")]
+    assert [item.title for item in result.created] == ["a.pdf", "b.txt"]
+    assert all(item.tags == ["archive"] for item in result.created)
+    assert result.skipped == {paths[2]: result.created[0].id, paths[3]: 1234}
+    assert [(failure.index, type(failure.error)) for failure in result.failures] == [(4, FileNotFoundError)]
+
+    assert m.call_args[0] == ("PUT", "https://api.raindrop.io/rest/v1/raindrops/0")
+    update = json.loads(m.call_args[1]["data"])
+    assert update["tags"] == ["archive"] and sorted(update["ids"]) == sorted(item.id for item in result.created)
+    assert len(manifest) == 3 and manifest.get(hashlib.sha256(b"a").hexdigest()) == result.created[0].id
+
+    # Running again uploads nothing (nor tags anything) as everything is in the manifest.
+    with patch("raindropiopy.api.OAuth2Session.request", side_effect=_request) as m:
+        result = Raindrop.create_files(api, paths, tags=["archive"], manifest=manifest, concurrency=2)
+    assert m.call_count == 0 and result.created == [] and len(result.skipped) == 4
+
+
+def test_create_files_failures(tmp_path) -> None:
+    """Test that errors fail only their own file, and that files aren't recorded until their tags are set."""
+    paths = []
+    for name in ("a.txt", "b.txt", "bad.txt"):
+        paths.append(tmp_path / name)
+        paths[-1].write_text(name)
+    manifest = UploadManifest()
+    ids = iter(range(100, 200))
+
+    def _request(method, url, data=None, files=None, **kwargs):
+        resp = response(body={"item": raindrop})
+        if url.endswith("raindrop/file"):
+            name = files["file"][0]
+            item = {} if name == "bad.txt" else {"item": raindrop | {"_id": next(ids), "title": name}}
+            resp._content = json.dumps(item).encode()  # ie. the bad file gets a response without an item.
+        else:
+            resp.status_code = 500
+        return resp
+
+    api = API("dummy", retry=None)
+    with patch("raindropiopy.api.OAuth2Session.request", side_effect=_request):
+        result = Raindrop.create_files(api, paths, tags=["archive"], manifest=manifest)
+    assert result.created == []
+    assert [(failure.index, type(failure.error)) for failure in result.failures] == [
+        (0, requests.exceptions.HTTPError),
+        (1, requests.exceptions.HTTPError),
+        (2, KeyError),
+    ]
+    assert len(manifest) == 0  # ie. running again uploads (and tags) them again.
+
+    # Without tags, each file is recorded as it's uploaded.
+    with patch("raindropiopy.api.OAuth2Session.request", side_effect=_request):
+        result = Raindrop.create_files(api, paths, manifest=manifest)
+    assert [item.title for item in result.created] == ["a.txt", "b.txt"]
+    assert [failure.index for failure in result.failures] == [2]
+    assert len(manifest) == 2